@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Collections.Specialized;
 using Newtonsoft.Json;
 using UnityEditor;
 using UnityEngine;
@@ -8,13 +9,97 @@ namespace SceneAPI
 {
     public static class ComponentUtilities
     {
+        public const int DefaultMaxArrayElements = 100;
+
+        // Which components and properties GET /objects/components reads; by default every component and every top-level property
+        public class ComponentSelection
+        {
+            public HashSet<string> ComponentTypes;
+            public string[] PropertyPaths;
+            public int Depth;
+            public int MaxArrayElements = DefaultMaxArrayElements;
+
+            public bool Includes(Component component)
+            {
+                return ComponentTypes == null || ComponentTypes.Contains(component.GetType().Name);
+            }
+
+            // Query: components=Transform,Animator, properties=m_LocalPosition,m_Materials.Array.data[0], depth=2, max_array=10
+            public static ComponentSelection Parse(NameValueCollection query, out string error)
+            {
+                error = null;
+                var selection = new ComponentSelection();
+
+                string[] types = SplitList(query?["components"]);
+                if (types != null)
+                {
+                    selection.ComponentTypes = new HashSet<string>(types);
+                }
+                selection.PropertyPaths = SplitList(query?["properties"]);
+
+                string depth = query?["depth"];
+                if (!string.IsNullOrEmpty(depth))
+                {
+                    if (!int.TryParse(depth, out selection.Depth) || selection.Depth < 0)
+                    {
+                        error = "depth must be a non-negative integer";
+                        return selection;
+                    }
+                }
+
+                string maxArray = query?["max_array"];
+                if (!string.IsNullOrEmpty(maxArray))
+                {
+                    if (!int.TryParse(maxArray, out selection.MaxArrayElements) || selection.MaxArrayElements < 0)
+                    {
+                        error = "max_array must be a non-negative integer";
+                    }
+                }
+
+                return selection;
+            }
+
+            private static string[] SplitList(string value)
+            {
+                if (string.IsNullOrEmpty(value)) return null;
+                var items = new List<string>();
+                foreach (string part in value.Split(','))
+                {
+                    if (part.Trim().Length > 0) items.Add(part.Trim());
+                }
+                return items.Count > 0 ? items.ToArray() : null;
+            }
+        }
+
         public static object GetComponentProperties(Component component)
+        {
+            return GetComponentProperties(component, null);
+        }
+
+        public static object GetComponentProperties(Component component, ComponentSelection selection)
         {
             var properties = new Dictionary<string, object>();
+            int depth = selection?.Depth ?? 0;
+            int maxArrayElements = selection?.MaxArrayElements ?? DefaultMaxArrayElements;
 
             try
             {
                 SerializedObject serializedObject = new SerializedObject(component);
+
+                // Requested paths are looked up directly instead of iterating the whole object
+                if (selection?.PropertyPaths != null)
+                {
+                    foreach (string path in selection.PropertyPaths)
+                    {
+                        SerializedProperty requested = serializedObject.FindProperty(path);
+                        if (requested != null)
+                        {
+                            properties[path] = GetPropertyValue(requested, depth, maxArrayElements);
+                        }
+                    }
+                    return properties;
+                }
+
                 SerializedProperty property = serializedObject.GetIterator();
 
                 bool enterChildren = true;
@@ -25,7 +110,7 @@ namespace SceneAPI
                     if (property.name == "m_Script")
                         continue;
 
-                    properties[property.name] = GetSerializedPropertyValue(property);
+                    properties[property.name] = GetPropertyValue(property, depth, maxArrayElements);
                 }
             }
             catch (Exception ex)
@@ -36,6 +121,37 @@ namespace SceneAPI
             return properties;
         }
 
+        // depth > 0 expands arrays (first maxArrayElements items) and nested structs; at depth 0 they stay as before
+        private static object GetPropertyValue(SerializedProperty property, int depth, int maxArrayElements)
+        {
+            if (depth > 0 && property.isArray && property.propertyType != SerializedPropertyType.String)
+            {
+                int count = Math.Min(property.arraySize, maxArrayElements);
+                var items = new List<object>(count);
+                for (int i = 0; i < count; i++)
+                {
+                    items.Add(GetPropertyValue(property.GetArrayElementAtIndex(i), depth - 1, maxArrayElements));
+                }
+                return items;
+            }
+
+            if (depth > 0 && property.propertyType == SerializedPropertyType.Generic && property.hasVisibleChildren)
+            {
+                var children = new Dictionary<string, object>();
+                SerializedProperty child = property.Copy();
+                SerializedProperty end = property.GetEndProperty();
+                bool enterChildren = true;
+                while (child.NextVisible(enterChildren) && !SerializedProperty.EqualContents(child, end))
+                {
+                    enterChildren = false;
+                    children[child.name] = GetPropertyValue(child, depth - 1, maxArrayElements);
+                }
+                return children;
+            }
+
+            return GetSerializedPropertyValue(property);
+        }
+
         public static void ModifyComponentProperties(Component component, dynamic properties)
         {
             SerializedObject serializedObject = new SerializedObject(component);
@@ -1,6 +1,8 @@
 using System.Collections.Generic;
 using System.Linq;
+using UnityEditor;
 using UnityEngine;
+using UnityEngine.SceneManagement;
 
 namespace SceneAPI
 {
@@ -10,22 +12,36 @@ namespace SceneAPI
         {
             if (go == null) return null;
 
-            string currentPath = string.IsNullOrEmpty(parentPath) ? go.name : $"{parentPath}/{go.name}";
-            var children = new List<object>();
+            // Explicit stack instead of recursion: every entry fills the children list of an already created node
+            var data = CreateGameObjectData(go, parentPath, out string currentPath, out List<object> children);
+            var stack = new Stack<(Transform transform, string path, List<object> children)>();
+            stack.Push((go.transform, currentPath, children));
 
-            Transform transform = go.transform;
-            if (transform != null)
+            while (stack.Count > 0)
             {
+                var (transform, path, siblings) = stack.Pop();
+                if (transform == null) continue;
+
                 for (int i = 0; i < transform.childCount; i++)
                 {
                     Transform child = transform.GetChild(i);
                     if (child != null && child.gameObject != null)
                     {
-                        children.Add(GetGameObjectData(child.gameObject, currentPath));
+                        siblings.Add(CreateGameObjectData(child.gameObject, path, out string childPath, out List<object> childChildren));
+                        stack.Push((child, childPath, childChildren));
                     }
                 }
             }
 
+            return data;
+        }
+
+        private static object CreateGameObjectData(GameObject go, string parentPath, out string currentPath, out List<object> children)
+        {
+            currentPath = string.IsNullOrEmpty(parentPath) ? go.name : $"{parentPath}/{go.name}";
+            children = new List<object>();
+
+            Transform transform = go.transform;
             return new
             {
                 name = go.name,
@@ -42,16 +58,68 @@ namespace SceneAPI
             };
         }
 
+        public const string StaleHandleError = "Stale object handle";
+
+        // Instance id first: an O(1) lookup that survives renames, reparenting and duplicate sibling names.
+        // An id that no longer points to a scene object is reported as stale instead of falling back to the path
+        public static GameObject ResolveGameObject(string path, int? instanceId, out string error)
+        {
+            error = null;
+            if (instanceId.HasValue)
+            {
+                var go = EditorUtility.InstanceIDToObject(instanceId.Value) as GameObject;
+                if (go != null && go.scene.IsValid())
+                {
+                    return go;
+                }
+                error = string.IsNullOrEmpty(path)
+                    ? $"{StaleHandleError}: {instanceId.Value}"
+                    : $"{StaleHandleError}: {instanceId.Value} (last known path: {path})";
+                return null;
+            }
+
+            GameObject found = FindGameObjectByPath(path);
+            if (found == null)
+            {
+                error = "Object not found";
+            }
+            return found;
+        }
+
+        public static int? ParseInstanceId(string value)
+        {
+            return int.TryParse(value, out int instanceId) ? instanceId : (int?)null;
+        }
+
+        public static string GetPath(Transform transform)
+        {
+            string indexed = ScenePathIndex.GetPath(transform);
+            if (indexed != null)
+            {
+                return indexed;
+            }
+
+            var names = new List<string>();
+            for (Transform current = transform; current != null; current = current.parent)
+            {
+                names.Add(current.name);
+            }
+            names.Reverse();
+            return string.Join("/", names);
+        }
+
         public static GameObject FindGameObjectByPath(string path)
         {
             if (string.IsNullOrEmpty(path)) return null;
+            return ScenePathIndex.Find(path);
+        }
 
+        // Root by name, then Transform.Find per segment: the reference semantics of a path lookup
+        internal static GameObject WalkPath(Scene activeScene, string path)
+        {
             string[] pathParts = path.Split('/');
             GameObject current = null;
 
-            var activeScene = UnityEngine.SceneManagement.SceneManager.GetActiveScene();
-            if (!activeScene.IsValid()) return null;
-
             GameObject[] rootObjects = null;
             try
             {
@@ -18,11 +18,17 @@ namespace SceneAPI.Handlers
                 return JsonConvert.SerializeObject(new { error = "Object not found" });
             }
 
-            var components = obj.GetComponents<Component>().Where(c => c != null).Select(comp => new
+            var selection = ComponentUtilities.ComponentSelection.Parse(context.Request.QueryString, out string selectionError);
+            if (selectionError != null)
+            {
+                return JsonConvert.SerializeObject(new { error = selectionError });
+            }
+
+            var components = obj.GetComponents<Component>().Where(c => c != null && selection.Includes(c)).Select(comp => new
             {
                 name = comp.GetType().Name,
                 type = comp.GetType().FullName,
-                properties = ComponentUtilities.GetComponentProperties(comp)
+                properties = ComponentUtilities.GetComponentProperties(comp, selection)
             }).ToArray();
 
             return JsonConvert.SerializeObject(new { path = objectPath, components = components }, Formatting.Indented);
@@ -1,15 +1,88 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
 using UnityEditor;
-using UnityEngine;
+using Debug = UnityEngine.Debug;
 
 namespace SceneAPI
 {
+    // Order in which queued work runs: cheap reads first, scene dumps and bulk work last
+    public enum DispatchPriority
+    {
+        High = 0,
+        Normal = 1,
+        Low = 2
+    }
+
+    // Runs listener-thread work on the editor main thread.
+    // Enqueue only appends to a pending list under the lock; each update swaps that list out and runs work
+    // in priority order until the time budget is spent. The rest waits for the next update, so a burst of heavy
+    // requests is spread over several frames instead of freezing one. Work that waited longer than StarvationMs
+    // runs ahead of higher priorities.
     public static class MainThreadDispatcher
     {
-        private static readonly Queue<Action> actions = new Queue<Action>();
+        public const int PriorityCount = 3;
+
+        private struct WorkItem
+        {
+            public Action Action;
+            public DispatchPriority Priority;
+            public long EnqueuedTicks;
+        }
+
+        // Count, total, max and a window of recent samples for the 95th percentile
+        private sealed class Metric
+        {
+            private const int Window = 256;
+            private readonly double[] recent = new double[Window];
+            private long count;
+            private double total;
+            private double max;
+
+            public void Add(double value)
+            {
+                recent[count % Window] = value;
+                count++;
+                total += value;
+                if (value > max) max = value;
+            }
+
+            public object Snapshot()
+            {
+                int size = (int)Math.Min(count, Window);
+                var sorted = new double[size];
+                Array.Copy(recent, sorted, size);
+                Array.Sort(sorted);
+                return new
+                {
+                    count = count,
+                    avgMs = count > 0 ? Math.Round(total / count, 3) : 0,
+                    maxMs = Math.Round(max, 3),
+                    p95Ms = size > 0 ? Math.Round(sorted[(int)Math.Ceiling(size * 0.95) - 1], 3) : 0
+                };
+            }
+        }
+
+        public static double BudgetMs = 10.0;
+        public static double StarvationMs = 250.0;
+
+        private static readonly object pendingLock = new object();
+        private static List<WorkItem> pending = new List<WorkItem>();
+        private static List<WorkItem> swap = new List<WorkItem>();
+        // Main thread only: work carried over from earlier updates
+        private static readonly Queue<WorkItem>[] ready = CreateQueues();
+        private static readonly int[] queued = new int[PriorityCount];
+        private static int maxQueueDepth;
         private static bool isInitialized = false;
 
+        private static readonly object statsLock = new object();
+        private static readonly Metric[] waits = CreateMetrics();
+        private static readonly Metric[] executions = CreateMetrics();
+        private static readonly Metric updates = new Metric();
+        private static long failed;
+        private static long budgetExhausted;
+
         public static void Initialize()
         {
             if (!isInitialized)
@@ -25,39 +98,194 @@ namespace SceneAPI
             {
                 EditorApplication.update -= Update;
                 isInitialized = false;
-                lock (actions)
+                lock (pendingLock)
+                {
+                    pending.Clear();
+                }
+                foreach (var queue in ready)
                 {
-                    actions.Clear();
+                    queue.Clear();
+                }
+                for (int i = 0; i < PriorityCount; i++)
+                {
+                    Interlocked.Exchange(ref queued[i], 0);
                 }
             }
         }
 
-        public static void Enqueue(Action action)
+        public static void Enqueue(Action action, DispatchPriority priority = DispatchPriority.Normal)
         {
             if (action == null) return;
 
-            lock (actions)
+            var item = new WorkItem { Action = action, Priority = priority, EnqueuedTicks = Stopwatch.GetTimestamp() };
+            lock (pendingLock)
             {
-                actions.Enqueue(action);
+                pending.Add(item);
+                Interlocked.Increment(ref queued[(int)priority]);
+                maxQueueDepth = Math.Max(maxQueueDepth, QueueDepth);
             }
         }
 
-        private static void Update()
+        public static int QueueDepth
         {
-            lock (actions)
+            get
             {
-                while (actions.Count > 0)
+                int depth = 0;
+                for (int i = 0; i < PriorityCount; i++) depth += Volatile.Read(ref queued[i]);
+                return depth;
+            }
+        }
+
+        // Safe to call from any thread: GET /stats is answered without waiting for the main thread
+        public static object GetStats()
+        {
+            lock (statsLock)
+            {
+                return new
                 {
-                    try
+                    queueDepth = QueueDepth,
+                    maxQueueDepth = maxQueueDepth,
+                    queued = new
+                    {
+                        high = Volatile.Read(ref queued[(int)DispatchPriority.High]),
+                        normal = Volatile.Read(ref queued[(int)DispatchPriority.Normal]),
+                        low = Volatile.Read(ref queued[(int)DispatchPriority.Low])
+                    },
+                    budgetMs = BudgetMs,
+                    failed = failed,
+                    budgetExhausted = budgetExhausted,
+                    update = updates.Snapshot(),
+                    wait = new
                     {
-                        actions.Dequeue().Invoke();
+                        high = waits[(int)DispatchPriority.High].Snapshot(),
+                        normal = waits[(int)DispatchPriority.Normal].Snapshot(),
+                        low = waits[(int)DispatchPriority.Low].Snapshot()
+                    },
+                    execution = new
+                    {
+                        high = executions[(int)DispatchPriority.High].Snapshot(),
+                        normal = executions[(int)DispatchPriority.Normal].Snapshot(),
+                        low = executions[(int)DispatchPriority.Low].Snapshot()
                     }
-                    catch (Exception ex)
+                };
+            }
+        }
+
+        private static void Update()
+        {
+            // Swap the pending list out: the listener thread never waits for work to run
+            lock (pendingLock)
+            {
+                if (pending.Count > 0)
+                {
+                    var incoming = pending;
+                    pending = swap;
+                    swap = incoming;
+                }
+            }
+            foreach (var item in swap)
+            {
+                ready[(int)item.Priority].Enqueue(item);
+            }
+            swap.Clear();
+
+            long start = Stopwatch.GetTimestamp();
+            long budget = (long)(BudgetMs * Stopwatch.Frequency / 1000.0);
+            bool ran = false;
+
+            // At least one item per update, so work larger than the budget still makes progress
+            while (TryTake(out WorkItem item))
+            {
+                long started = Stopwatch.GetTimestamp();
+                bool ok = true;
+                try
+                {
+                    item.Action.Invoke();
+                }
+                catch (Exception ex)
+                {
+                    ok = false;
+                    Debug.LogError($"Error executing main thread action: {ex.Message}");
+                }
+                long finished = Stopwatch.GetTimestamp();
+                Interlocked.Decrement(ref queued[(int)item.Priority]);
+                ran = true;
+
+                lock (statsLock)
+                {
+                    waits[(int)item.Priority].Add(ToMs(started - item.EnqueuedTicks));
+                    executions[(int)item.Priority].Add(ToMs(finished - started));
+                    if (!ok) failed++;
+                }
+
+                if (finished - start >= budget)
+                {
+                    if (HasReadyWork())
                     {
-                        Debug.LogError($"Error executing main thread action: {ex.Message}");
+                        lock (statsLock) budgetExhausted++;
                     }
+                    break;
                 }
             }
+
+            if (ran)
+            {
+                lock (statsLock) updates.Add(ToMs(Stopwatch.GetTimestamp() - start));
+            }
+        }
+
+        private static bool TryTake(out WorkItem item)
+        {
+            long now = Stopwatch.GetTimestamp();
+            long starvation = (long)(StarvationMs * Stopwatch.Frequency / 1000.0);
+
+            // Oldest starving item of a lower priority first, then strict priority order
+            for (int i = PriorityCount - 1; i > 0; i--)
+            {
+                if (ready[i].Count > 0 && now - ready[i].Peek().EnqueuedTicks >= starvation)
+                {
+                    item = ready[i].Dequeue();
+                    return true;
+                }
+            }
+            for (int i = 0; i < PriorityCount; i++)
+            {
+                if (ready[i].Count > 0)
+                {
+                    item = ready[i].Dequeue();
+                    return true;
+                }
+            }
+            item = default;
+            return false;
+        }
+
+        private static bool HasReadyWork()
+        {
+            foreach (var queue in ready)
+            {
+                if (queue.Count > 0) return true;
+            }
+            return false;
+        }
+
+        private static double ToMs(long ticks)
+        {
+            return ticks * 1000.0 / Stopwatch.Frequency;
+        }
+
+        private static Queue<WorkItem>[] CreateQueues()
+        {
+            var queues = new Queue<WorkItem>[PriorityCount];
+            for (int i = 0; i < PriorityCount; i++) queues[i] = new Queue<WorkItem>();
+            return queues;
+        }
+
+        private static Metric[] CreateMetrics()
+        {
+            var metrics = new Metric[PriorityCount];
+            for (int i = 0; i < PriorityCount; i++) metrics[i] = new Metric();
+            return metrics;
         }
     }
 }
\ No newline at end of file
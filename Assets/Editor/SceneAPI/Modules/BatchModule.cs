@@ -0,0 +1,131 @@
+using System;
+using System.Collections.Generic;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace SceneAPI.Modules
+{
+    public static class BatchModule
+    {
+        public const int MaxBatchSize = 1000;
+
+        // Executes every command of the batch in a single main-thread pass
+        public static string Execute(SceneAPIRequest request, SceneAPIHandler handler)
+        {
+            try
+            {
+                JObject data = string.IsNullOrEmpty(request.Body) ? null : JObject.Parse(request.Body);
+                JArray commands = data?["commands"] as JArray;
+
+                if (commands == null)
+                {
+                    return JsonConvert.SerializeObject(new 
+                    { 
+                        success = false, 
+                        error = "Commands array is required" 
+                    });
+                }
+
+                if (commands.Count > MaxBatchSize)
+                {
+                    return JsonConvert.SerializeObject(new 
+                    { 
+                        success = false, 
+                        error = $"Batch is too large: {commands.Count} commands (max {MaxBatchSize})" 
+                    });
+                }
+
+                bool stopOnError = data.Value<bool?>("stopOnError") ?? true;
+                var results = new List<object>(commands.Count);
+                bool stopped = false;
+
+                for (int i = 0; i < commands.Count; i++)
+                {
+                    int status = 200;
+                    JToken body;
+
+                    if (!(commands[i] is JObject entry))
+                    {
+                        status = 400;
+                        body = new JObject { ["error"] = "Invalid batch entry" };
+                    }
+                    else
+                    {
+                        SceneAPIRequest subRequest = SceneAPIRequest.FromBatchEntry(entry);
+                        if (subRequest.Path == "/batch")
+                        {
+                            status = 400;
+                            body = new JObject { ["error"] = "Nested batch requests are not supported" };
+                        }
+                        else
+                        {
+                            body = ParseResponse(ExecuteCommand(handler, subRequest));
+                            status = subRequest.StatusCode;
+                        }
+                    }
+
+                    results.Add(new { index = i, status = status, body = body });
+
+                    if (stopOnError && IsError(body))
+                    {
+                        stopped = i < commands.Count - 1;
+                        break;
+                    }
+                }
+
+                return JsonConvert.SerializeObject(new 
+                { 
+                    success = true, 
+                    results = results,
+                    completed = results.Count,
+                    total = commands.Count,
+                    stopped = stopped
+                });
+            }
+            catch (Exception ex)
+            {
+                return JsonConvert.SerializeObject(new 
+                { 
+                    success = false, 
+                    error = $"Error executing batch: {ex.Message}" 
+                });
+            }
+        }
+
+        private static string ExecuteCommand(SceneAPIHandler handler, SceneAPIRequest subRequest)
+        {
+            try
+            {
+                return handler.HandleRequest(subRequest);
+            }
+            catch (Exception ex)
+            {
+                subRequest.StatusCode = 500;
+                return JsonConvert.SerializeObject(new { error = ex.Message });
+            }
+        }
+
+        private static JToken ParseResponse(string response)
+        {
+            try
+            {
+                return string.IsNullOrEmpty(response) ? JValue.CreateNull() : JToken.Parse(response);
+            }
+            catch (JsonException)
+            {
+                return new JValue(response);
+            }
+        }
+
+        private static bool IsError(JToken body)
+        {
+            if (!(body is JObject obj)) return false;
+
+            JToken error = obj["error"];
+            if (error != null && error.Type != JTokenType.Null) return true;
+
+            JToken success = obj["success"];
+            return success != null && success.Type == JTokenType.Boolean && !(bool)success;
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,23 @@
+using Newtonsoft.Json;
+
+namespace SceneAPI.Modules
+{
+    public static class CapabilitiesModule
+    {
+        // Lets clients detect optional endpoints instead of probing them
+        public static string Execute()
+        {
+            return JsonConvert.SerializeObject(new
+            {
+                batch = true,
+                maxBatchSize = BatchModule.MaxBatchSize,
+                find = true,
+                maxFindLimit = FindObjectsModule.MaxLimit,
+                transforms = true,
+                bulkCreate = true,
+                maxBulkCreate = CreateObjectsModule.MaxObjects,
+                stats = true
+            });
+        }
+    }
+}
\ No newline at end of file
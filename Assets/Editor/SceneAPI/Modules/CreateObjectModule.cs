@@ -1,5 +1,4 @@
 using System;
-using System.Net;
 using Newtonsoft.Json;
 using UnityEngine;
 
@@ -7,27 +6,43 @@ namespace SceneAPI.Modules
 {
     public static class CreateObjectModule
     {
-        public static string Execute(HttpListenerContext context)
+        public static string Execute(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string objectName = data?.name ?? "GameObject";
                 string parentPath = data?.parentPath ?? "";
+                int? parentId = (int?)data?.parentId;
 
-                GameObject newObj = new GameObject(objectName);
-
-                if (!string.IsNullOrEmpty(parentPath))
+                GameObject parent = null;
+                if (parentId.HasValue)
                 {
-                    GameObject parent = GameObjectUtilities.FindGameObjectByPath(parentPath);
-                    if (parent != null)
+                    parent = GameObjectUtilities.ResolveGameObject(parentPath, parentId, out string resolveError);
+                    if (parent == null)
                     {
-                        newObj.transform.SetParent(parent.transform);
+                        return JsonConvert.SerializeObject(new 
+                        { 
+                            success = false, 
+                            error = resolveError 
+                        });
                     }
+                    parentPath = GameObjectUtilities.GetPath(parent.transform);
+                }
+                else if (!string.IsNullOrEmpty(parentPath))
+                {
+                    parent = GameObjectUtilities.FindGameObjectByPath(parentPath);
                 }
 
+                GameObject newObj = new GameObject(objectName);
+                if (parent != null)
+                {
+                    newObj.transform.SetParent(parent.transform);
+                }
+                SceneChangeLog.MarkDirty(newObj);
+
                 string fullPath = string.IsNullOrEmpty(parentPath) ? objectName : $"{parentPath}/{objectName}";
 
                 return JsonConvert.SerializeObject(new
@@ -47,13 +62,5 @@ namespace SceneAPI.Modules
                 });
             }
         }
-
-        private static string GetRequestBody(HttpListenerContext context)
-        {
-            using (var reader = new System.IO.StreamReader(context.Request.InputStream))
-            {
-                return reader.ReadToEnd();
-            }
-        }
     }
 }
\ No newline at end of file
@@ -0,0 +1,218 @@
+using System;
+using System.Collections.Generic;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using UnityEditor;
+using UnityEngine;
+
+namespace SceneAPI.Modules
+{
+    public static class CreateObjectsModule
+    {
+        public const int MaxObjects = 10000;
+
+        // Body: {"objects": [{"name", "parentPath" | "parentId" | "parentIndex", "prefab", "position", "rotation", "scale", "components"}]}
+        // parentIndex refers to an earlier entry of the same request; transforms are local to the parent
+        public static string Execute(SceneAPIRequest request)
+        {
+            try
+            {
+                JObject data = string.IsNullOrEmpty(request.Body) ? null : JObject.Parse(request.Body);
+                JArray objects = data?["objects"] as JArray;
+
+                if (objects == null)
+                {
+                    return JsonConvert.SerializeObject(new { success = false, error = "Objects array is required" });
+                }
+
+                if (objects.Count > MaxObjects)
+                {
+                    return JsonConvert.SerializeObject(new { success = false, error = $"Too many objects: {objects.Count} (max {MaxObjects})" });
+                }
+
+                // Parents, prefab assets and component types are resolved once per request, not once per object
+                var parentsByPath = new Dictionary<string, Transform>();
+                var prefabs = new Dictionary<string, GameObject>();
+                var types = new Dictionary<string, Type>();
+
+                var created = new GameObject[objects.Count];
+                var instanceIds = new int?[objects.Count];
+                var paths = new string[objects.Count];
+                var errors = new List<object>();
+                int createdCount = 0;
+
+                for (int i = 0; i < objects.Count; i++)
+                {
+                    JObject spec = objects[i] as JObject;
+                    if (spec == null)
+                    {
+                        errors.Add(new { index = i, error = "Invalid object spec" });
+                        continue;
+                    }
+
+                    string error = ResolveParent(spec, i, created, paths, parentsByPath, out Transform parent, out string parentPath);
+                    GameObject prefab = null;
+                    if (error == null) error = ResolvePrefab((string)spec["prefab"], prefabs, out prefab);
+                    var componentTypes = new List<Type>();
+                    if (error == null) error = ResolveComponents(spec["components"] as JArray, types, componentTypes);
+                    if (error != null)
+                    {
+                        errors.Add(new { index = i, error = error });
+                        continue;
+                    }
+
+                    GameObject go;
+                    if (prefab != null)
+                    {
+                        go = (GameObject)PrefabUtility.InstantiatePrefab(prefab, parent);
+                        string name = (string)spec["name"];
+                        if (!string.IsNullOrEmpty(name)) go.name = name;
+                    }
+                    else
+                    {
+                        go = new GameObject((string)spec["name"] ?? "GameObject");
+                        if (parent != null) go.transform.SetParent(parent, false);
+                    }
+
+                    Transform transform = go.transform;
+                    if (spec["position"] is JObject position) transform.localPosition = ReadVector(position, transform.localPosition);
+                    if (spec["rotation"] is JObject rotation) transform.localRotation = ReadQuaternion(rotation, transform.localRotation);
+                    if (spec["scale"] is JObject scale) transform.localScale = ReadVector(scale, transform.localScale);
+
+                    foreach (Type type in componentTypes)
+                    {
+                        if (go.GetComponent(type) == null) go.AddComponent(type);
+                    }
+
+                    SceneChangeLog.MarkDirty(go);
+                    created[i] = go;
+                    instanceIds[i] = go.GetInstanceID();
+                    paths[i] = parentPath == null ? go.name : parentPath + "/" + go.name;
+                    createdCount++;
+                }
+
+                return JsonConvert.SerializeObject(new
+                {
+                    success = true,
+                    created = createdCount,
+                    instanceIds = instanceIds,
+                    paths = paths,
+                    errors = errors,
+                    message = $"Objects created: {createdCount} of {objects.Count}"
+                });
+            }
+            catch (Exception ex)
+            {
+                return JsonConvert.SerializeObject(new { success = false, error = $"Error creating objects: {ex.Message}" });
+            }
+        }
+
+        private static string ResolveParent(JObject spec, int index, GameObject[] created, string[] paths,
+            Dictionary<string, Transform> parentsByPath, out Transform parent, out string parentPath)
+        {
+            parent = null;
+            parentPath = null;
+
+            JToken parentIndex = spec["parentIndex"];
+            if (parentIndex != null && parentIndex.Type == JTokenType.Integer)
+            {
+                int value = (int)parentIndex;
+                if (value < 0 || value >= index || created[value] == null)
+                {
+                    return $"Parent entry {value} was not created before entry {index}";
+                }
+                parent = created[value].transform;
+                parentPath = paths[value];
+                return null;
+            }
+
+            JToken parentId = spec["parentId"];
+            if (parentId != null && parentId.Type == JTokenType.Integer)
+            {
+                GameObject go = GameObjectUtilities.ResolveGameObject(null, (int)parentId, out string error);
+                if (go == null)
+                {
+                    return error;
+                }
+                parent = go.transform;
+                parentPath = GameObjectUtilities.GetPath(parent);
+                return null;
+            }
+
+            string path = (string)spec["parentPath"];
+            if (string.IsNullOrEmpty(path))
+            {
+                return null;
+            }
+
+            if (!parentsByPath.TryGetValue(path, out parent))
+            {
+                GameObject go = GameObjectUtilities.FindGameObjectByPath(path);
+                parent = go != null ? go.transform : null;
+                parentsByPath[path] = parent;
+            }
+            if (parent == null)
+            {
+                return $"Parent object not found: {path}";
+            }
+            parentPath = path;
+            return null;
+        }
+
+        private static string ResolvePrefab(string assetPath, Dictionary<string, GameObject> prefabs, out GameObject prefab)
+        {
+            prefab = null;
+            if (string.IsNullOrEmpty(assetPath))
+            {
+                return null;
+            }
+
+            if (!prefabs.TryGetValue(assetPath, out prefab))
+            {
+                prefab = AssetDatabase.LoadAssetAtPath<GameObject>(assetPath);
+                prefabs[assetPath] = prefab;
+            }
+            return prefab == null ? $"Prefab not found: {assetPath}" : null;
+        }
+
+        private static string ResolveComponents(JArray components, Dictionary<string, Type> types, List<Type> result)
+        {
+            if (components == null) return null;
+
+            foreach (JToken component in components)
+            {
+                string componentType = (string)component;
+                if (!types.TryGetValue(componentType, out Type type))
+                {
+                    // Same lookup as AddComponentModule
+                    type = Type.GetType($"UnityEngine.{componentType}, UnityEngine") ??
+                           Type.GetType($"{componentType}, Assembly-CSharp");
+                    types[componentType] = type;
+                }
+                if (type == null)
+                {
+                    return $"Component type not found: {componentType}";
+                }
+                result.Add(type);
+            }
+            return null;
+        }
+
+        private static Vector3 ReadVector(JObject value, Vector3 fallback)
+        {
+            return new Vector3(
+                value.Value<float?>("x") ?? fallback.x,
+                value.Value<float?>("y") ?? fallback.y,
+                value.Value<float?>("z") ?? fallback.z);
+        }
+
+        private static Quaternion ReadQuaternion(JObject value, Quaternion fallback)
+        {
+            return new Quaternion(
+                value.Value<float?>("x") ?? fallback.x,
+                value.Value<float?>("y") ?? fallback.y,
+                value.Value<float?>("z") ?? fallback.z,
+                value.Value<float?>("w") ?? fallback.w);
+        }
+    }
+}
\ No newline at end of file
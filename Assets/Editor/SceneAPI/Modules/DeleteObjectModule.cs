@@ -1,5 +1,4 @@
 using System;
-using System.Net;
 using Newtonsoft.Json;
 using UnityEngine;
 
@@ -7,16 +6,17 @@ namespace SceneAPI.Modules
 {
     public static class DeleteObjectModule
     {
-        public static string Execute(HttpListenerContext context)
+        public static string Execute(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string objectPath = data?.path;
+                int? instanceId = (int?)data?.instanceId;
                 
-                if (string.IsNullOrEmpty(objectPath))
+                if (string.IsNullOrEmpty(objectPath) && !instanceId.HasValue)
                 {
                     return JsonConvert.SerializeObject(new 
                     { 
@@ -25,10 +25,16 @@ namespace SceneAPI.Modules
                     });
                 }
 
-                GameObject obj = GameObjectUtilities.FindGameObjectByPath(objectPath);
+                GameObject obj = GameObjectUtilities.ResolveGameObject(objectPath, instanceId, out string resolveError);
                 if (obj != null)
                 {
+                    if (instanceId.HasValue)
+                    {
+                        objectPath = GameObjectUtilities.GetPath(obj.transform);
+                    }
+                    int deletedId = obj.GetInstanceID();
                     UnityEngine.Object.DestroyImmediate(obj);
+                    SceneChangeLog.MarkDirty(deletedId);
                     return JsonConvert.SerializeObject(new 
                     { 
                         success = true, 
@@ -39,7 +45,7 @@ namespace SceneAPI.Modules
                 return JsonConvert.SerializeObject(new 
                 { 
                     success = false, 
-                    error = "Object not found" 
+                    error = resolveError 
                 });
             }
             catch (Exception ex)
@@ -51,13 +57,5 @@ namespace SceneAPI.Modules
                 });
             }
         }
-
-        private static string GetRequestBody(HttpListenerContext context)
-        {
-            using (var reader = new System.IO.StreamReader(context.Request.InputStream))
-            {
-                return reader.ReadToEnd();
-            }
-        }
     }
 }
\ No newline at end of file
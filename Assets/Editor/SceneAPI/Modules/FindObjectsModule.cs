@@ -0,0 +1,294 @@
+using System;
+using System.Collections.Generic;
+using System.Text;
+using System.Text.RegularExpressions;
+using Newtonsoft.Json;
+using UnityEditor;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace SceneAPI.Modules
+{
+    public static class FindObjectsModule
+    {
+        public const int DefaultLimit = 1000;
+        public const int MaxLimit = 10000;
+
+        private static readonly TimeSpan RegexTimeout = TimeSpan.FromMilliseconds(100);
+
+        private class Filter
+        {
+            public string Name;
+            public string Match = "substring";
+            public Regex Pattern;
+            public string Tag;
+            public int? Layer;
+            public bool? Active;
+            public string[] Components = new string[0];
+            public int Limit = DefaultLimit;
+            public int? Cursor;
+
+            public bool Matches(GameObject go)
+            {
+                if (Tag != null && go.tag != Tag) return false;
+                if (Layer.HasValue && go.layer != Layer.Value) return false;
+                if (Active.HasValue && go.activeInHierarchy != Active.Value) return false;
+
+                if (Components.Length > 0)
+                {
+                    var types = new HashSet<string>();
+                    foreach (Component component in go.GetComponents<Component>())
+                    {
+                        if (component != null) types.Add(component.GetType().Name);
+                    }
+                    foreach (string type in Components)
+                    {
+                        if (!types.Contains(type)) return false;
+                    }
+                }
+
+                if (Name == null) return true;
+                if (Pattern == null) return go.name.IndexOf(Name, StringComparison.OrdinalIgnoreCase) >= 0;
+                return Pattern.IsMatch(go.name);
+            }
+        }
+
+        // Filters the active scene in hierarchy order; nextCursor is the instance id of the first object not yet visited
+        public static string Execute(SceneAPIRequest request)
+        {
+            try
+            {
+                var filter = ParseFilter(request, out string filterError);
+                if (filterError != null)
+                {
+                    return JsonConvert.SerializeObject(new { error = filterError });
+                }
+
+                Scene activeScene = SceneManager.GetActiveScene();
+                if (!activeScene.IsValid())
+                {
+                    return JsonConvert.SerializeObject(new { error = "No active scene" });
+                }
+
+                var stack = new Stack<(Transform transform, string parentPath)>();
+                if (filter.Cursor.HasValue)
+                {
+                    var cursorObject = EditorUtility.InstanceIDToObject(filter.Cursor.Value) as GameObject;
+                    if (cursorObject == null || cursorObject.scene != activeScene)
+                    {
+                        return JsonConvert.SerializeObject(new { error = "Cursor object no longer exists" });
+                    }
+                    PushResumeState(stack, activeScene, cursorObject.transform);
+                }
+                else
+                {
+                    GameObject[] roots = activeScene.GetRootGameObjects();
+                    for (int i = roots.Length - 1; i >= 0; i--)
+                    {
+                        stack.Push((roots[i].transform, null));
+                    }
+                }
+
+                var paths = new List<string>();
+                var instanceIds = new List<int>();
+                int? nextCursor = null;
+
+                while (stack.Count > 0)
+                {
+                    var (transform, parentPath) = stack.Pop();
+                    if (transform == null) continue;
+
+                    if (paths.Count >= filter.Limit)
+                    {
+                        nextCursor = transform.gameObject.GetInstanceID();
+                        break;
+                    }
+
+                    string path = parentPath == null ? transform.name : parentPath + "/" + transform.name;
+                    if (filter.Matches(transform.gameObject))
+                    {
+                        paths.Add(path);
+                        instanceIds.Add(transform.gameObject.GetInstanceID());
+                    }
+
+                    for (int i = transform.childCount - 1; i >= 0; i--)
+                    {
+                        stack.Push((transform.GetChild(i), path));
+                    }
+                }
+
+                return JsonConvert.SerializeObject(new
+                {
+                    paths = paths,
+                    instanceIds = instanceIds,
+                    foundCount = paths.Count,
+                    nextCursor = nextCursor?.ToString()
+                });
+            }
+            catch (RegexMatchTimeoutException)
+            {
+                return JsonConvert.SerializeObject(new { error = "Regex match timed out" });
+            }
+            catch (Exception ex)
+            {
+                return JsonConvert.SerializeObject(new { error = $"Error finding objects: {ex.Message}" });
+            }
+        }
+
+        // Rebuilds the traversal stack as it was right before visiting the cursor object:
+        // the later siblings of every ancestor (outermost first), then the object itself - O(depth), not a rescan
+        private static void PushResumeState(Stack<(Transform transform, string parentPath)> stack, Scene scene, Transform cursor)
+        {
+            var chain = new List<Transform>();
+            for (Transform node = cursor; node != null; node = node.parent)
+            {
+                chain.Add(node);
+            }
+            chain.Reverse();
+
+            string parentPath = null;
+            for (int level = 0; level < chain.Count; level++)
+            {
+                Transform node = chain[level];
+                Transform parent = node.parent;
+                if (parent == null)
+                {
+                    GameObject[] roots = scene.GetRootGameObjects();
+                    for (int i = roots.Length - 1; i > node.GetSiblingIndex(); i--)
+                    {
+                        stack.Push((roots[i].transform, null));
+                    }
+                }
+                else
+                {
+                    for (int i = parent.childCount - 1; i > node.GetSiblingIndex(); i--)
+                    {
+                        stack.Push((parent.GetChild(i), parentPath));
+                    }
+                }
+
+                if (level == chain.Count - 1)
+                {
+                    stack.Push((node, parentPath));
+                }
+                parentPath = parentPath == null ? node.name : parentPath + "/" + node.name;
+            }
+        }
+
+        private static Filter ParseFilter(SceneAPIRequest request, out string error)
+        {
+            error = null;
+            var filter = new Filter();
+            var query = request.QueryString;
+
+            string name = query?["name"];
+            filter.Name = string.IsNullOrEmpty(name) ? null : name;
+
+            string match = query?["match"];
+            if (!string.IsNullOrEmpty(match))
+            {
+                filter.Match = match.ToLowerInvariant();
+            }
+
+            try
+            {
+                if (filter.Match == "glob")
+                {
+                    // Only * and ? are wildcards and the pattern covers the whole name, as in the editor search field
+                    if (filter.Name != null) filter.Pattern = new Regex(GlobToRegex(filter.Name), RegexOptions.IgnoreCase | RegexOptions.Singleline, RegexTimeout);
+                }
+                else if (filter.Match == "regex")
+                {
+                    if (filter.Name != null) filter.Pattern = new Regex(filter.Name, RegexOptions.IgnoreCase, RegexTimeout);
+                }
+                else if (filter.Match != "substring")
+                {
+                    error = $"Unknown match mode: {match} (expected one of: substring, glob, regex)";
+                    return filter;
+                }
+            }
+            catch (ArgumentException ex)
+            {
+                error = $"Invalid regex: {ex.Message}";
+                return filter;
+            }
+
+            string tag = query?["tag"];
+            filter.Tag = string.IsNullOrEmpty(tag) ? null : tag;
+
+            string layer = query?["layer"];
+            if (!string.IsNullOrEmpty(layer))
+            {
+                if (!int.TryParse(layer, out int layerValue))
+                {
+                    error = $"layer must be an integer: {layer}";
+                    return filter;
+                }
+                filter.Layer = layerValue;
+            }
+
+            string active = query?["active"];
+            if (!string.IsNullOrEmpty(active))
+            {
+                if (!bool.TryParse(active, out bool activeValue))
+                {
+                    error = $"active must be true or false: {active}";
+                    return filter;
+                }
+                filter.Active = activeValue;
+            }
+
+            string components = query?["components"];
+            if (!string.IsNullOrEmpty(components))
+            {
+                var types = new List<string>();
+                foreach (string part in components.Split(','))
+                {
+                    if (part.Trim().Length > 0) types.Add(part.Trim());
+                }
+                filter.Components = types.ToArray();
+            }
+
+            string limit = query?["limit"];
+            if (!string.IsNullOrEmpty(limit))
+            {
+                if (!int.TryParse(limit, out int limitValue) || limitValue <= 0)
+                {
+                    error = "limit must be a positive integer";
+                    return filter;
+                }
+                filter.Limit = Math.Min(limitValue, MaxLimit);
+            }
+
+            string cursor = query?["cursor"];
+            if (!string.IsNullOrEmpty(cursor))
+            {
+                if (!int.TryParse(cursor, out int cursorValue))
+                {
+                    error = $"Invalid cursor: {cursor}";
+                    return filter;
+                }
+                filter.Cursor = cursorValue;
+            }
+
+            if (filter.Name == null && filter.Tag == null && !filter.Layer.HasValue && !filter.Active.HasValue && filter.Components.Length == 0)
+            {
+                error = "name or another filter is required";
+            }
+
+            return filter;
+        }
+
+        private static string GlobToRegex(string glob)
+        {
+            var pattern = new StringBuilder("^");
+            foreach (char ch in glob)
+            {
+                if (ch == '*') pattern.Append(".*");
+                else if (ch == '?') pattern.Append('.');
+                else pattern.Append(Regex.Escape(ch.ToString()));
+            }
+            return pattern.Append('$').ToString();
+        }
+    }
+}
\ No newline at end of file
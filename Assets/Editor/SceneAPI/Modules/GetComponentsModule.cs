@@ -1,6 +1,5 @@
 using System;
 using System.Linq;
-using System.Net;
 using Newtonsoft.Json;
 using UnityEngine;
 
@@ -8,35 +7,48 @@ namespace SceneAPI.Modules
 {
     public static class GetComponentsModule
     {
-        public static string Execute(HttpListenerContext context)
+        public static string Execute(SceneAPIRequest request)
         {
             try
             {
-                string objectPath = context.Request.QueryString["path"];
+                string objectPath = request.QueryString["path"];
+                int? instanceId = GameObjectUtilities.ParseInstanceId(request.QueryString["instance_id"]);
                 
-                if (string.IsNullOrEmpty(objectPath))
+                if (string.IsNullOrEmpty(objectPath) && !instanceId.HasValue)
                 {
                     return JsonConvert.SerializeObject(new { error = "Object path is required" });
                 }
 
-                GameObject obj = GameObjectUtilities.FindGameObjectByPath(objectPath);
+                GameObject obj = GameObjectUtilities.ResolveGameObject(objectPath, instanceId, out string resolveError);
                 if (obj == null)
                 {
-                    return JsonConvert.SerializeObject(new { error = "Object not found" });
+                    return JsonConvert.SerializeObject(new { error = resolveError });
+                }
+                if (instanceId.HasValue)
+                {
+                    objectPath = GameObjectUtilities.GetPath(obj.transform);
+                }
+
+                var selection = ComponentUtilities.ComponentSelection.Parse(request.QueryString, out string selectionError);
+                if (selectionError != null)
+                {
+                    return JsonConvert.SerializeObject(new { error = selectionError });
                 }
 
+                // SerializedObject is built only for the requested component types
                 var components = obj.GetComponents<Component>()
-                    .Where(c => c != null)
+                    .Where(c => c != null && selection.Includes(c))
                     .ToDictionary(
                         comp => comp.GetType().Name,
-                        comp => ComponentUtilities.GetComponentProperties(comp)
+                        comp => ComponentUtilities.GetComponentProperties(comp, selection)
                     );
 
                 return JsonConvert.SerializeObject(new 
                 { 
                     path = objectPath, 
+                    instanceId = obj.GetInstanceID(),
                     components = components 
-                }, Formatting.Indented);
+                });
             }
             catch (Exception ex)
             {
@@ -1,4 +1,6 @@
 using System;
+using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 using Newtonsoft.Json;
 using UnityEngine;
@@ -8,7 +10,57 @@ namespace SceneAPI.Modules
 {
     public static class GetHierarchyModule
     {
-        public static string Execute()
+        // GET /scene?format=columnar
+        public const string ColumnarFormat = "columnar";
+
+        [Flags]
+        private enum HierarchyFields
+        {
+            None = 0,
+            Name = 1,
+            Path = 2,
+            InstanceId = 4,
+            Active = 8,
+            Tag = 16,
+            Layer = 32,
+            Position = 64,
+            Rotation = 128,
+            Scale = 256,
+            Components = 512,
+            Default = Name | Path | InstanceId | Active | Components
+        }
+
+        // Field names accepted by ?fields=, in the order they are written
+        private static readonly (string name, HierarchyFields field)[] FieldNames =
+        {
+            ("name", HierarchyFields.Name),
+            ("path", HierarchyFields.Path),
+            ("instanceId", HierarchyFields.InstanceId),
+            ("active", HierarchyFields.Active),
+            ("tag", HierarchyFields.Tag),
+            ("layer", HierarchyFields.Layer),
+            ("position", HierarchyFields.Position),
+            ("rotation", HierarchyFields.Rotation),
+            ("scale", HierarchyFields.Scale),
+            ("components", HierarchyFields.Components)
+        };
+
+        // ?from_path= (subtree), ?max_depth= (levels below the starting objects), ?fields= (node columns)
+        private sealed class Projection
+        {
+            public string FromPath;
+            public int MaxDepth = -1;
+            public HierarchyFields Fields = HierarchyFields.Default;
+            public bool HasFields;
+
+            public bool IsProjected => FromPath != null || MaxDepth >= 0 || HasFields;
+
+            public bool Includes(HierarchyFields field) => (Fields & field) != 0;
+
+            public bool IsTruncated(int depth) => MaxDepth >= 0 && depth >= MaxDepth;
+        }
+
+        public static string Execute(SceneAPIRequest request)
         {
             try
             {
@@ -18,19 +70,49 @@ namespace SceneAPI.Modules
                     return JsonConvert.SerializeObject(new { error = "No active scene found" });
                 }
 
-                var rootObjects = activeScene.GetRootGameObjects()
-                    .Select(go => GetGameObjectData(go))
-                    .ToArray();
+                // Conditional GET: an unchanged scene costs a header exchange instead of a full dump
+                request.ResponseHeaders["ETag"] = SceneVersion.ETag;
+                if (SceneVersion.Matches(request.Headers?["If-None-Match"]))
+                {
+                    request.StatusCode = 304;
+                    return "";
+                }
 
-                var sceneData = new
+                var projection = ParseProjection(request, out string projectionError);
+                if (projectionError != null)
                 {
-                    sceneName = activeScene.name,
-                    scenePath = activeScene.path,
-                    rootObjects = rootObjects,
-                    totalObjects = CountTotalObjects(rootObjects)
-                };
+                    return JsonConvert.SerializeObject(new { error = projectionError });
+                }
+
+                // Only the requested subtree is walked; an unknown from_path falls back to the whole scene
+                GameObject start = projection.FromPath != null ? FindStart(activeScene, projection.FromPath) : null;
+                GameObject[] roots = start != null ? new[] { start } : activeScene.GetRootGameObjects();
+                Transform startParent = start != null ? start.transform.parent : null;
+                string basePath = startParent != null ? GameObjectUtilities.GetPath(startParent) : null;
+                string fromPath = start != null ? (basePath == null ? start.name : basePath + "/" + start.name) : null;
+
+                if (request.QueryString?["format"] == ColumnarFormat)
+                {
+                    return WriteColumnar(activeScene, roots, basePath, fromPath, projection);
+                }
 
-                return JsonConvert.SerializeObject(sceneData, Formatting.Indented);
+                using (var stringWriter = new StringWriter())
+                using (var writer = new JsonTextWriter(stringWriter) { Formatting = Formatting.None })
+                {
+                    writer.WriteStartObject();
+                    writer.WritePropertyName("sceneName");
+                    writer.WriteValue(activeScene.name);
+                    writer.WritePropertyName("scenePath");
+                    writer.WriteValue(activeScene.path);
+                    writer.WritePropertyName("rootObjects");
+                    int totalObjects = WriteGameObjects(writer, roots, basePath, projection);
+                    writer.WritePropertyName("totalObjects");
+                    writer.WriteValue(totalObjects);
+                    WriteProjectionInfo(writer, fromPath, projection);
+                    writer.WriteEndObject();
+                    writer.Flush();
+                    return stringWriter.ToString();
+                }
             }
             catch (Exception ex)
             {
@@ -38,45 +120,407 @@ namespace SceneAPI.Modules
             }
         }
 
-        private static object GetGameObjectData(GameObject go)
+        private static Projection ParseProjection(SceneAPIRequest request, out string error)
         {
-            var children = new object[go.transform.childCount];
-            for (int i = 0; i < go.transform.childCount; i++)
+            error = null;
+            var projection = new Projection();
+
+            string fromPath = request.QueryString?["from_path"]?.Trim();
+            if (!string.IsNullOrEmpty(fromPath))
             {
-                children[i] = GetGameObjectData(go.transform.GetChild(i).gameObject);
+                projection.FromPath = fromPath;
             }
 
-            return new
+            string maxDepth = request.QueryString?["max_depth"];
+            if (!string.IsNullOrEmpty(maxDepth))
             {
-                name = go.name,
-                path = GetGameObjectPath(go),
-                active = go.activeInHierarchy,
-                components = go.GetComponents<Component>()
-                    .Where(c => c != null)
-                    .Select(c => c.GetType().Name)
-                    .ToArray(),
-                children = children
-            };
+                if (!int.TryParse(maxDepth, out int depth) || depth < 0)
+                {
+                    error = "max_depth must be a non-negative integer";
+                    return projection;
+                }
+                projection.MaxDepth = depth;
+            }
+
+            string fields = request.QueryString?["fields"];
+            if (!string.IsNullOrEmpty(fields))
+            {
+                var unknown = new List<string>();
+                projection.Fields = HierarchyFields.None;
+                projection.HasFields = true;
+                foreach (string part in fields.Split(','))
+                {
+                    string name = part.Trim();
+                    if (name.Length == 0) continue;
+                    int index = Array.FindIndex(FieldNames, f => f.name == name);
+                    if (index < 0)
+                    {
+                        unknown.Add(name);
+                        continue;
+                    }
+                    projection.Fields |= FieldNames[index].field;
+                }
+                if (unknown.Count > 0)
+                {
+                    error = $"Unknown fields: {string.Join(", ", unknown)}";
+                }
+                else if (projection.Fields == HierarchyFields.None)
+                {
+                    // Only separators: same as no fields parameter
+                    projection.Fields = HierarchyFields.Default;
+                    projection.HasFields = false;
+                }
+            }
+
+            return projection;
+        }
+
+        // Exact path first (transform.Find, then the first exact match in hierarchy order for duplicate names),
+        // otherwise the first object whose path contains the text, ignoring case - the same rule the client used locally
+        private static GameObject FindStart(Scene scene, string fromPath)
+        {
+            GameObject exact = GameObjectUtilities.FindGameObjectByPath(fromPath);
+            if (exact != null)
+            {
+                return exact;
+            }
+
+            GameObject contains = null;
+            var stack = new Stack<KeyValuePair<Transform, string>>();
+            var roots = scene.GetRootGameObjects();
+            for (int i = roots.Length - 1; i >= 0; i--)
+            {
+                stack.Push(new KeyValuePair<Transform, string>(roots[i].transform, null));
+            }
+
+            while (stack.Count > 0)
+            {
+                var entry = stack.Pop();
+                Transform transform = entry.Key;
+                string path = entry.Value == null ? transform.name : entry.Value + "/" + transform.name;
+                if (path == fromPath)
+                {
+                    return transform.gameObject;
+                }
+                if (contains == null && path.IndexOf(fromPath, StringComparison.OrdinalIgnoreCase) >= 0)
+                {
+                    contains = transform.gameObject;
+                }
+                for (int i = transform.childCount - 1; i >= 0; i--)
+                {
+                    stack.Push(new KeyValuePair<Transform, string>(transform.GetChild(i), path));
+                }
+            }
+
+            return contains;
         }
 
-        private static string GetGameObjectPath(GameObject go)
+        private static void WriteProjectionInfo(JsonWriter writer, string fromPath, Projection projection)
         {
-            if (go.transform.parent == null)
-                return go.name;
-            return GetGameObjectPath(go.transform.parent.gameObject) + "/" + go.name;
+            if (fromPath != null)
+            {
+                writer.WritePropertyName("fromPath");
+                writer.WriteValue(fromPath);
+            }
+            if (projection.IsProjected)
+            {
+                writer.WritePropertyName("projected");
+                writer.WriteValue(true);
+            }
         }
 
-        private static int CountTotalObjects(object[] rootObjects)
+        // Writes the hierarchy with an explicit stack instead of recursion: the parent path is passed down
+        // and objects are counted in the same pass, so deep hierarchies cost O(n) and cannot overflow the stack
+        private static int WriteGameObjects(JsonWriter writer, GameObject[] rootObjects, string basePath, Projection projection)
         {
-            int count = rootObjects.Length;
-            foreach (dynamic obj in rootObjects)
+            int count = 0;
+            var stack = new Stack<SiblingList>();
+
+            writer.WriteStartArray();
+            stack.Push(new SiblingList(rootObjects, null, basePath, 0));
+
+            while (stack.Count > 0)
             {
-                if (obj.children != null)
+                var siblings = stack.Peek();
+                if (siblings.Next >= siblings.Count)
+                {
+                    stack.Pop();
+                    writer.WriteEndArray();
+                    if (stack.Count > 0)
+                    {
+                        // Closes the object that owns this children array
+                        writer.WriteEndObject();
+                    }
+                    continue;
+                }
+
+                var go = siblings.Get(siblings.Next++);
+                string path = siblings.ParentPath == null ? go.name : siblings.ParentPath + "/" + go.name;
+                count++;
+
+                writer.WriteStartObject();
+                WriteFields(writer, go, path, projection);
+
+                Transform transform = go.transform;
+                if (projection.IsTruncated(siblings.Depth))
                 {
-                    count += CountTotalObjects(obj.children);
+                    // Children beyond max_depth are not walked, only counted
+                    if (transform.childCount > 0)
+                    {
+                        writer.WritePropertyName("childCount");
+                        writer.WriteValue(transform.childCount);
+                    }
+                    writer.WritePropertyName("children");
+                    writer.WriteStartArray();
+                    writer.WriteEndArray();
+                    writer.WriteEndObject();
+                    continue;
                 }
+
+                writer.WritePropertyName("children");
+                writer.WriteStartArray();
+
+                stack.Push(new SiblingList(null, transform, path, siblings.Depth + 1));
             }
+
             return count;
         }
+
+        private static void WriteFields(JsonWriter writer, GameObject go, string path, Projection projection)
+        {
+            if (projection.Includes(HierarchyFields.Name))
+            {
+                writer.WritePropertyName("name");
+                writer.WriteValue(go.name);
+            }
+            if (projection.Includes(HierarchyFields.Path))
+            {
+                writer.WritePropertyName("path");
+                writer.WriteValue(path);
+            }
+            if (projection.Includes(HierarchyFields.InstanceId))
+            {
+                writer.WritePropertyName("instanceId");
+                writer.WriteValue(go.GetInstanceID());
+            }
+            if (projection.Includes(HierarchyFields.Active))
+            {
+                writer.WritePropertyName("active");
+                writer.WriteValue(go.activeInHierarchy);
+            }
+            if (projection.Includes(HierarchyFields.Tag))
+            {
+                writer.WritePropertyName("tag");
+                writer.WriteValue(go.tag);
+            }
+            if (projection.Includes(HierarchyFields.Layer))
+            {
+                writer.WritePropertyName("layer");
+                writer.WriteValue(go.layer);
+            }
+
+            Transform transform = go.transform;
+            if (projection.Includes(HierarchyFields.Position))
+            {
+                Vector3 position = transform.position;
+                writer.WritePropertyName("position");
+                WriteVector(writer, position.x, position.y, position.z);
+            }
+            if (projection.Includes(HierarchyFields.Rotation))
+            {
+                Quaternion rotation = transform.rotation;
+                writer.WritePropertyName("rotation");
+                WriteVector(writer, rotation.x, rotation.y, rotation.z, rotation.w);
+            }
+            if (projection.Includes(HierarchyFields.Scale))
+            {
+                Vector3 scale = transform.localScale;
+                writer.WritePropertyName("scale");
+                WriteVector(writer, scale.x, scale.y, scale.z);
+            }
+
+            if (projection.Includes(HierarchyFields.Components))
+            {
+                writer.WritePropertyName("components");
+                writer.WriteStartArray();
+                foreach (var component in go.GetComponents<Component>().Where(c => c != null))
+                {
+                    writer.WriteValue(component.GetType().Name);
+                }
+                writer.WriteEndArray();
+            }
+        }
+
+        private static void WriteVector(JsonWriter writer, float x, float y, float z, float? w = null)
+        {
+            writer.WriteStartObject();
+            writer.WritePropertyName("x");
+            writer.WriteValue(x);
+            writer.WritePropertyName("y");
+            writer.WriteValue(y);
+            writer.WritePropertyName("z");
+            writer.WriteValue(z);
+            if (w.HasValue)
+            {
+                writer.WritePropertyName("w");
+                writer.WriteValue(w.Value);
+            }
+            writer.WriteEndObject();
+        }
+
+        // Columnar form: parallel arrays in preorder, names, tags and component types are indices into a shared
+        // string table. Parents always precede their children, so the client rebuilds paths in one pass.
+        // Columns of fields left out by ?fields= are not written
+        private static string WriteColumnar(Scene scene, GameObject[] roots, string basePath, string fromPath, Projection projection)
+        {
+            var strings = new List<string>();
+            var stringIds = new Dictionary<string, int>();
+            var names = new List<int>();
+            var parents = new List<int>();
+            var instanceIds = projection.Includes(HierarchyFields.InstanceId) ? new List<int>() : null;
+            var active = projection.Includes(HierarchyFields.Active) ? new List<int>() : null;
+            var tags = projection.Includes(HierarchyFields.Tag) ? new List<int>() : null;
+            var layers = projection.Includes(HierarchyFields.Layer) ? new List<int>() : null;
+            var positions = projection.Includes(HierarchyFields.Position) ? new List<float>() : null;
+            var rotations = projection.Includes(HierarchyFields.Rotation) ? new List<float>() : null;
+            var scales = projection.Includes(HierarchyFields.Scale) ? new List<float>() : null;
+            var componentCounts = projection.Includes(HierarchyFields.Components) ? new List<int>() : null;
+            var componentTypes = new List<int>();
+            var childCounts = projection.MaxDepth >= 0 ? new List<int>() : null;
+
+            // (object, parent index, depth)
+            var stack = new Stack<(GameObject go, int parent, int depth)>();
+            for (int i = roots.Length - 1; i >= 0; i--)
+            {
+                stack.Push((roots[i], -1, 0));
+            }
+
+            while (stack.Count > 0)
+            {
+                var (go, parent, depth) = stack.Pop();
+                int index = names.Count;
+                Transform transform = go.transform;
+
+                names.Add(Intern(go.name, strings, stringIds));
+                parents.Add(parent);
+                instanceIds?.Add(go.GetInstanceID());
+                active?.Add(go.activeInHierarchy ? 1 : 0);
+                tags?.Add(Intern(go.tag, strings, stringIds));
+                layers?.Add(go.layer);
+                if (positions != null)
+                {
+                    Vector3 position = transform.position;
+                    positions.Add(position.x);
+                    positions.Add(position.y);
+                    positions.Add(position.z);
+                }
+                if (rotations != null)
+                {
+                    Quaternion rotation = transform.rotation;
+                    rotations.Add(rotation.x);
+                    rotations.Add(rotation.y);
+                    rotations.Add(rotation.z);
+                    rotations.Add(rotation.w);
+                }
+                if (scales != null)
+                {
+                    Vector3 scale = transform.localScale;
+                    scales.Add(scale.x);
+                    scales.Add(scale.y);
+                    scales.Add(scale.z);
+                }
+
+                if (componentCounts != null)
+                {
+                    int count = 0;
+                    foreach (var component in go.GetComponents<Component>())
+                    {
+                        if (component == null) continue;
+                        componentTypes.Add(Intern(component.GetType().Name, strings, stringIds));
+                        count++;
+                    }
+                    componentCounts.Add(count);
+                }
+
+                childCounts?.Add(transform.childCount);
+                if (projection.IsTruncated(depth))
+                {
+                    continue;
+                }
+                for (int i = transform.childCount - 1; i >= 0; i--)
+                {
+                    stack.Push((transform.GetChild(i).gameObject, index, depth + 1));
+                }
+            }
+
+            var response = new Dictionary<string, object>
+            {
+                ["format"] = ColumnarFormat,
+                ["sceneName"] = scene.name,
+                ["scenePath"] = scene.path,
+                ["totalObjects"] = names.Count,
+                ["strings"] = strings,
+                ["name"] = names,
+                ["parent"] = parents
+            };
+            if (instanceIds != null) response["instanceId"] = instanceIds;
+            if (active != null) response["active"] = active;
+            if (tags != null) response["tag"] = tags;
+            if (layers != null) response["layer"] = layers;
+            if (positions != null) response["position"] = positions;
+            if (rotations != null) response["rotation"] = rotations;
+            if (scales != null) response["scale"] = scales;
+            if (componentCounts != null)
+            {
+                response["componentCount"] = componentCounts;
+                response["componentTypes"] = componentTypes;
+            }
+            if (childCounts != null) response["childCount"] = childCounts;
+            if (projection.HasFields)
+            {
+                response["fields"] = FieldNames.Where(f => projection.Includes(f.field)).Select(f => f.name).ToArray();
+            }
+            if (basePath != null) response["basePath"] = basePath;
+            if (fromPath != null) response["fromPath"] = fromPath;
+            if (projection.IsProjected) response["projected"] = true;
+
+            return JsonConvert.SerializeObject(response);
+        }
+
+        private static int Intern(string value, List<string> strings, Dictionary<string, int> stringIds)
+        {
+            if (!stringIds.TryGetValue(value, out int id))
+            {
+                id = strings.Count;
+                strings.Add(value);
+                stringIds[value] = id;
+            }
+            return id;
+        }
+
+        private sealed class SiblingList
+        {
+            private readonly GameObject[] roots;
+            private readonly Transform parent;
+
+            public readonly string ParentPath;
+            public readonly int Depth;
+            public int Next;
+
+            public SiblingList(GameObject[] roots, Transform parent, string parentPath, int depth)
+            {
+                this.roots = roots;
+                this.parent = parent;
+                ParentPath = parentPath;
+                Depth = depth;
+            }
+
+            public int Count => roots != null ? roots.Length : parent.childCount;
+
+            public GameObject Get(int index)
+            {
+                return roots != null ? roots[index] : parent.GetChild(index).gameObject;
+            }
+        }
     }
 }
\ No newline at end of file
@@ -1,5 +1,4 @@
 using System;
-using System.Net;
 using Newtonsoft.Json;
 using UnityEngine;
 
@@ -7,18 +6,19 @@ namespace SceneAPI.Modules
 {
     public static class ModifyComponentModule
     {
-        public static string Execute(HttpListenerContext context)
+        public static string Execute(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string objectPath = data?.path;
+                int? instanceId = (int?)data?.instanceId;
                 string componentType = data?.componentType;
                 var properties = data?.properties;
                 
-                if (string.IsNullOrEmpty(objectPath) || string.IsNullOrEmpty(componentType))
+                if ((string.IsNullOrEmpty(objectPath) && !instanceId.HasValue) || string.IsNullOrEmpty(componentType))
                 {
                     return JsonConvert.SerializeObject(new 
                     { 
@@ -27,15 +27,19 @@ namespace SceneAPI.Modules
                     });
                 }
 
-                GameObject obj = GameObjectUtilities.FindGameObjectByPath(objectPath);
+                GameObject obj = GameObjectUtilities.ResolveGameObject(objectPath, instanceId, out string resolveError);
                 if (obj == null)
                 {
                     return JsonConvert.SerializeObject(new 
                     { 
                         success = false, 
-                        error = "Object not found" 
+                        error = resolveError 
                     });
                 }
+                if (instanceId.HasValue)
+                {
+                    objectPath = GameObjectUtilities.GetPath(obj.transform);
+                }
 
                 Component component = obj.GetComponent(componentType);
                 if (component == null)
@@ -65,13 +69,5 @@ namespace SceneAPI.Modules
                 });
             }
         }
-
-        private static string GetRequestBody(HttpListenerContext context)
-        {
-            using (var reader = new System.IO.StreamReader(context.Request.InputStream))
-            {
-                return reader.ReadToEnd();
-            }
-        }
     }
 }
\ No newline at end of file
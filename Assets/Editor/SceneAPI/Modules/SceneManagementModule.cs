@@ -1,7 +1,5 @@
 using System;
-using System.IO;
 using System.Linq;
-using System.Net;
 using Newtonsoft.Json;
 using UnityEditor;
 using UnityEditor.SceneManagement;
@@ -10,11 +8,11 @@ namespace SceneAPI.Modules
 {
     public static class SceneManagementModule
     {
-        public static string OpenScene(HttpListenerContext context)
+        public static string OpenScene(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string scenePath = data?.scenePath;
@@ -82,11 +80,11 @@ namespace SceneAPI.Modules
             }
         }
 
-        public static string AddSceneToBuild(HttpListenerContext context)
+        public static string AddSceneToBuild(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string scenePath = data?.scenePath;
@@ -129,11 +127,11 @@ namespace SceneAPI.Modules
             }
         }
 
-        public static string RemoveSceneFromBuild(HttpListenerContext context)
+        public static string RemoveSceneFromBuild(SceneAPIRequest request)
         {
             try
             {
-                string requestBody = GetRequestBody(context);
+                string requestBody = request.Body;
                 var data = JsonConvert.DeserializeObject<dynamic>(requestBody);
                 
                 string scenePath = data?.scenePath;
@@ -177,13 +175,5 @@ namespace SceneAPI.Modules
                 });
             }
         }
-
-        private static string GetRequestBody(HttpListenerContext context)
-        {
-            using (var reader = new StreamReader(context.Request.InputStream))
-            {
-                return reader.ReadToEnd();
-            }
-        }
     }
 }
\ No newline at end of file
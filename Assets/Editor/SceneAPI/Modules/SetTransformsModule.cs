@@ -0,0 +1,154 @@
+using System;
+using System.Collections.Generic;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace SceneAPI.Modules
+{
+    public static class SetTransformsModule
+    {
+        public const string PackedEncoding = "base64-f32";
+
+        // Body: {"targets": [path or instanceId, ...], "space": "world"|"local", "encoding": "base64-f32"|"json",
+        //        "positions": n*3 floats, "rotations": n*4, "scales": n*3} - row i belongs to targets[i]
+        public static string Execute(SceneAPIRequest request)
+        {
+            try
+            {
+                JObject data = string.IsNullOrEmpty(request.Body) ? null : JObject.Parse(request.Body);
+                JArray targets = data?["targets"] as JArray;
+
+                if (targets == null || targets.Count == 0)
+                {
+                    return JsonConvert.SerializeObject(new { success = false, error = "Targets array is required" });
+                }
+
+                string space = (string)data["space"] ?? "world";
+                if (space != "world" && space != "local")
+                {
+                    return JsonConvert.SerializeObject(new { success = false, error = $"Unknown space: {space}" });
+                }
+                bool local = space == "local";
+                bool packed = ((string)data["encoding"] ?? "json") == PackedEncoding;
+
+                float[] positions = ReadFloats(data["positions"], packed, targets.Count, 3, "positions", out string error);
+                float[] rotations = error == null ? ReadFloats(data["rotations"], packed, targets.Count, 4, "rotations", out error) : null;
+                float[] scales = error == null ? ReadFloats(data["scales"], packed, targets.Count, 3, "scales", out error) : null;
+                if (error != null)
+                {
+                    return JsonConvert.SerializeObject(new { success = false, error = error });
+                }
+
+                // Every object is resolved once, recorded for Undo in one call and written through Transform directly
+                var missing = new List<int>();
+                var resolved = new Transform[targets.Count];
+                var recorded = new List<UnityEngine.Object>(targets.Count);
+                for (int i = 0; i < targets.Count; i++)
+                {
+                    resolved[i] = ResolveTarget(targets[i]);
+                    if (resolved[i] == null)
+                    {
+                        missing.Add(i);
+                        continue;
+                    }
+                    recorded.Add(resolved[i]);
+                }
+                if (recorded.Count > 0)
+                {
+                    Undo.RecordObjects(recorded.ToArray(), "Set Transforms");
+                }
+
+                int applied = 0;
+                var scenes = new List<Scene>();
+                for (int i = 0; i < targets.Count; i++)
+                {
+                    Transform transform = resolved[i];
+                    if (transform == null)
+                    {
+                        continue;
+                    }
+
+                    if (positions != null)
+                    {
+                        var position = new Vector3(positions[3 * i], positions[3 * i + 1], positions[3 * i + 2]);
+                        if (local) transform.localPosition = position;
+                        else transform.position = position;
+                    }
+                    if (rotations != null)
+                    {
+                        var rotation = new Quaternion(rotations[4 * i], rotations[4 * i + 1], rotations[4 * i + 2], rotations[4 * i + 3]);
+                        if (local) transform.localRotation = rotation;
+                        else transform.rotation = rotation;
+                    }
+                    if (scales != null)
+                    {
+                        transform.localScale = new Vector3(scales[3 * i], scales[3 * i + 1], scales[3 * i + 2]);
+                    }
+                    applied++;
+                    if (!scenes.Contains(transform.gameObject.scene))
+                    {
+                        scenes.Add(transform.gameObject.scene);
+                    }
+                }
+
+                // Without this the moves are not saved with the scene (play mode changes are never saved)
+                if (applied > 0 && !EditorApplication.isPlaying)
+                {
+                    foreach (Scene scene in scenes)
+                    {
+                        EditorSceneManager.MarkSceneDirty(scene);
+                    }
+                }
+
+                return JsonConvert.SerializeObject(new
+                {
+                    success = true,
+                    applied = applied,
+                    missing = missing,
+                    message = $"Transforms set: {applied} of {targets.Count}"
+                });
+            }
+            catch (Exception ex)
+            {
+                return JsonConvert.SerializeObject(new { success = false, error = $"Error setting transforms: {ex.Message}" });
+            }
+        }
+
+        private static Transform ResolveTarget(JToken target)
+        {
+            int? instanceId = target.Type == JTokenType.Integer ? (int)target : (int?)null;
+            GameObject found = GameObjectUtilities.ResolveGameObject(instanceId.HasValue ? null : (string)target, instanceId, out _);
+            return found != null ? found.transform : null;
+        }
+
+        private static float[] ReadFloats(JToken token, bool packed, int count, int width, string name, out string error)
+        {
+            error = null;
+            if (token == null || token.Type == JTokenType.Null) return null;
+
+            float[] values;
+            if (packed)
+            {
+                // Clients pack little-endian float32, the byte order of every editor platform
+                byte[] bytes = Convert.FromBase64String((string)token);
+                values = new float[bytes.Length / sizeof(float)];
+                Buffer.BlockCopy(bytes, 0, values, 0, values.Length * sizeof(float));
+            }
+            else
+            {
+                values = token.ToObject<float[]>();
+            }
+
+            if (values.Length != count * width)
+            {
+                error = $"{name} must contain {count} rows of {width} values, got {values.Length} values";
+                return null;
+            }
+            return values;
+        }
+    }
+}
\ No newline at end of file
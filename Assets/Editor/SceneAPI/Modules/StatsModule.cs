@@ -0,0 +1,14 @@
+using Newtonsoft.Json;
+
+namespace SceneAPI.Modules
+{
+    public static class StatsModule
+    {
+        // Dispatcher queue depth, wait and execution times per priority; the server answers it
+        // on the listener thread, so it stays responsive while the main thread is busy
+        public static string Execute()
+        {
+            return JsonConvert.SerializeObject(MainThreadDispatcher.GetStats());
+        }
+    }
+}
\ No newline at end of file
@@ -1,33 +1,99 @@
-using System.Net;
+using System.Collections.Generic;
 using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
 using SceneAPI.Modules;
 
 namespace SceneAPI
 {
     public class SceneAPIHandler
     {
+        // Routes that change the scene. POST /batch is not one: its sub-requests come through HandleRequest themselves
+        private static readonly HashSet<string> MutatingRoutes = new HashSet<string>
+        {
+            "POST /scene/open",
+            "POST /objects/create",
+            "POST /objects/create/bulk",
+            "DELETE /objects/delete",
+            "POST /objects/transforms",
+            "POST /objects/components/add",
+            "PUT /objects/components/modify",
+            "DELETE /objects/components/remove"
+        };
+
         public SceneAPIHandler()
         {
         }
 
-        public string HandleRequest(string method, string path, HttpListenerContext context)
+        public string HandleRequest(SceneAPIRequest request)
+        {
+            string response = Route(request);
+
+            // Editor change events arrive on a later update; bump now so the next GET /scene
+            // (possibly in the same batch) never revalidates against a pre-mutation version.
+            // Rejected and failed requests leave the version, and the ETag of GET /scene, as they were
+            if (MutatingRoutes.Contains($"{request.Method} {request.Path}") && ChangedScene(response))
+            {
+                SceneVersion.Bump();
+            }
+
+            return response;
+        }
+
+        // Success response that applied at least one change (bulk create and set transforms report their counts)
+        private static bool ChangedScene(string response)
+        {
+            try
+            {
+                JObject result = JObject.Parse(response);
+                if (result.Value<bool?>("success") != true) return false;
+                int? count = result.Value<int?>("created") ?? result.Value<int?>("applied");
+                return count == null || count > 0;
+            }
+            catch (JsonException)
+            {
+                return false;
+            }
+        }
+
+        // Cheap reads run before mutations, full scene dumps and bulk work run last
+        public static DispatchPriority GetPriority(SceneAPIRequest request)
+        {
+            switch ($"{request.Method} {request.Path}")
+            {
+                case "GET /scene":
+                case "POST /batch":
+                case "POST /objects/create/bulk":
+                    return DispatchPriority.Low;
+            }
+            return request.Method == "GET" ? DispatchPriority.High : DispatchPriority.Normal;
+        }
+
+        private string Route(SceneAPIRequest request)
         {
-            return $"{method} {path}" switch
+            return $"{request.Method} {request.Path}" switch
             {
+                // Service endpoints
+                "GET /capabilities" => CapabilitiesModule.Execute(),
+                "GET /stats" => StatsModule.Execute(),
+                "POST /batch" => BatchModule.Execute(request, this),
                 // Scene endpoints
-                "GET /scene" => GetHierarchyModule.Execute(),
-                "POST /scene/open" => SceneManagementModule.OpenScene(context),
+                "GET /scene" => GetHierarchyModule.Execute(request),
+                "GET /scene/changes" => SceneChangeLog.GetChanges(request),
+                "POST /scene/open" => SceneManagementModule.OpenScene(request),
                 "GET /build/scenes" => SceneManagementModule.GetBuildScenes(),
-                "POST /build/scenes/add" => SceneManagementModule.AddSceneToBuild(context),
-                "DELETE /build/scenes/remove" => SceneManagementModule.RemoveSceneFromBuild(context),
+                "POST /build/scenes/add" => SceneManagementModule.AddSceneToBuild(request),
+                "DELETE /build/scenes/remove" => SceneManagementModule.RemoveSceneFromBuild(request),
                 // GameObject endpoints
-                "POST /objects/create" => CreateObjectModule.Execute(context),
-                "DELETE /objects/delete" => DeleteObjectModule.Execute(context),
+                "POST /objects/create" => CreateObjectModule.Execute(request),
+                "POST /objects/create/bulk" => CreateObjectsModule.Execute(request),
+                "DELETE /objects/delete" => DeleteObjectModule.Execute(request),
+                "GET /objects/find" => FindObjectsModule.Execute(request),
+                "POST /objects/transforms" => SetTransformsModule.Execute(request),
                 // Component endpoints
-                "GET /objects/components" => GetComponentsModule.Execute(context),
-                "POST /objects/components/add" => AddComponentModule.Execute(context),
-                "PUT /objects/components/modify" => ModifyComponentModule.Execute(context),
-                "DELETE /objects/components/remove" => RemoveComponentModule.Execute(context),
+                "GET /objects/components" => GetComponentsModule.Execute(request),
+                "POST /objects/components/add" => AddComponentModule.Execute(request),
+                "PUT /objects/components/modify" => ModifyComponentModule.Execute(request),
+                "DELETE /objects/components/remove" => RemoveComponentModule.Execute(request),
                 _ => JsonConvert.SerializeObject(new { error = "Endpoint not found" }),
             };
         }
@@ -0,0 +1,69 @@
+using System.Collections.Specialized;
+using System.IO;
+using System.Net;
+using Newtonsoft.Json.Linq;
+
+namespace SceneAPI
+{
+    public class SceneAPIRequest
+    {
+        public string Method { get; private set; }
+        public string Path { get; private set; }
+        public NameValueCollection QueryString { get; private set; }
+        public NameValueCollection Headers { get; private set; }
+        public string Body { get; private set; }
+
+        public int StatusCode { get; set; } = 200;
+        public NameValueCollection ResponseHeaders { get; } = new NameValueCollection();
+
+        // Read on the listener thread so the main thread never blocks on the network
+        public static SceneAPIRequest FromContext(HttpListenerContext context)
+        {
+            string body = "";
+            if (context.Request.HasEntityBody)
+            {
+                using (var reader = new StreamReader(context.Request.InputStream, context.Request.ContentEncoding))
+                {
+                    body = reader.ReadToEnd();
+                }
+            }
+
+            return new SceneAPIRequest
+            {
+                Method = context.Request.HttpMethod,
+                Path = context.Request.Url.AbsolutePath,
+                QueryString = context.Request.QueryString,
+                Headers = context.Request.Headers,
+                Body = body
+            };
+        }
+
+        // Batch entry format: {"method": "GET", "path": "/objects/components", "query": {...}, "headers": {...}, "body": {...}}
+        public static SceneAPIRequest FromBatchEntry(JObject entry)
+        {
+            JToken body = entry["body"];
+
+            return new SceneAPIRequest
+            {
+                Method = ((string)entry["method"] ?? "GET").ToUpperInvariant(),
+                Path = (string)entry["path"] ?? "",
+                QueryString = ToCollection(entry["query"] as JObject),
+                Headers = ToCollection(entry["headers"] as JObject),
+                Body = body == null || body.Type == JTokenType.Null ? "" : body.ToString(Newtonsoft.Json.Formatting.None)
+            };
+        }
+
+        private static NameValueCollection ToCollection(JObject values)
+        {
+            var collection = new NameValueCollection();
+            if (values == null) return collection;
+
+            foreach (var pair in values)
+            {
+                if (pair.Value == null || pair.Value.Type == JTokenType.Null) continue;
+                collection[pair.Key] = pair.Value.Type == JTokenType.String ? (string)pair.Value : pair.Value.ToString(Newtonsoft.Json.Formatting.None);
+            }
+            return collection;
+        }
+    }
+}
\ No newline at end of file
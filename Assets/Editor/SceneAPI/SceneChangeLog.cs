@@ -0,0 +1,620 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace SceneAPI
+{
+    // Change feed of the active scene for GET /scene/changes.
+    // Changes are found by diffing per-object state against the previous state. Only objects reported dirty are
+    // diffed (with their children and parents): ObjectChangeEvents cover inspector and Undo-recorded edits, API
+    // modules call MarkDirty. The whole scene is scanned for the first build, for another scene and after a change
+    // no object was reported for (undo/redo, ChangeScene, hierarchyChanged with no marks since the previous one).
+    // Every event carries absolute state, so applying an event twice is harmless.
+    public static class SceneChangeLog
+    {
+        public const int Capacity = 10000;
+
+        private sealed class NodeState
+        {
+            public string Name;
+            public int ParentId;
+            public bool Active;
+            public string[] Components;
+        }
+
+        private static Dictionary<int, NodeState> states;
+        // Parent instance id (0 for scene roots) -> ordered child ids
+        private static Dictionary<int, List<int>> children;
+        private static int sceneHandle;
+        // Objects changed since the previous diff, objects whose whole subtree changed, and the full scan request
+        private static readonly HashSet<int> dirty = new HashSet<int>();
+        private static readonly HashSet<int> dirtySubtrees = new HashSet<int>();
+        private static bool rescan;
+        private static int marksSinceHierarchyChange;
+        private static bool isInitialized = false;
+        // Changes at or below this version are no longer in the buffer; older cursors must resync
+        private static long floor = long.MaxValue;
+        private static readonly Queue<JObject> entries = new Queue<JObject>();
+
+        public static void Initialize()
+        {
+            if (!isInitialized)
+            {
+                ObjectChangeEvents.changesPublished += OnChangesPublished;
+                EditorApplication.hierarchyChanged += OnHierarchyChanged;
+                Undo.undoRedoPerformed += Rescan;
+                EditorSceneManager.sceneOpened += OnSceneOpened;
+                EditorApplication.playModeStateChanged += OnPlayModeStateChanged;
+                isInitialized = true;
+            }
+            Reset();
+        }
+
+        public static void Cleanup()
+        {
+            if (isInitialized)
+            {
+                ObjectChangeEvents.changesPublished -= OnChangesPublished;
+                EditorApplication.hierarchyChanged -= OnHierarchyChanged;
+                Undo.undoRedoPerformed -= Rescan;
+                EditorSceneManager.sceneOpened -= OnSceneOpened;
+                EditorApplication.playModeStateChanged -= OnPlayModeStateChanged;
+                isInitialized = false;
+            }
+            Reset();
+        }
+
+        public static void Reset()
+        {
+            states = null;
+            children = null;
+            floor = long.MaxValue;
+            entries.Clear();
+            dirty.Clear();
+            dirtySubtrees.Clear();
+            rescan = false;
+        }
+
+        // An object whose name, parent, active state, components or children may have changed (also a destroyed one)
+        public static void MarkDirty(GameObject go)
+        {
+            MarkDirty(go.GetInstanceID());
+        }
+
+        public static void MarkDirty(int instanceId)
+        {
+            dirty.Add(instanceId);
+            marksSinceHierarchyChange++;
+        }
+
+        // A change with no known objects: the next request diffs the whole scene
+        public static void Rescan()
+        {
+            rescan = true;
+        }
+
+        public static string GetChanges(SceneAPIRequest request)
+        {
+            try
+            {
+                var activeScene = SceneManager.GetActiveScene();
+                if (!activeScene.IsValid())
+                {
+                    return JsonConvert.SerializeObject(new { error = "No active scene found" });
+                }
+
+                Collect(activeScene);
+                long current = SceneVersion.Current;
+                string epoch = request.QueryString?["epoch"];
+
+                if (!long.TryParse(request.QueryString?["since"], out long since)
+                    || (!string.IsNullOrEmpty(epoch) && epoch != SceneVersion.Epoch)
+                    || since < floor || since > current)
+                {
+                    return JsonConvert.SerializeObject(new
+                    {
+                        resync = true,
+                        epoch = SceneVersion.Epoch,
+                        version = current
+                    });
+                }
+
+                var changes = new JArray();
+                foreach (var entry in entries)
+                {
+                    if ((long)entry["version"] > since)
+                    {
+                        changes.Add(entry);
+                    }
+                }
+
+                return JsonConvert.SerializeObject(new
+                {
+                    resync = false,
+                    epoch = SceneVersion.Epoch,
+                    version = current,
+                    changes = changes
+                });
+            }
+            catch (Exception ex)
+            {
+                return JsonConvert.SerializeObject(new { error = $"Error getting scene changes: {ex.Message}" });
+            }
+        }
+
+        private static void Collect(Scene scene)
+        {
+            if (states != null && scene.handle == sceneHandle && !rescan)
+            {
+                if (dirty.Count > 0 || dirtySubtrees.Count > 0)
+                {
+                    Refresh(scene);
+                }
+                return;
+            }
+
+            var newStates = new Dictionary<int, NodeState>();
+            var newChildren = new Dictionary<int, List<int>>();
+            var order = new List<int>();
+            Scan(scene, newStates, newChildren, order);
+
+            if (states == null || scene.handle != sceneHandle)
+            {
+                // First scan or another scene: nothing to diff against, every cursor resyncs
+                entries.Clear();
+                floor = NextVersion();
+            }
+            else
+            {
+                Diff(newStates, newChildren, order);
+            }
+
+            states = newStates;
+            children = newChildren;
+            sceneHandle = scene.handle;
+            dirty.Clear();
+            dirtySubtrees.Clear();
+            rescan = false;
+        }
+
+        private static void Scan(Scene scene, Dictionary<int, NodeState> newStates,
+                                 Dictionary<int, List<int>> newChildren, List<int> order)
+        {
+            var stack = new Stack<GameObject>();
+            var roots = scene.GetRootGameObjects();
+            var rootIds = new List<int>(roots.Length);
+            for (int i = roots.Length - 1; i >= 0; i--)
+            {
+                stack.Push(roots[i]);
+            }
+            foreach (var root in roots)
+            {
+                rootIds.Add(root.GetInstanceID());
+            }
+            newChildren[0] = rootIds;
+
+            while (stack.Count > 0)
+            {
+                var go = stack.Pop();
+                int id = go.GetInstanceID();
+                Transform transform = go.transform;
+
+                newStates[id] = Capture(go);
+                order.Add(id);
+
+                int childCount = transform.childCount;
+                if (childCount > 0)
+                {
+                    var ids = new List<int>(childCount);
+                    for (int i = 0; i < childCount; i++)
+                    {
+                        ids.Add(transform.GetChild(i).gameObject.GetInstanceID());
+                    }
+                    newChildren[id] = ids;
+                    for (int i = childCount - 1; i >= 0; i--)
+                    {
+                        stack.Push(transform.GetChild(i).gameObject);
+                    }
+                }
+            }
+        }
+
+        private static void Diff(Dictionary<int, NodeState> newStates, Dictionary<int, List<int>> newChildren, List<int> order)
+        {
+            var events = new List<JObject>();
+
+            // Created objects in hierarchy order, so parents precede their children
+            foreach (int id in order)
+            {
+                NodeState state = newStates[id];
+                if (states.TryGetValue(id, out NodeState old))
+                {
+                    AddChanges(events, id, old, state);
+                }
+                else
+                {
+                    events.Add(Created(id, state));
+                }
+            }
+
+            // Child order of every parent whose child list changed (membership or order)
+            foreach (var pair in newChildren)
+            {
+                if (!children.TryGetValue(pair.Key, out List<int> oldIds) || !oldIds.SequenceEqual(pair.Value))
+                {
+                    events.Add(new JObject { ["type"] = "reordered", ["id"] = pair.Key, ["children"] = new JArray(pair.Value) });
+                }
+            }
+            foreach (var pair in children)
+            {
+                if (!newChildren.ContainsKey(pair.Key) && (pair.Key == 0 || newStates.ContainsKey(pair.Key)))
+                {
+                    events.Add(new JObject { ["type"] = "reordered", ["id"] = pair.Key, ["children"] = new JArray() });
+                }
+            }
+
+            foreach (int id in states.Keys)
+            {
+                if (!newStates.ContainsKey(id))
+                {
+                    events.Add(new JObject { ["type"] = "destroyed", ["id"] = id });
+                }
+            }
+
+            Publish(events);
+        }
+
+        // Diffs only the dirty objects; events come in the same order as from Diff
+        private static void Refresh(Scene scene)
+        {
+            var marked = new List<int>(dirty);
+            dirty.Clear();
+            foreach (int id in dirtySubtrees)
+            {
+                GameObject root = FindInScene(id, scene);
+                if (root == null)
+                {
+                    marked.Add(id);
+                    continue;
+                }
+                foreach (Transform transform in root.GetComponentsInChildren<Transform>(true))
+                {
+                    marked.Add(transform.gameObject.GetInstanceID());
+                }
+            }
+            dirtySubtrees.Clear();
+
+            var events = new List<JObject>();
+            var destroyed = new List<JObject>();
+            // Parents whose child list may have changed (0 for scene roots)
+            var parents = new HashSet<int>();
+            foreach (int id in marked)
+            {
+                if (id == 0)
+                {
+                    parents.Add(0);
+                    continue;
+                }
+                GameObject go = FindInScene(id, scene);
+                if (go == null)
+                {
+                    Remove(scene, id, events, destroyed, parents);
+                }
+                else
+                {
+                    Update(go, events, parents);
+                }
+            }
+
+            var reordered = new List<JObject>();
+            while (parents.Count > 0)
+            {
+                int parentId = parents.First();
+                parents.Remove(parentId);
+
+                var objects = new List<GameObject>();
+                if (parentId == 0)
+                {
+                    objects.AddRange(scene.GetRootGameObjects());
+                }
+                else
+                {
+                    GameObject parent = FindInScene(parentId, scene);
+                    if (parent == null || !states.ContainsKey(parentId))
+                    {
+                        continue;
+                    }
+                    Transform transform = parent.transform;
+                    for (int i = 0; i < transform.childCount; i++)
+                    {
+                        objects.Add(transform.GetChild(i).gameObject);
+                    }
+                }
+
+                var ids = objects.Select(o => o.GetInstanceID()).ToList();
+                children.TryGetValue(parentId, out List<int> oldIds);
+                if (oldIds != null ? oldIds.SequenceEqual(ids) : ids.Count == 0)
+                {
+                    continue;
+                }
+
+                // Children moved away or destroyed without being reported are found by comparing the lists
+                if (oldIds != null)
+                {
+                    var current = new HashSet<int>(ids);
+                    foreach (int childId in oldIds)
+                    {
+                        if (current.Contains(childId)) continue;
+                        GameObject child = FindInScene(childId, scene);
+                        if (child == null)
+                        {
+                            Remove(scene, childId, events, destroyed, parents);
+                        }
+                        else
+                        {
+                            Update(child, events, parents);
+                        }
+                    }
+                }
+                foreach (var child in objects)
+                {
+                    if (!states.TryGetValue(child.GetInstanceID(), out NodeState state) || state.ParentId != parentId)
+                    {
+                        Update(child, events, parents);
+                    }
+                }
+
+                if (ids.Count > 0 || parentId == 0)
+                {
+                    children[parentId] = ids;
+                }
+                else
+                {
+                    children.Remove(parentId);
+                }
+                reordered.Add(new JObject { ["type"] = "reordered", ["id"] = parentId, ["children"] = new JArray(ids) });
+            }
+
+            events.AddRange(reordered);
+            events.AddRange(destroyed);
+            Publish(events);
+        }
+
+        // Diffs one object; a new object is added together with its subtree
+        private static void Update(GameObject go, List<JObject> events, HashSet<int> parents)
+        {
+            // Start from the topmost new ancestor, so parents precede their children in the feed
+            Transform top = go.transform;
+            while (top.parent != null && !states.ContainsKey(top.parent.gameObject.GetInstanceID()))
+            {
+                top = top.parent;
+            }
+
+            var stack = new Stack<Transform>();
+            stack.Push(top);
+            while (stack.Count > 0)
+            {
+                Transform transform = stack.Pop();
+                int id = transform.gameObject.GetInstanceID();
+                NodeState state = Capture(transform.gameObject);
+                bool descend;
+                if (states.TryGetValue(id, out NodeState old))
+                {
+                    AddChanges(events, id, old, state);
+                    parents.Add(old.ParentId);
+                    // activeInHierarchy of the descendants follows this object
+                    descend = old.Active != state.Active;
+                }
+                else
+                {
+                    events.Add(Created(id, state));
+                    descend = true;
+                }
+                states[id] = state;
+                parents.Add(state.ParentId);
+                parents.Add(id);
+
+                if (descend)
+                {
+                    for (int i = transform.childCount - 1; i >= 0; i--)
+                    {
+                        stack.Push(transform.GetChild(i));
+                    }
+                }
+            }
+        }
+
+        // Drops a destroyed object and its subtree; descendants moved out before the destroy are diffed instead
+        private static void Remove(Scene scene, int id, List<JObject> events, List<JObject> destroyed, HashSet<int> parents)
+        {
+            if (!states.TryGetValue(id, out NodeState old))
+            {
+                return;
+            }
+            parents.Add(old.ParentId);
+
+            var stack = new Stack<int>();
+            stack.Push(id);
+            while (stack.Count > 0)
+            {
+                int current = stack.Pop();
+                GameObject go = current != id ? FindInScene(current, scene) : null;
+                if (go != null)
+                {
+                    Update(go, events, parents);
+                    continue;
+                }
+                if (!states.Remove(current))
+                {
+                    continue;
+                }
+                if (children.TryGetValue(current, out List<int> ids))
+                {
+                    children.Remove(current);
+                    foreach (int childId in ids)
+                    {
+                        stack.Push(childId);
+                    }
+                }
+                destroyed.Add(new JObject { ["type"] = "destroyed", ["id"] = current });
+            }
+        }
+
+        private static void Publish(List<JObject> events)
+        {
+            if (events.Count == 0)
+            {
+                return;
+            }
+
+            // A fresh version above anything already handed out, so no cursor can skip these events
+            long version = NextVersion();
+            foreach (var entry in events)
+            {
+                entry["version"] = version;
+                entries.Enqueue(entry);
+            }
+            while (entries.Count > Capacity)
+            {
+                floor = Math.Max(floor, (long)entries.Dequeue()["version"]);
+            }
+        }
+
+        private static long NextVersion()
+        {
+            SceneVersion.Bump();
+            return SceneVersion.Current;
+        }
+
+        private static NodeState Capture(GameObject go)
+        {
+            Transform parent = go.transform.parent;
+            return new NodeState
+            {
+                Name = go.name,
+                ParentId = parent != null ? parent.gameObject.GetInstanceID() : 0,
+                Active = go.activeInHierarchy,
+                Components = go.GetComponents<Component>().Where(c => c != null).Select(c => c.GetType().Name).ToArray()
+            };
+        }
+
+        private static JObject Created(int id, NodeState state)
+        {
+            return new JObject
+            {
+                ["type"] = "created",
+                ["id"] = id,
+                ["parentId"] = state.ParentId,
+                ["name"] = state.Name,
+                ["active"] = state.Active,
+                ["components"] = new JArray(state.Components)
+            };
+        }
+
+        private static void AddChanges(List<JObject> events, int id, NodeState old, NodeState state)
+        {
+            if (old.ParentId != state.ParentId)
+            {
+                events.Add(new JObject { ["type"] = "reparented", ["id"] = id, ["parentId"] = state.ParentId, ["previousParentId"] = old.ParentId });
+            }
+            if (old.Name != state.Name)
+            {
+                events.Add(new JObject { ["type"] = "renamed", ["id"] = id, ["name"] = state.Name });
+            }
+            if (old.Active != state.Active)
+            {
+                events.Add(new JObject { ["type"] = "active_changed", ["id"] = id, ["active"] = state.Active });
+            }
+            if (!old.Components.SequenceEqual(state.Components))
+            {
+                events.Add(new JObject { ["type"] = "components_changed", ["id"] = id, ["components"] = new JArray(state.Components) });
+            }
+        }
+
+        // A live object of the given scene, null for destroyed objects and objects of other scenes
+        private static GameObject FindInScene(int instanceId, Scene scene)
+        {
+            var go = EditorUtility.InstanceIDToObject(instanceId) as GameObject;
+            return go != null && go.scene.handle == scene.handle ? go : null;
+        }
+
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            for (int i = 0; i < stream.length; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        MarkDirty(created.instanceId);
+                        break;
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        MarkDirty(destroyed.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var reparented);
+                        MarkDirty(reparented.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                        stream.GetChangeGameObjectStructureEvent(i, out var structure);
+                        MarkDirty(structure.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        // The id may be a component: its GameObject is the one to diff
+                        var target = EditorUtility.InstanceIDToObject(properties.instanceId);
+                        MarkDirty(target is Component component ? component.gameObject.GetInstanceID() : properties.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var hierarchy);
+                        dirtySubtrees.Add(hierarchy.instanceId);
+                        marksSinceHierarchyChange++;
+                        break;
+                    case ObjectChangeKind.UpdatePrefabInstances:
+                        stream.GetUpdatePrefabInstancesEvent(i, out var prefabs);
+                        foreach (int id in prefabs.instanceIds)
+                        {
+                            dirtySubtrees.Add(id);
+                        }
+                        marksSinceHierarchyChange++;
+                        break;
+                    case ObjectChangeKind.CreateAssetObject:
+                    case ObjectChangeKind.DestroyAssetObject:
+                    case ObjectChangeKind.ChangeAssetObjectProperties:
+                        break;
+                    default:
+                        // ChangeScene carries no objects; kinds added by newer Unity versions are not known here
+                        rescan = true;
+                        break;
+                }
+            }
+        }
+
+        // A hierarchy change with nothing reported since the previous one was made by a script without Undo
+        private static void OnHierarchyChanged()
+        {
+            if (marksSinceHierarchyChange == 0)
+            {
+                rescan = true;
+            }
+            marksSinceHierarchyChange = 0;
+        }
+
+        private static void OnSceneOpened(Scene scene, OpenSceneMode mode)
+        {
+            rescan = true;
+        }
+
+        private static void OnPlayModeStateChanged(PlayModeStateChange state)
+        {
+            rescan = true;
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,173 @@
+using System.Collections.Generic;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace SceneAPI
+{
+    // Path -> object and object -> path index of the active scene.
+    // Built lazily by one walk on the first lookup and dropped on every editor hierarchy change, so repeated lookups
+    // between changes are dictionary hits instead of Transform.Find chains. Changes made earlier in the same editor
+    // update (before hierarchyChanged arrives) are caught on lookup: a miss, a destroyed hit or a hit whose path no
+    // longer matches its names is answered by walking.
+    // Only the first object of each name among its siblings is reachable by path, exactly as with Transform.Find.
+    public static class ScenePathIndex
+    {
+        private static Dictionary<string, GameObject> objectsByPath;
+        private static Dictionary<int, string> pathsById;
+        private static int sceneHandle;
+        private static bool isInitialized = false;
+
+        public static int Count => objectsByPath?.Count ?? 0;
+
+        public static void Initialize()
+        {
+            if (!isInitialized)
+            {
+                EditorApplication.hierarchyChanged += Invalidate;
+                Undo.undoRedoPerformed += Invalidate;
+                EditorSceneManager.sceneOpened += OnSceneOpened;
+                EditorSceneManager.activeSceneChangedInEditMode += OnActiveSceneChanged;
+                isInitialized = true;
+            }
+            Invalidate();
+        }
+
+        public static void Cleanup()
+        {
+            if (isInitialized)
+            {
+                EditorApplication.hierarchyChanged -= Invalidate;
+                Undo.undoRedoPerformed -= Invalidate;
+                EditorSceneManager.sceneOpened -= OnSceneOpened;
+                EditorSceneManager.activeSceneChangedInEditMode -= OnActiveSceneChanged;
+                isInitialized = false;
+            }
+            Invalidate();
+        }
+
+        public static void Invalidate()
+        {
+            objectsByPath = null;
+            pathsById = null;
+        }
+
+        public static GameObject Find(string path)
+        {
+            var activeScene = SceneManager.GetActiveScene();
+            if (!activeScene.IsValid()) return null;
+
+            EnsureBuilt(activeScene);
+            if (objectsByPath.TryGetValue(path, out GameObject go) && go != null && go.scene == activeScene && Matches(go.transform, path))
+            {
+                return go;
+            }
+
+            // New objects are appended after existing siblings, so only misses and destroyed hits can be out of date
+            GameObject found = GameObjectUtilities.WalkPath(activeScene, path);
+            if (found != go)
+            {
+                Invalidate();
+            }
+            return found;
+        }
+
+        // Only answers from an already built index: walking up the parents is cheaper than a rebuild
+        public static string GetPath(Transform transform)
+        {
+            var activeScene = SceneManager.GetActiveScene();
+            if (pathsById != null && sceneHandle == activeScene.handle && transform.gameObject.scene == activeScene)
+            {
+                if (pathsById.TryGetValue(transform.gameObject.GetInstanceID(), out string path) && Matches(transform, path))
+                {
+                    return path;
+                }
+            }
+            return null;
+        }
+
+        private static void EnsureBuilt(Scene scene)
+        {
+            if (objectsByPath != null && sceneHandle == scene.handle) return;
+
+            var byPath = new Dictionary<string, GameObject>();
+            var byId = new Dictionary<int, string>();
+            var names = new HashSet<string>();
+
+            // Objects after a same-named sibling (or with '/' in the name) keep their path but are not reachable by it
+            var stack = new Stack<(Transform, string, bool)>();
+            GameObject[] roots = scene.GetRootGameObjects();
+            var level = new (Transform, string, bool)[roots.Length];
+            for (int i = 0; i < roots.Length; i++)
+            {
+                level[i] = (roots[i].transform, roots[i].name, IsReachable(roots[i].name, names));
+            }
+            PushReversed(stack, level);
+
+            while (stack.Count > 0)
+            {
+                var (transform, path, reachable) = stack.Pop();
+                byId[transform.gameObject.GetInstanceID()] = path;
+                if (reachable)
+                {
+                    byPath[path] = transform.gameObject;
+                }
+
+                names.Clear();
+                level = new (Transform, string, bool)[transform.childCount];
+                for (int i = 0; i < level.Length; i++)
+                {
+                    Transform child = transform.GetChild(i);
+                    level[i] = (child, path + "/" + child.name, reachable && IsReachable(child.name, names));
+                }
+                PushReversed(stack, level);
+            }
+
+            objectsByPath = byPath;
+            pathsById = byId;
+            sceneHandle = scene.handle;
+        }
+
+        // An indexed path is current if the object's name and the names of all its ancestors are its segments exactly:
+        // a rename or reparent of the object or an ancestor earlier in the same editor update makes it stale
+        private static bool Matches(Transform transform, string path)
+        {
+            int end = path.Length;
+            for (Transform current = transform; current != null; current = current.parent)
+            {
+                string name = current.name;
+                int start = end - name.Length;
+                if (start < 0 || string.CompareOrdinal(path, start, name, 0, name.Length) != 0) return false;
+                if (current.parent == null) return start == 0;
+                if (start == 0 || path[start - 1] != '/') return false;
+                end = start - 1;
+            }
+            return false;
+        }
+
+        // Siblings are checked in hierarchy order, so the first of several same-named objects wins
+        private static bool IsReachable(string name, HashSet<string> siblingNames)
+        {
+            return name.IndexOf('/') < 0 && siblingNames.Add(name);
+        }
+
+        private static void PushReversed(Stack<(Transform, string, bool)> stack, (Transform, string, bool)[] level)
+        {
+            for (int i = level.Length - 1; i >= 0; i--)
+            {
+                stack.Push(level[i]);
+            }
+        }
+
+        private static void OnSceneOpened(Scene scene, OpenSceneMode mode)
+        {
+            Invalidate();
+        }
+
+        private static void OnActiveSceneChanged(Scene previous, Scene current)
+        {
+            Invalidate();
+        }
+    }
+}
\ No newline at end of file
@@ -0,0 +1,99 @@
+using System;
+using System.Threading;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine.SceneManagement;
+
+namespace SceneAPI
+{
+    // Monotonic scene version exposed as the ETag of GET /scene.
+    // Bumped on every editor hierarchy/component/scene change and after every mutating API request.
+    public static class SceneVersion
+    {
+        private static long version = 0;
+        // Random per-initialization prefix: versions restart after a domain reload, old ETags must not match
+        private static string epoch = NewEpoch();
+        private static bool isInitialized = false;
+
+        public static long Current => Interlocked.Read(ref version);
+
+        public static string Epoch => epoch;
+
+        public static string ETag => $"\"{epoch}-{Current}\"";
+
+        public static void Initialize()
+        {
+            if (!isInitialized)
+            {
+                epoch = NewEpoch();
+                EditorApplication.hierarchyChanged += Bump;
+                ObjectChangeEvents.changesPublished += OnChangesPublished;
+                Undo.undoRedoPerformed += Bump;
+                EditorSceneManager.sceneOpened += OnSceneOpened;
+                EditorSceneManager.activeSceneChangedInEditMode += OnActiveSceneChanged;
+                EditorApplication.playModeStateChanged += OnPlayModeStateChanged;
+                isInitialized = true;
+            }
+        }
+
+        public static void Cleanup()
+        {
+            if (isInitialized)
+            {
+                EditorApplication.hierarchyChanged -= Bump;
+                ObjectChangeEvents.changesPublished -= OnChangesPublished;
+                Undo.undoRedoPerformed -= Bump;
+                EditorSceneManager.sceneOpened -= OnSceneOpened;
+                EditorSceneManager.activeSceneChangedInEditMode -= OnActiveSceneChanged;
+                EditorApplication.playModeStateChanged -= OnPlayModeStateChanged;
+                isInitialized = false;
+            }
+        }
+
+        public static void Bump()
+        {
+            Interlocked.Increment(ref version);
+        }
+
+        // If-None-Match may hold a list of tags, weak tags or "*"
+        public static bool Matches(string ifNoneMatch)
+        {
+            if (string.IsNullOrEmpty(ifNoneMatch)) return false;
+
+            string current = ETag;
+            foreach (string part in ifNoneMatch.Split(','))
+            {
+                string tag = part.Trim();
+                if (tag == "*") return true;
+                if (tag.StartsWith("W/")) tag = tag.Substring(2);
+                if (tag == current) return true;
+            }
+            return false;
+        }
+
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            Bump();
+        }
+
+        private static void OnSceneOpened(Scene scene, OpenSceneMode mode)
+        {
+            Bump();
+        }
+
+        private static void OnActiveSceneChanged(Scene previous, Scene current)
+        {
+            Bump();
+        }
+
+        private static void OnPlayModeStateChanged(PlayModeStateChange state)
+        {
+            Bump();
+        }
+
+        private static string NewEpoch()
+        {
+            return Guid.NewGuid().ToString("N").Substring(0, 8);
+        }
+    }
+}
\ No newline at end of file
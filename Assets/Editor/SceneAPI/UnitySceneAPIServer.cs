@@ -1,15 +1,20 @@
 using System;
 using System.IO;
+using System.IO.Compression;
 using System.Net;
 using System.Text;
 using System.Threading;
 using Newtonsoft.Json;
+using SceneAPI.Modules;
 using UnityEngine;
 
 namespace SceneAPI
 {
     public class UnitySceneAPIServer
     {
+        // Smaller bodies are sent as is: gzip overhead outweighs the savings
+        private const int MinCompressedLength = 1024;
+
         private HttpListener httpListener;
         private Thread httpListenerThread;
         private bool isRunning = false;
@@ -28,6 +33,9 @@ namespace SceneAPI
         public bool StartServer()
         {
             MainThreadDispatcher.Initialize();
+            SceneVersion.Initialize();
+            ScenePathIndex.Initialize();
+            SceneChangeLog.Initialize();
 
             try
             {
@@ -81,6 +89,9 @@ namespace SceneAPI
             }
 
             MainThreadDispatcher.Cleanup();
+            SceneVersion.Cleanup();
+            ScenePathIndex.Cleanup();
+            SceneChangeLog.Cleanup();
             Debug.Log("Scene API Server stopped");
         }
 
@@ -116,7 +127,16 @@ namespace SceneAPI
             {
                 HttpListener listener = (HttpListener)result.AsyncState;
                 HttpListenerContext context = listener.EndGetContext(result);
-                MainThreadDispatcher.Enqueue(() => Process(context));
+                SceneAPIRequest request = SceneAPIRequest.FromContext(context);
+
+                // Dispatcher statistics must be readable while the main thread is busy
+                if (request.Method == "GET" && request.Path == "/stats")
+                {
+                    Send(context, request, StatsModule.Execute());
+                    return;
+                }
+
+                MainThreadDispatcher.Enqueue(() => Process(context, request), SceneAPIHandler.GetPriority(request));
             }
             catch (ObjectDisposedException)
             {
@@ -127,32 +147,85 @@ namespace SceneAPI
             }
         }
 
-        private void Process(HttpListenerContext context)
+        private void Process(HttpListenerContext context, SceneAPIRequest request)
         {
             string response = "";
-            string path = context.Request.Url.AbsolutePath;
-            string method = context.Request.HttpMethod;
 
             try
             {
-                response = apiHandler.HandleRequest(method, path, context);
+                response = apiHandler.HandleRequest(request);
             }
             catch (Exception ex)
             {
                 response = JsonConvert.SerializeObject(new { error = ex.Message });
             }
 
-            byte[] buffer = Encoding.UTF8.GetBytes(response);
-            context.Response.ContentType = "application/json";
-            context.Response.ContentLength64 = buffer.Length;
-            context.Response.AddHeader("Access-Control-Allow-Origin", "*");
+            // Encoding and compression run off the main thread, which only builds the response
+            ThreadPool.QueueUserWorkItem(_ => Send(context, request, response));
+        }
 
+        private static void Send(HttpListenerContext context, SceneAPIRequest request, string response)
+        {
             try
             {
+                byte[] buffer = Encoding.UTF8.GetBytes(response);
+                context.Response.StatusCode = request.StatusCode;
+                context.Response.ContentType = "application/json";
+                context.Response.AddHeader("Access-Control-Allow-Origin", "*");
+                context.Response.AddHeader("Vary", "Accept-Encoding");
+                if (buffer.Length >= MinCompressedLength && AcceptsGzip(request.Headers?["Accept-Encoding"]))
+                {
+                    buffer = Gzip(buffer);
+                    context.Response.AddHeader("Content-Encoding", "gzip");
+                }
+                context.Response.ContentLength64 = buffer.Length;
+                foreach (string header in request.ResponseHeaders.AllKeys)
+                {
+                    context.Response.AddHeader(header, request.ResponseHeaders[header]);
+                }
+
                 context.Response.OutputStream.Write(buffer, 0, buffer.Length);
                 context.Response.OutputStream.Close();
             }
             catch { }
         }
+
+        // Accept-Encoding: "gzip", "gzip;q=0.8, deflate", "*"; q=0 explicitly refuses the coding
+        private static bool AcceptsGzip(string acceptEncoding)
+        {
+            if (string.IsNullOrEmpty(acceptEncoding)) return false;
+
+            foreach (string part in acceptEncoding.Split(','))
+            {
+                string[] tokens = part.Split(';');
+                string coding = tokens[0].Trim();
+                if (!coding.Equals("gzip", StringComparison.OrdinalIgnoreCase) && coding != "*") continue;
+
+                bool refused = false;
+                for (int i = 1; i < tokens.Length; i++)
+                {
+                    string parameter = tokens[i].Trim().Replace(" ", "");
+                    if (parameter.StartsWith("q=") && double.TryParse(parameter.Substring(2),
+                            System.Globalization.NumberStyles.Float, System.Globalization.CultureInfo.InvariantCulture, out double q) && q <= 0)
+                    {
+                        refused = true;
+                    }
+                }
+                if (!refused) return true;
+            }
+            return false;
+        }
+
+        private static byte[] Gzip(byte[] data)
+        {
+            using (var output = new MemoryStream())
+            {
+                using (var gzip = new GZipStream(output, CompressionLevel.Fastest, true))
+                {
+                    gzip.Write(data, 0, data.Length);
+                }
+                return output.ToArray();
+            }
+        }
     }
 }
\ No newline at end of file
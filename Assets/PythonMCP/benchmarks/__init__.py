@@ -0,0 +1,20 @@
+"""Нагрузочные замеры клиента Unity Scene API
+
+Клиент прогоняется по всем действиям execute_command против заглушки (standin)
+со сгенерированной сценой заданного размера:
+
+- scene_generator: Синтетическая сцена (число объектов, глубина, ветвление, повторы имен, наборы компонентов)
+- run: Замеры задержки, пропускной способности и пиковой памяти, сравнение с базовым прогоном
+  (python -m benchmarks.run --objects 100000 --save-baseline)
+- path_lookup: Стоимость поиска по пути обходом и через индекс путей в зависимости от размера сцены
+  (python -m benchmarks.path_lookup --sizes 1000 10000 100000)
+- replay: Повтор записанного потока команд с исходными интервалами против любого сервера
+  (python -m benchmarks.replay trace.jsonl --port 8080 --time-scale 0.5)
+"""
+
+from .scene_generator import SceneSpec, generate_scene
+
+__all__ = [
+    'SceneSpec',
+    'generate_scene'
+]
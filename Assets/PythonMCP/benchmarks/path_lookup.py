@@ -0,0 +1,76 @@
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict, List
+
+from .scene_generator import SceneSpec, generate_scene
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_LOOKUPS = 20000
+
+def _per_call_us(func, items: List) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+def measure(spec: SceneSpec, lookups: int = DEFAULT_LOOKUPS) -> Dict:
+    """Стоимость поиска по пути и вычисления пути объекта: обходом и через индекс путей сцены-заглушки"""
+    scene = generate_scene(spec)
+    objects = list(scene.iter_objects())
+    rng = random.Random(spec.seed)
+    sample = [rng.choice(objects) for _ in range(lookups)]
+    paths = [obj.path for obj in sample]
+    # Промахи (опечатка в последнем имени) индекс отвечает обходом, они не дешевле исходного поиска
+    misses = [path + "_" for path in paths[:lookups // 10]]
+
+    scene.hierarchy_changed()
+    start = time.perf_counter()
+    scene.find_by_path(paths[0])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    find_walk_us = _per_call_us(scene.walk_path, paths)
+    find_index_us = _per_call_us(scene.find_by_path, paths)
+    saved_us = find_walk_us - find_index_us
+    return {
+        "objects": len(objects),
+        "index_build_ms": round(build_ms, 2),
+        "find_walk_us": round(find_walk_us, 3),
+        "find_index_us": round(find_index_us, 3),
+        "find_miss_us": round(_per_call_us(scene.find_by_path, misses), 3),
+        "path_walk_us": round(_per_call_us(lambda obj: obj.path, sample), 3),
+        "path_index_us": round(_per_call_us(scene.path_of, sample), 3),
+        # Сколько поисков между изменениями иерархии окупают одно построение индекса
+        "break_even_lookups": int(build_ms * 1000 / saved_us) + 1 if saved_us > 0 else None
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Стоимость поиска объекта по пути в зависимости от размера сцены")
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--duplicates", type=float, default=0.3, help="доля объектов с повторяющимися именами")
+    parser.add_argument("--lookups", type=int, default=DEFAULT_LOOKUPS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="файл для результатов в JSON")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'objects':>9} {'build ms':>9} {'walk us':>9} {'index us':>9} {'miss us':>9} "
+          f"{'path walk':>10} {'path index':>10} {'break-even':>10}")
+    for size in args.sizes:
+        row = measure(SceneSpec(size, args.depth, args.fan_out, args.duplicates, seed=args.seed), args.lookups)
+        rows.append(row)
+        print(f"{row['objects']:>9} {row['index_build_ms']:>9.2f} {row['find_walk_us']:>9.2f} {row['find_index_us']:>9.2f} "
+              f"{row['find_miss_us']:>9.2f} {row['path_walk_us']:>10.2f} {row['path_index_us']:>10.2f} "
+              f"{row['break_even_lookups'] if row['break_even_lookups'] is not None else '-':>10}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+if __name__ == "__main__":
+    main()
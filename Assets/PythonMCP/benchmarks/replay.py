@@ -0,0 +1,104 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from modules.hierarchy_cache import DEFAULT_HIERARCHY_TTL
+from modules.traffic_recorder import load_trace
+from unity_api_client_modular import UnitySceneAPI
+
+def _action_name(command) -> str:
+    if isinstance(command, list):
+        return f"batch[{len(command)}]"
+    return str(command.get("action"))
+
+def _succeeded(result) -> bool:
+    if isinstance(result, list):
+        return all(_succeeded(r) for r in result)
+    return isinstance(result, dict) and result.get("success") is not False and not result.get("error")
+
+def replay_commands(api: UnitySceneAPI, records: List[Dict], time_scale: float = 1.0) -> Dict:
+    """Повторяет записанные команды с исходными интервалами между ними, умноженными на time_scale
+
+    Команды выполняются по одной (как в синхронном клиенте): если команда не успела
+    завершиться к моменту следующей, следующая отправляется сразу, а опоздание
+    попадает в отчет. Между сессиями записи пауза не выдерживается.
+    """
+    rows: List[Dict] = []
+    session = None
+    session_start = 0.0
+    for record in sorted(records, key=lambda r: (r.get("session") or "", r.get("t", 0.0))):
+        if record.get("session") != session:
+            session = record.get("session")
+            session_start = time.perf_counter() - record.get("t", 0.0) * time_scale
+
+        scheduled = session_start + record.get("t", 0.0) * time_scale
+        now = time.perf_counter()
+        if scheduled > now:
+            time.sleep(scheduled - now)
+            now = time.perf_counter()
+
+        result = api.execute_command(record["request"])
+        rows.append({
+            "seq": record.get("seq"),
+            "action": _action_name(record["request"]),
+            "recorded_ms": record.get("duration_ms", 0.0),
+            "replayed_ms": (time.perf_counter() - now) * 1000.0,
+            "lag_ms": max(0.0, (now - scheduled) * 1000.0),
+            "outcome_changed": _succeeded(result) != _succeeded(record.get("response"))
+        })
+    return summarize(rows)
+
+def summarize(rows: List[Dict]) -> Dict:
+    """Сводка воспроизведения по действиям: медианы записанной и новой задержки"""
+    actions: Dict[str, Dict] = {}
+    for name in sorted({row["action"] for row in rows}):
+        group = [row for row in rows if row["action"] == name]
+        actions[name] = {
+            "count": len(group),
+            "recorded_median_ms": statistics.median(row["recorded_ms"] for row in group),
+            "replayed_median_ms": statistics.median(row["replayed_ms"] for row in group),
+            "outcome_changed": sum(row["outcome_changed"] for row in group)
+        }
+    return {
+        "commands": len(rows),
+        "max_lag_ms": max((row["lag_ms"] for row in rows), default=0.0),
+        "outcome_changed": sum(row["outcome_changed"] for row in rows),
+        "actions": actions,
+        "rows": rows
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Повтор записанного потока команд против любого сервера Unity Scene API")
+    parser.add_argument("trace", help="файл записи (UnitySceneAPI(record_path=...))")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="множитель интервалов между командами (0 - без пауз)")
+    parser.add_argument("--session", help="повторить только указанную сессию записи")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_HIERARCHY_TTL, help="TTL кэша иерархии клиента")
+    parser.add_argument("--output", help="файл для отчета в JSON")
+    args = parser.parse_args()
+
+    records = [r for r in load_trace(args.trace, "command") if not args.session or r.get("session") == args.session]
+    if not records:
+        print("No recorded commands found", file=sys.stderr)
+        sys.exit(1)
+
+    with UnitySceneAPI(args.host, args.port, hierarchy_cache_ttl=args.cache_ttl) as api:
+        report = replay_commands(api, records, args.time_scale)
+
+    print(f"Replayed {report['commands']} commands, max lag {report['max_lag_ms']:.1f} ms, "
+          f"{report['outcome_changed']} with a different outcome")
+    print(f"{'action':<24} {'count':>6} {'recorded ms':>12} {'replayed ms':>12} {'changed':>8}")
+    for name, stats in report["actions"].items():
+        print(f"{name:<24} {stats['count']:>6} {stats['recorded_median_ms']:>12.2f} "
+              f"{stats['replayed_median_ms']:>12.2f} {stats['outcome_changed']:>8}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from standin.server import StandInSceneAPIServer
+from unity_api_client_modular import UnitySceneAPI
+
+from .scene_generator import SceneSpec, generate_scene
+
+DEFAULT_ITERATIONS = 20
+DEFAULT_WARMUP = 2
+# Допустимый рост медианной задержки и пиковой памяти относительно базового прогона
+DEFAULT_THRESHOLD = 0.25
+# Изменения меньше этих величин считаются шумом измерения
+MIN_LATENCY_DELTA_MS = 0.5
+MIN_MEMORY_DELTA_KB = 64.0
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "baseline.json")
+
+# Сценарий: по номеру вызова и контексту возвращает команду execute_command
+CommandFactory = Callable[[int, "_Context"], object]
+
+class _Context:
+    """Общие данные сценариев: пути объектов сцены и то, что создали изменяющие сценарии"""
+
+    def __init__(self, paths: List[str], seed: int):
+        self.paths = paths
+        self.rng = random.Random(seed)
+        self.created_paths: List[str] = []
+        self.component_paths: List[str] = []
+
+    def random_path(self) -> str:
+        return self.rng.choice(self.paths)
+
+def _get_components(i: int, ctx: _Context) -> Dict:
+    return {"action": "get_components", "params": {"object_path": ctx.random_path()}}
+
+def _create_object(i: int, ctx: _Context) -> Dict:
+    parent = ctx.random_path()
+    name = f"BenchObject_{i}"
+    ctx.created_paths.append(f"{parent}/{name}")
+    return {"action": "create_object", "params": {"name": name, "parent_path": parent}}
+
+def _delete_object(i: int, ctx: _Context) -> Dict:
+    return {"action": "delete_object", "params": {"object_path": ctx.created_paths[i]}}
+
+def _modify_component(i: int, ctx: _Context) -> Dict:
+    return {"action": "modify_component", "params": {
+        "object_path": ctx.random_path(),
+        "component_type": "Transform",
+        "properties": {"m_LocalPosition": {"x": float(i), "y": 0.0, "z": 0.0}}
+    }}
+
+def _add_component(i: int, ctx: _Context) -> Dict:
+    path = ctx.random_path()
+    ctx.component_paths.append(path)
+    return {"action": "add_component", "params": {"object_path": path, "component_type": f"BenchComponent{i}"}}
+
+def _remove_component(i: int, ctx: _Context) -> Dict:
+    return {"action": "remove_component", "params": {"object_path": ctx.component_paths[i], "component_type": f"BenchComponent{i}"}}
+
+def _find_objects(i: int, ctx: _Context) -> Dict:
+    return {"action": "find_objects", "params": {"name": ctx.random_path().rpartition("/")[2]}}
+
+def _find_objects_stream(i: int, ctx: _Context) -> Dict:
+    return {"action": "find_objects", "params": {"name": ctx.random_path().rpartition("/")[2], "stream": True, "limit": 10}}
+
+def _add_scene_to_build(i: int, ctx: _Context) -> Dict:
+    return {"action": "add_scene_to_build", "params": {"scene_path": f"Assets/Scenes/Bench_{i}.unity"}}
+
+def _remove_scene_from_build(i: int, ctx: _Context) -> Dict:
+    return {"action": "remove_scene_from_build", "params": {"scene_path": f"Assets/Scenes/Bench_{i}.unity"}}
+
+def _batch(i: int, ctx: _Context) -> List[Dict]:
+    return [_get_components(i, ctx) for _ in range(10)]
+
+# Порядок важен: парные сценарии (create/delete, add/remove) используют данные предыдущих
+SCENARIOS: List[Tuple[str, CommandFactory]] = [
+    ("get_hierarchy", lambda i, ctx: {"action": "get_hierarchy"}),
+    ("get_components", _get_components),
+    ("create_object", _create_object),
+    ("delete_object", _delete_object),
+    ("modify_component", _modify_component),
+    ("add_component", _add_component),
+    ("remove_component", _remove_component),
+    ("find_objects", _find_objects),
+    ("find_objects_stream", _find_objects_stream),
+    ("open_scene", lambda i, ctx: {"action": "open_scene", "params": {"scene_path": "Assets/Scenes/BenchmarkScene.unity"}}),
+    ("get_build_scenes", lambda i, ctx: {"action": "get_build_scenes"}),
+    ("add_scene_to_build", _add_scene_to_build),
+    ("remove_scene_from_build", _remove_scene_from_build),
+    ("batch_get_components_x10", _batch),
+]
+
+def _resolvable_paths(hierarchy: Dict) -> List[str]:
+    """Пути объектов, которые находятся по пути: на каждом уровне объект - первый среди соседей с таким именем"""
+    paths: List[str] = []
+    stack = [hierarchy.get("rootObjects", [])]
+    while stack:
+        seen = set()
+        for node in stack.pop():
+            if node.get("name") in seen:
+                continue
+            seen.add(node.get("name"))
+            paths.append(node["path"])
+            stack.append(node.get("children", []))
+    return paths
+
+def _serve(spec_data: Dict, connection) -> None:
+    """Процесс заглушки: строит сцену, сообщает порт и работает до сигнала остановки"""
+    scene = generate_scene(SceneSpec.from_dict(spec_data))
+    with StandInSceneAPIServer(port=0, scene=scene) as server:
+        connection.send(server.port)
+        connection.recv()
+
+def _is_failure(result) -> bool:
+    if isinstance(result, list):
+        return any(_is_failure(r) for r in result)
+    return not isinstance(result, dict) or result.get("success") is False or bool(result.get("error"))
+
+def _measure(api: UnitySceneAPI, factory: CommandFactory, ctx: _Context,
+             iterations: int, warmup: int) -> Dict:
+    """Задержка и пропускная способность по iterations вызовам и пиковая память клиента по одному вызову"""
+    call = 0
+    errors = 0
+    for _ in range(warmup):
+        errors += _is_failure(api.execute_command(factory(call, ctx)))
+        call += 1
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        command = factory(call, ctx)
+        t0 = time.perf_counter()
+        result = api.execute_command(command)
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+        errors += _is_failure(result)
+        call += 1
+    elapsed = time.perf_counter() - started
+
+    # Отдельный вызов под tracemalloc: трассировка замедляет выполнение и искажала бы задержки
+    command = factory(call, ctx)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = api.execute_command(command)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    errors += _is_failure(result)
+    del result
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "latency_ms": {
+            "min": latencies[0],
+            "median": statistics.median(latencies),
+            "p95": latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))],
+            "max": latencies[-1],
+            "mean": statistics.fmean(latencies)
+        },
+        "throughput_ops": iterations / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_kb": peak / 1024.0
+    }
+
+def run_suite(spec: SceneSpec, iterations: int = DEFAULT_ITERATIONS, warmup: int = DEFAULT_WARMUP,
+              cache_ttl: float = 0.0, only: Optional[List[str]] = None) -> Dict:
+    """Запускает заглушку со сгенерированной сценой в отдельном процессе и прогоняет сценарии"""
+    if iterations < 1:
+        raise ValueError("iterations must be positive")
+
+    parent_connection, child_connection = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve, args=(spec.to_dict(), child_connection), daemon=True)
+    server.start()
+    try:
+        port = parent_connection.recv()
+        results: Dict[str, Dict] = {}
+        with UnitySceneAPI("localhost", port, hierarchy_cache_ttl=cache_ttl) as api:
+            hierarchy = api.hierarchy_module._download()
+            total_objects = hierarchy.get("totalObjects", 0)
+            ctx = _Context(_resolvable_paths(hierarchy), spec.seed)
+            del hierarchy
+            for name, factory in SCENARIOS:
+                if only and name not in only:
+                    continue
+                results[name] = _measure(api, factory, ctx, iterations, warmup)
+                print(f"  {name:<28} median {results[name]['latency_ms']['median']:9.2f} ms", file=sys.stderr)
+    finally:
+        parent_connection.send("stop")
+        server.join(timeout=10)
+        if server.is_alive():
+            server.terminate()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scene": spec.to_dict(),
+            "total_objects": total_objects,
+            "iterations": iterations,
+            "warmup": warmup,
+            "hierarchy_cache_ttl": cache_ttl
+        },
+        "results": results
+    }
+
+def compare(current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Сравнение с базовым прогоном: по каждому действию медиана задержки и пиковая память"""
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for metric, now, before, min_delta in (
+            ("latency_median_ms", result["latency_ms"]["median"], base["latency_ms"]["median"], MIN_LATENCY_DELTA_MS),
+            ("peak_memory_kb", result["peak_memory_kb"], base["peak_memory_kb"], MIN_MEMORY_DELTA_KB),
+        ):
+            change = (now - before) / before if before else 0.0
+            rows.append({
+                "action": name,
+                "metric": metric,
+                "baseline": before,
+                "current": now,
+                "change": change,
+                "regression": change > threshold and now - before > min_delta
+            })
+    return rows
+
+def _print_report(report: Dict, comparison: Optional[List[Dict]]) -> None:
+    meta = report["meta"]
+    print(f"Scene: {meta['total_objects']} objects, depth {meta['scene']['max_depth']}, "
+          f"fan-out {meta['scene']['fan_out']}, duplicates {meta['scene']['duplicate_ratio']}")
+    print(f"{'action':<28} {'median ms':>10} {'p95 ms':>10} {'ops/s':>10} {'peak KB':>10} {'errors':>7}")
+    for name, result in report["results"].items():
+        latency = result["latency_ms"]
+        print(f"{name:<28} {latency['median']:>10.2f} {latency['p95']:>10.2f} "
+              f"{result['throughput_ops']:>10.1f} {result['peak_memory_kb']:>10.1f} {result['errors']:>7}")
+
+    if comparison is None:
+        return
+    print()
+    print(f"{'action':<28} {'metric':<18} {'baseline':>10} {'current':>10} {'change':>8}")
+    for row in comparison:
+        mark = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['action']:<28} {row['metric']:<18} {row['baseline']:>10.2f} {row['current']:>10.2f} "
+              f"{row['change']:>+7.0%}{mark}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочные замеры клиента Unity Scene API на синтетической сцене")
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--duplicates", type=float, default=0.3, help="доля объектов с повторяющимися именами")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--cache-ttl", type=float, default=0.0, help="TTL кэша иерархии клиента (0 - без кэша)")
+    parser.add_argument("--only", nargs="*", help="запустить только перечисленные сценарии")
+    parser.add_argument("--output", help="файл для результатов в JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="базовый прогон для сравнения")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как базовый прогон")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="допустимый рост (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    spec = SceneSpec(args.objects, args.depth, args.fan_out, args.duplicates, seed=args.seed)
+    report = run_suite(spec, args.iterations, args.warmup, args.cache_ttl, args.only)
+
+    comparison = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("scene") != report["meta"]["scene"]:
+            print("Warning: baseline was recorded for a different scene spec", file=sys.stderr)
+        comparison = compare(report, baseline, args.threshold)
+        report["comparison"] = comparison
+
+    _print_report(report, comparison)
+
+    targets = [args.output] if args.output else []
+    if args.save_baseline:
+        targets.append(args.baseline)
+    for target in targets:
+        os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if comparison and any(row["regression"] for row in comparison):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
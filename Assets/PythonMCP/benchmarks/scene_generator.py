@@ -0,0 +1,101 @@
+import random
+from typing import Dict, List, Optional, Sequence
+
+from standin.scene import StandInObject, StandInScene
+
+# Наборы компонентов, из которых случайно выбираются компоненты объектов (Transform добавляется всегда)
+DEFAULT_COMPONENT_MIXES: List[List[str]] = [
+    [],
+    ["MeshFilter", "MeshRenderer"],
+    ["MeshFilter", "MeshRenderer", "BoxCollider"],
+    ["SpriteRenderer", "BoxCollider2D"],
+    ["SpriteRenderer", "Animator", "Rigidbody2D", "CapsuleCollider2D", "EnemyController", "AudioSource"],
+    ["Light"],
+    ["Camera", "AudioListener"],
+    ["ParticleSystem", "ParticleSystemRenderer"],
+]
+
+# Имена, которые повторяются по всей сцене (клоны префабов и типовые узлы)
+DUPLICATE_NAMES = ["Enemy", "Token", "Tile", "Wall", "Health", "Collider", "Visual", "Spawn"]
+
+class SceneSpec:
+    """Параметры синтетической сцены
+
+    object_count - общее число объектов; max_depth - максимальная глубина (1 - только корни);
+    fan_out - максимальное число детей у объекта; duplicate_ratio - доля объектов с повторяющимися
+    именами (половина из них - клоны "Enemy (3)", половина - точные повторы); component_mixes -
+    наборы компонентов; seed - зерно генератора, одна и та же спецификация дает одну и ту же сцену.
+    """
+
+    def __init__(self, object_count: int = 10000, max_depth: int = 8, fan_out: int = 10,
+                 duplicate_ratio: float = 0.3, component_mixes: Optional[Sequence[Sequence[str]]] = None,
+                 seed: int = 0):
+        if object_count < 1:
+            raise ValueError("object_count must be positive")
+        if max_depth < 1 or fan_out < 1:
+            raise ValueError("max_depth and fan_out must be positive")
+        self.object_count = object_count
+        self.max_depth = max_depth
+        self.fan_out = fan_out
+        self.duplicate_ratio = duplicate_ratio
+        self.component_mixes = [list(mix) for mix in (component_mixes or DEFAULT_COMPONENT_MIXES)]
+        self.seed = seed
+
+    def to_dict(self) -> Dict:
+        return {
+            "object_count": self.object_count,
+            "max_depth": self.max_depth,
+            "fan_out": self.fan_out,
+            "duplicate_ratio": self.duplicate_ratio,
+            "component_mixes": self.component_mixes,
+            "seed": self.seed
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SceneSpec":
+        return cls(**data)
+
+def generate_scene(spec: SceneSpec) -> StandInScene:
+    """Строит сцену-заглушку по спецификации
+
+    Каждый новый объект становится ребенком случайного объекта, у которого еще есть место
+    (глубина меньше max_depth и детей меньше fan_out), или, с вероятностью 1/fan_out, новым корнем.
+    """
+    rng = random.Random(spec.seed)
+    scene = StandInScene("BenchmarkScene", "Assets/Scenes/BenchmarkScene.unity")
+    # Объекты, к которым еще можно добавить детей, и их глубина
+    open_nodes: List[StandInObject] = []
+    depths: Dict[int, int] = {}
+    clone_counters: Dict[str, int] = {}
+
+    for number in range(spec.object_count):
+        obj = StandInObject(_object_name(rng, spec, number, clone_counters), rng.choice(spec.component_mixes))
+
+        if not open_nodes or rng.random() < 1.0 / spec.fan_out:
+            scene.add_root(obj)
+            depth = 1
+        else:
+            slot = rng.randrange(len(open_nodes))
+            parent = open_nodes[slot]
+            parent.add_child(obj)
+            depth = depths[parent.instance_id] + 1
+            if len(parent.children) >= spec.fan_out:
+                # Заполненный объект убирается из списка без сдвига элементов
+                open_nodes[slot] = open_nodes[-1]
+                open_nodes.pop()
+
+        if depth < spec.max_depth:
+            depths[obj.instance_id] = depth
+            open_nodes.append(obj)
+
+    return scene
+
+def _object_name(rng: random.Random, spec: SceneSpec, number: int, clone_counters: Dict[str, int]) -> str:
+    if rng.random() >= spec.duplicate_ratio:
+        return f"Object_{number}"
+    base = rng.choice(DUPLICATE_NAMES)
+    if rng.random() < 0.5:
+        return base
+    # Нумерация клонов, как у Unity при дублировании: "Enemy (1)", "Enemy (2)", ...
+    clone_counters[base] = clone_counters.get(base, 0) + 1
+    return f"{base} ({clone_counters[base]})"
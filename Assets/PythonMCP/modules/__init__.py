@@ -6,35 +6,91 @@
 - get_hierarchy_module: Получение иерархии сцены
 - get_components_module: Получение компонентов объекта
 - create_object_module: Создание новых объектов
+- create_objects_module: Массовое создание объектов и экземпляров префабов
 - delete_object_module: Удаление объектов
 - modify_component_module: Модификация компонентов
+- set_transforms_module: Массовая запись трансформаций из массивов (NumPy, буферный протокол)
 - add_component_module: Добавление компонентов
 - remove_component_module: Удаление компонентов
-- find_objects_module: Поиск объектов по имени
+- find_objects_module: Поиск объектов по имени, тегу, слою, активности и компонентам
+- object_filter: Условия поиска объектов GET /objects/find
+- object_handle: Ссылки на объекты по instanceId (ObjectHandle) вместо путей
 - scene_management_module: Управление сценами
+- stats_module: Статистика очереди главного потока редактора (GET /stats)
 - logging_module: Логирование операций
+- http_transport: Общий HTTP-транспорт (пул соединений, таймауты, повторы)
+- async_http_transport: Неблокирующий HTTP-транспорт для asyncio
+- command_router: Сопоставление команд execute_command с HTTP-запросами
+- fan_out: Параллельное выполнение независимых запросов в пуле потоков
+- single_flight: Объединение одинаковых одновременных команд чтения в один запрос
+- batch_module: Пакетное выполнение команд одним запросом
+- hierarchy_cache: Кэш снимка иерархии сцены с инвалидацией после изменений
+- hierarchy_index: Индексы снимка иерархии для поиска по пути и имени
+- hierarchy_columnar: Разбор колоночного формата ответа GET /scene
+- hierarchy_projection: Поддерево, глубина и поля иерархии (from_path, max_depth, fields)
+- hierarchy_grouping: Группировка одинаковых и похожих объектов иерархии
+- deep_json: JSON без ограничения глубины вложенности
+- scene_node: Ленивое дерево объектов сцены (SceneNode) с загрузкой поддеревьев по требованию
+- scene_stream: Потоковый разбор ответа GET /scene по узлам
+- traffic_recorder: Запись команд и HTTP-обмена для воспроизведения
+- scene_mirror: Локальная копия иерархии, обновляемая по ленте изменений сцены
 """
 
 from .get_hierarchy_module import GetHierarchyModule
 from .get_components_module import GetComponentsModule
 from .create_object_module import CreateObjectModule
+from .create_objects_module import CreateObjectsModule
 from .delete_object_module import DeleteObjectModule
 from .modify_component_module import ModifyComponentModule
+from .set_transforms_module import SetTransformsModule
 from .add_component_module import AddComponentModule
 from .remove_component_module import RemoveComponentModule
 from .find_objects_module import FindObjectsModule
 from .scene_management_module import SceneManagementModule
+from .stats_module import StatsModule
 from .logging_module import LoggingModule
+from .http_transport import HttpTransport
+from .async_http_transport import AsyncHttpTransport, AsyncHttpError
+from .command_router import CommandRouter
+from .batch_module import BatchModule
+from .hierarchy_cache import HierarchyCache
+from .hierarchy_index import HierarchyIndex
+from .scene_stream import JsonEventParser, SceneNodeStream
+from .scene_node import SceneNode, SceneTree
+from .traffic_recorder import TrafficRecorder, RecordingTransport, AsyncRecordingTransport
+from .scene_mirror import SceneMirror
+from .single_flight import SingleFlight
+from .object_handle import ObjectHandle
 
 __all__ = [
     'GetHierarchyModule',
     'GetComponentsModule',
     'CreateObjectModule',
+    'CreateObjectsModule',
     'DeleteObjectModule',
     'ModifyComponentModule',
+    'SetTransformsModule',
     'AddComponentModule',
     'RemoveComponentModule',
     'FindObjectsModule',
     'SceneManagementModule',
-    'LoggingModule'
+    'StatsModule',
+    'LoggingModule',
+    'HttpTransport',
+    'AsyncHttpTransport',
+    'AsyncHttpError',
+    'CommandRouter',
+    'BatchModule',
+    'HierarchyCache',
+    'HierarchyIndex',
+    'JsonEventParser',
+    'SceneNodeStream',
+    'SceneNode',
+    'SceneTree',
+    'TrafficRecorder',
+    'RecordingTransport',
+    'AsyncRecordingTransport',
+    'SceneMirror',
+    'SingleFlight',
+    'ObjectHandle'
 ]
\ No newline at end of file
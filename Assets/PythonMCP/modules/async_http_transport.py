@@ -0,0 +1,243 @@
+import asyncio
+import gzip
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .deep_json import loads
+
+DEFAULT_CONNECT_TIMEOUT = 3.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.1
+# Как у HttpTransport: запрос, отправленный до обрыва соединения, повторяется только для идемпотентных методов
+DEFAULT_RETRY_METHODS = ("GET", "HEAD")
+
+class AsyncHttpError(Exception):
+    """Ошибка HTTP-запроса асинхронного транспорта"""
+
+class AsyncHttpResponse:
+    """Полностью прочитанный HTTP-ответ"""
+
+    def __init__(self, url: str, status: int, reason: str, headers: Dict[str, str], content: bytes):
+        self.url = url
+        self.status_code = status
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise AsyncHttpError(f"{self.status_code} {self.reason} for url: {self.url}")
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
+
+    def is_usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+class AsyncHttpTransport:
+    """Неблокирующий HTTP/1.1 клиент на asyncio-потоках стандартной библиотеки
+    с keep-alive пулом соединений, таймаутами и повтором неудачных подключений"""
+
+    def __init__(self, base_url: str,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 retry_methods: Iterable[str] = DEFAULT_RETRY_METHODS):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme}")
+        self.base_url = base_url.rstrip("/")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 80
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+
+        self._idle: List[_Connection] = []
+        self._slots = asyncio.Semaphore(pool_maxsize)
+
+    async def request(self, method: str, path: str, params: Optional[Dict] = None,
+                      json: Any = None, headers: Optional[Dict[str, str]] = None) -> AsyncHttpResponse:
+        """Выполняет запрос к Unity API через пул соединений"""
+        target = path + ("?" + urlencode(params) if params else "")
+        body = _json_dumps(json) if json is not None else b""
+        head = self._build_head(method, target, body, headers)
+
+        attempt = 0
+        while True:
+            async with self._slots:
+                conn = None
+                try:
+                    conn = await self._acquire()
+                    conn.writer.write(head + body)
+                    await conn.writer.drain()
+                    response, keep_alive = await asyncio.wait_for(
+                        self._read_response(conn.reader, method, target),
+                        self.read_timeout
+                    )
+                except (asyncio.IncompleteReadError, ConnectionError) as e:
+                    if conn is not None:
+                        conn.close()
+                    # Сервер мог закрыть простаивающее keep-alive соединение, но мог и выполнить запрос
+                    # перед обрывом: на новом соединении повторяются только идемпотентные запросы
+                    if conn is not None and conn.reused and method.upper() in self.retry_methods:
+                        continue
+                    if conn is None and attempt < self.retries:
+                        attempt += 1
+                        await asyncio.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+                        continue
+                    raise AsyncHttpError(f"Connection error for url: {self.base_url}{target}: {e}") from e
+                except (OSError, asyncio.TimeoutError) as e:
+                    if conn is not None:
+                        conn.close()
+                    if conn is None and attempt < self.retries:
+                        attempt += 1
+                        await asyncio.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+                        continue
+                    kind = "Connect" if conn is None else "Read"
+                    raise AsyncHttpError(f"{kind} error for url: {self.base_url}{target}: {e!r}") from e
+                except BaseException:
+                    if conn is not None:
+                        conn.close()
+                    raise
+
+                if keep_alive and conn.is_usable():
+                    conn.reused = True
+                    self._idle.append(conn)
+                else:
+                    conn.close()
+                return response
+
+    async def get(self, path: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> AsyncHttpResponse:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def close(self) -> None:
+        """Закрывает все простаивающие соединения пула"""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except Exception:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _acquire(self) -> _Connection:
+        while self._idle:
+            conn = self._idle.pop()
+            if conn.is_usable():
+                return conn
+            conn.close()
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            self.connect_timeout
+        )
+        return _Connection(reader, writer)
+
+    def _build_head(self, method: str, target: str, body: bytes, headers: Optional[Dict[str, str]]) -> bytes:
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            "Accept-Encoding: gzip",
+            "Connection: keep-alive",
+        ]
+        if body or method in ("POST", "PUT", "DELETE"):
+            lines.append("Content-Type: application/json")
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _read_response(self, reader: asyncio.StreamReader, method: str, target: str) -> Tuple[AsyncHttpResponse, bool]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        version, status, reason = _parse_status_line(status_line)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            content = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            content = await _read_chunked(reader)
+        elif "content-length" in headers:
+            content = await reader.readexactly(int(headers["content-length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        if headers.get("content-encoding", "").lower() == "gzip":
+            content = gzip.decompress(content)
+
+        url = f"{self.base_url}{target}"
+        return AsyncHttpResponse(url, status, reason, headers, content), keep_alive
+
+def _json_dumps(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+def _parse_status_line(line: bytes) -> Tuple[str, int, str]:
+    parts = line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise AsyncHttpError(f"Malformed status line: {line!r}")
+    return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # Пропускаем trailer-заголовки до пустой строки
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
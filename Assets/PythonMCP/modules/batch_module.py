@@ -0,0 +1,153 @@
+import requests
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .http_transport import HttpTransport
+from .deep_json import loads
+
+SKIPPED_ERROR = "Skipped: a previous command in the batch failed"
+
+class BatchModule:
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
+        self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
+        self._batch_supported: Optional[bool] = None
+        # Последний ответ GET /capabilities (None - еще не запрашивался или сервер недоступен)
+        self.capabilities: Optional[Dict] = None
+        # Одновременные первые пакеты из разных потоков проверяют возможности сервера одним запросом
+        self._capabilities_lock = threading.Lock()
+
+    def supports_batch(self) -> bool:
+        """Проверяет (один раз), объявляет ли сервер поддержку POST /batch"""
+        if self._batch_supported is not None:
+            return self._batch_supported
+        with self._capabilities_lock:
+            return self._check_capabilities()
+
+    def _check_capabilities(self) -> bool:
+        if self._batch_supported is None:
+            try:
+                response = self.transport.request(**self.build_capabilities_request())
+                response.raise_for_status()
+                self._batch_supported = self.parse_capabilities(response.json())
+            except requests.exceptions.RequestException:
+                # Сервер недоступен - не запоминаем результат, проверим при следующем вызове
+                return False
+            except json.JSONDecodeError:
+                self._batch_supported = False
+        return self._batch_supported
+
+    def execute(self, entries: List[Dict], stop_on_error: bool = True) -> Dict:
+        """Отправляет подготовленные команды одним запросом POST /batch"""
+        try:
+            response = self.transport.request(**self.build_request(entries, stop_on_error))
+            response.raise_for_status()
+            # Ответы пакета могут содержать глубокие иерархии сцены
+            return self.parse_response(loads(response.content))
+
+        except requests.exceptions.RequestException as e:
+            return {
+                "success": False,
+                "action": "batch",
+                "error": f"Request error: {str(e)}"
+            }
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "action": "batch",
+                "error": f"JSON decode error: {str(e)}"
+            }
+
+    def build_capabilities_request(self) -> Dict:
+        """Описание HTTP-запроса за списком возможностей сервера"""
+        return {"method": "GET", "path": "/capabilities"}
+
+    def parse_capabilities(self, capabilities: Any) -> bool:
+        """Старые версии сервера отвечают {"error": "Endpoint not found"}"""
+        self.capabilities = capabilities if isinstance(capabilities, dict) and "error" not in capabilities else {}
+        return bool(self.capabilities.get("batch"))
+
+    def build_request(self, entries: List[Dict], stop_on_error: bool = True) -> Dict:
+        """Описание HTTP-запроса для пакета команд"""
+        return {
+            "method": "POST",
+            "path": "/batch",
+            "json": {"commands": entries, "stopOnError": stop_on_error}
+        }
+
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата пакета"""
+        if not isinstance(result, dict) or not result.get("success"):
+            return {
+                "success": False,
+                "action": "batch",
+                "error": result.get("error") if isinstance(result, dict) else "Invalid batch response"
+            }
+        return {
+            "success": True,
+            "action": "batch",
+            "data": result,
+            "error": None
+        }
+
+    def to_batch_entry(self, request: Dict) -> Dict:
+        """Преобразует описание HTTP-запроса модуля в элемент пакета"""
+        entry = {"method": request["method"], "path": request["path"]}
+        if request.get("params"):
+            entry["query"] = request["params"]
+        if request.get("json") is not None:
+            entry["body"] = request["json"]
+        if request.get("headers"):
+            entry["headers"] = request["headers"]
+        return entry
+
+    def prepare(self, commands: List[Dict], router: Any, stop_on_error: bool = True) -> Tuple[List[Dict], List[int], List[Optional[Dict]]]:
+        """Валидирует команды и строит элементы пакета
+
+        Возвращает (элементы пакета, индексы соответствующих команд, заготовку результатов,
+        в которой уже заполнены ошибки валидации)
+        """
+        entries: List[Dict] = []
+        indices: List[int] = []
+        results: List[Optional[Dict]] = [None] * len(commands)
+
+        for i, command in enumerate(commands):
+            request, error = router.build_request(command)
+            if error is not None:
+                results[i] = error
+                if stop_on_error:
+                    break
+                continue
+            entries.append(self.to_batch_entry(request))
+            indices.append(i)
+
+        return entries, indices, results
+
+    def merge(self, commands: List[Dict], router: Any, indices: List[int],
+              results: List[Optional[Dict]], batch_result: Dict, stop_on_error: bool = True) -> List[Dict]:
+        """Раскладывает ответы пакета по командам в исходном порядке"""
+        if not batch_result.get("success"):
+            for i in indices:
+                results[i] = {"success": False, "action": commands[i].get("action"), "error": batch_result.get("error")}
+        else:
+            for i, item in zip(indices, batch_result["data"].get("results", [])):
+                try:
+                    results[i] = router.parse_response(commands[i], item.get("body"))
+                except Exception as e:
+                    results[i] = {"success": False, "action": commands[i].get("action"), "error": str(e)}
+
+        failed = False
+        for i, command in enumerate(commands):
+            if results[i] is None or (stop_on_error and failed):
+                results[i] = self.skipped_result(command)
+            elif self.is_failure(results[i]):
+                failed = True
+        return results
+
+    def skipped_result(self, command: Dict) -> Dict:
+        return {"success": False, "action": command.get("action"), "error": SKIPPED_ERROR}
+
+    @staticmethod
+    def is_failure(result: Dict) -> bool:
+        return not result.get("success") or bool(result.get("error"))
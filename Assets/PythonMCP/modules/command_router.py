@@ -0,0 +1,171 @@
+from typing import Any, Dict, Optional, Tuple
+
+from .find_objects_module import ENDPOINT_NOT_FOUND, MAX_FIND_PAGE_SIZE
+from .object_filter import ObjectFilter
+
+SCENE_ACTIONS = ("open_scene", "get_build_scenes", "add_scene_to_build", "remove_scene_from_build")
+# Результат find_objects, отправленной серверу без GET /objects/find: команду нужно повторить (см. needs_retry)
+FIND_UNSUPPORTED_ERROR = "GET /objects/find is not supported by the server"
+
+class CommandRouter:
+    """Сопоставляет структурированные команды execute_command с HTTP-запросами модулей
+
+    Используется клиентами, которые сами отправляют запросы (асинхронный клиент),
+    поэтому описание маршрутов и формат ответов берутся из тех же модулей,
+    что и в синхронном UnitySceneAPI
+    """
+
+    def __init__(self, api: Any):
+        # api - любой объект с атрибутами модулей как у UnitySceneAPI
+        self.api = api
+
+    def build_request(self, command: Dict) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Возвращает (описание запроса, None) или (None, ответ с ошибкой валидации)"""
+        api = self.api
+        action = command.get("action")
+        params = command.get("params", {})
+
+        if action == "get_hierarchy":
+            try:
+                return api.hierarchy_module.build_request(params), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "get_components":
+            object_path = params.get("object_path")
+            if not object_path:
+                return None, self._error(action, "object_path is required")
+            try:
+                return api.components_module.build_request(
+                    object_path, params.get("component_types"), params.get("properties"),
+                    params.get("depth"), params.get("max_array")), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "create_object":
+            name = params.get("name", "GameObject")
+            parent_path = params.get("parent_path", "")
+            try:
+                return api.create_object_module.build_request(name, parent_path), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "create_objects":
+            try:
+                return api.create_objects_module.build_request(params.get("objects")), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "delete_object":
+            object_path = params.get("object_path")
+            if not object_path:
+                return None, self._error(action, "object_path is required")
+            try:
+                return api.delete_object_module.build_request(object_path), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action in ("modify_component", "add_component", "remove_component"):
+            object_path = params.get("object_path")
+            component_type = params.get("component_type")
+            if not all([object_path, component_type]):
+                return None, self._error(action, "object_path and component_type are required")
+            try:
+                if action == "modify_component":
+                    properties = params.get("properties", {})
+                    return api.modify_component_module.build_request(object_path, component_type, properties), None
+                if action == "add_component":
+                    return api.add_component_module.build_request(object_path, component_type), None
+                return api.remove_component_module.build_request(object_path, component_type), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "set_transforms":
+            try:
+                return api.set_transforms_module.build_request(
+                    params.get("targets"), params.get("positions"), params.get("rotations"),
+                    params.get("scales"), params.get("space", "world")), None
+            except ValueError as e:
+                return None, self._error(action, str(e))
+        if action == "find_objects":
+            return self._build_find_request(params)
+        if action == "get_stats":
+            return api.stats_module.build_request(), None
+        if action in SCENE_ACTIONS:
+            scene_path = params.get("scene_path")
+            if action != "get_build_scenes" and not scene_path:
+                return None, self._error(action, "scene_path is required")
+            return api.scene_management_module.build_request(action, scene_path), None
+
+        return None, self._error(action, f"Unknown action: {action}")
+
+    def parse_response(self, command: Dict, payload: Any) -> Dict:
+        """Преобразует ответ Unity API в структурированный результат команды"""
+        api = self.api
+        action = command.get("action")
+        params = command.get("params", {})
+
+        if action == "get_hierarchy":
+            return api.hierarchy_module.parse_response(payload, params)
+        if action == "get_components":
+            return api.components_module.parse_response(payload, params.get("object_path"))
+        if action == "find_objects":
+            return self._parse_find_response(params, payload)
+        if action == "create_object":
+            return api.create_object_module.parse_response(payload)
+        if action == "create_objects":
+            return api.create_objects_module.parse_response(payload)
+        if action == "delete_object":
+            return api.delete_object_module.parse_response(payload)
+        if action == "modify_component":
+            return api.modify_component_module.parse_response(payload)
+        if action == "set_transforms":
+            return api.set_transforms_module.parse_response(payload)
+        if action == "add_component":
+            return api.add_component_module.parse_response(payload)
+        if action == "remove_component":
+            return api.remove_component_module.parse_response(payload)
+        if action == "get_stats":
+            return api.stats_module.parse_response(payload)
+        if action in SCENE_ACTIONS:
+            return api.scene_management_module.parse_response(action, payload)
+
+        return self._error(action, f"Unknown action: {action}")
+
+    def needs_retry(self, result: Dict) -> bool:
+        """Команда ушла на сервер без GET /objects/find; повторная сборка запроса использует GET /scene"""
+        return result.get("action") == "find_objects" and result.get("error") == FIND_UNSUPPORTED_ERROR
+
+    def _build_find_request(self, params: Dict) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """GET /objects/find с теми же условиями, что у FindObjectsModule.execute (одна страница),
+        у сервера без этого маршрута - полная иерархия GET /scene"""
+        module = self.api.find_objects_module
+        try:
+            object_filter = ObjectFilter.from_params(params)
+        except ValueError as e:
+            return None, self._error("find_objects", str(e))
+        if object_filter.is_empty:
+            return None, self._error("find_objects", "name or another filter is required")
+
+        capabilities = getattr(self.api.batch_module, "capabilities", None)
+        if module.server_find is None and capabilities is not None:
+            # Возможности сервера уже известны из GET /capabilities (проверка перед пакетом)
+            module.server_find = bool(capabilities.get("find"))
+
+        cursor, page_size, limit = params.get("cursor"), params.get("page_size"), params.get("limit")
+        if module.server_find is not False:
+            page_limit = min(page_size or limit or MAX_FIND_PAGE_SIZE, limit or MAX_FIND_PAGE_SIZE)
+            return module.build_find_request(object_filter, page_limit, cursor), None
+
+        error = module.fallback_error(object_filter, cursor is not None or page_size is not None)
+        if error is not None:
+            return None, self._error("find_objects", error)
+        return module.build_request(object_filter.name), None
+
+    def _parse_find_response(self, params: Dict, payload: Any) -> Dict:
+        module = self.api.find_objects_module
+        object_filter = ObjectFilter.from_params(params)
+        # Ответ GET /objects/find - список путей, ответ GET /scene - иерархия
+        if isinstance(payload, dict) and ("paths" in payload or payload.get("error") == ENDPOINT_NOT_FOUND):
+            if not module.has_find_route(payload):
+                return self._error("find_objects", FIND_UNSUPPORTED_ERROR)
+            return module.parse_find_response(payload, object_filter.name)
+        return module.parse_response(payload, object_filter.name, limit=params.get("limit"),
+                                     object_filter=None if object_filter.name_only else object_filter)
+
+    def _error(self, action: Optional[str], message: str) -> Dict:
+        return {"success": False, "action": action, "error": message}
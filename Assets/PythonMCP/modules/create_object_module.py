@@ -1,27 +1,21 @@
 import requests
 import json
-from typing import Dict
+from typing import Dict, Optional, Union
+
+from .http_transport import HttpTransport
+from .object_handle import ObjectHandle, ObjectTarget, object_ref
 
 class CreateObjectModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
-    def execute(self, name: str = "GameObject", parent_path: str = "") -> Dict:
-        """Создает новый GameObject в сцене"""
+    def execute(self, name: str = "GameObject", parent_path: Union[ObjectTarget, None] = "") -> Dict:
+        """Создает новый GameObject в сцене (parent_path - путь или handle родителя); data["handle"] - handle объекта"""
         try:
-            response = requests.post(
-                f"{self.base_url}/objects/create", 
-                json={"name": name, "parentPath": parent_path}
-            )
+            response = self.transport.request(**self.build_request(name, parent_path))
             response.raise_for_status()
-            create_result = response.json()
-            
-            return {
-                "success": create_result.get("success", False),
-                "action": "create_object",
-                "data": create_result if create_result.get("success") else None,
-                "error": create_result.get("error")
-            }
+            return self.parse_response(response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -34,4 +28,35 @@ class CreateObjectModule:
                 "success": False,
                 "action": "create_object",
                 "error": f"JSON decode error: {str(e)}"
-            }
\ No newline at end of file
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "create_object",
+                "error": str(e)
+            }
+    
+    def build_request(self, name: str = "GameObject", parent_path: Union[ObjectTarget, None] = "") -> Dict:
+        """Описание HTTP-запроса на создание объекта"""
+        body = {"name": name, "parentPath": ""}
+        if parent_path:
+            path, instance_id = object_ref(parent_path)
+            body["parentPath"] = path or ""
+            if instance_id is not None:
+                body["parentId"] = instance_id
+        return {
+            "method": "POST",
+            "path": "/objects/create",
+            "json": body
+        }
+    
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        if result.get("success") and result.get("instanceId") is not None:
+            result["handle"] = ObjectHandle(result["instanceId"], result.get("path"))
+        return {
+            "success": result.get("success", False),
+            "action": "create_object",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
\ No newline at end of file
@@ -0,0 +1,146 @@
+import requests
+import json
+from typing import Any, Dict, List, Optional
+
+from .http_transport import HttpTransport
+from .object_handle import handles, object_ref
+
+# Как CreateObjectsModule.MaxObjects на сервере
+MAX_CREATE_OBJECTS = 10000
+
+class CreateObjectsModule:
+    """Массовое создание объектов и экземпляров префабов одним запросом POST /objects/create/bulk
+
+    Описание объекта: name, родитель (parent_path - путь или ObjectHandle, parent_id или
+    parent_index - номер более раннего описания в том же списке), prefab - путь ассета, position / rotation / scale
+    (локальные, списком или {"x", "y", "z"(, "w")}), components - имена типов.
+    Старый сервер без этого маршрута получает объекты по одному через POST /objects/create.
+    """
+
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
+        self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
+
+    def execute(self, specs: List[Dict]) -> Dict:
+        """Создает объекты в порядке описаний; data: instanceIds, paths и handles в том же порядке, errors - по индексам"""
+        try:
+            response = self.transport.request(**self.build_request(specs))
+            if response.status_code != 404:
+                response.raise_for_status()
+                result = response.json()
+                if result.get("error") != "Endpoint not found":
+                    return self.parse_response(result)
+            return self._create_one_by_one(specs)
+
+        except requests.exceptions.RequestException as e:
+            return {
+                "success": False,
+                "action": "create_objects",
+                "error": f"Request error: {str(e)}"
+            }
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "action": "create_objects",
+                "error": f"JSON decode error: {str(e)}"
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "create_objects",
+                "error": str(e)
+            }
+
+    def build_request(self, specs: List[Dict]) -> Dict:
+        """Описание HTTP-запроса; ValueError - пустой или слишком длинный список, некорректное описание"""
+        if not specs:
+            raise ValueError("objects are required")
+        if len(specs) > MAX_CREATE_OBJECTS:
+            raise ValueError(f"Too many objects: {len(specs)} (max {MAX_CREATE_OBJECTS})")
+        return {
+            "method": "POST",
+            "path": "/objects/create/bulk",
+            "json": {"objects": [_object_spec(spec, i) for i, spec in enumerate(specs)]}
+        }
+
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        if result.get("success") and "instanceIds" in result:
+            result["handles"] = handles(result.get("paths") or [], result["instanceIds"])
+        return {
+            "success": result.get("success", False),
+            "action": "create_objects",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
+
+    def _create_one_by_one(self, specs: List[Dict]) -> Dict:
+        """Совместимость со старым сервером: только имя и родитель, по запросу на объект"""
+        instance_ids: List[Optional[int]] = []
+        paths: List[Optional[str]] = []
+        errors: List[Dict] = []
+        for i, spec in enumerate(specs):
+            parent_index = spec.get("parent_index")
+            parent_path = spec.get("parent_path") or ""
+            if not isinstance(parent_path, str):
+                # Старый сервер не знает instanceId: у handle используется последний известный путь
+                parent_path = object_ref(parent_path)[0] or ""
+            if any(spec.get(key) is not None for key in ("parent_id", "prefab", "position", "rotation", "scale", "components")):
+                error = "Server does not support POST /objects/create/bulk: only name and parent are available"
+            elif parent_index is not None and not (0 <= parent_index < i and paths[parent_index]):
+                error = f"Parent entry {parent_index} was not created before entry {i}"
+            else:
+                if parent_index is not None:
+                    parent_path = paths[parent_index]
+                response = self.transport.request("POST", "/objects/create",
+                                                  json={"name": spec.get("name") or "GameObject", "parentPath": parent_path})
+                response.raise_for_status()
+                result = response.json()
+                error = None if result.get("success") else result.get("error") or "Failed to create object"
+                if error is None:
+                    instance_ids.append(result.get("instanceId"))
+                    paths.append(result.get("path"))
+                    continue
+            instance_ids.append(None)
+            paths.append(None)
+            errors.append({"index": i, "error": error})
+
+        created = len(specs) - len(errors)
+        return self.parse_response({
+            "success": True,
+            "created": created,
+            "instanceIds": instance_ids,
+            "paths": paths,
+            "errors": errors,
+            "message": f"Objects created: {created} of {len(specs)}"
+        })
+
+def _object_spec(spec: Dict, index: int) -> Dict:
+    """Описание объекта клиента -> запись тела запроса"""
+    if not isinstance(spec, dict):
+        raise ValueError(f"Invalid object spec at index {index}")
+    entry: Dict[str, Any] = {"name": spec.get("name") or "GameObject"}
+    if spec.get("parent_path") and not isinstance(spec["parent_path"], str):
+        spec = dict(spec)
+        spec["parent_path"], handle_id = object_ref(spec["parent_path"])
+        spec.setdefault("parent_id", handle_id)
+    for key, field in (("parent_path", "parentPath"), ("parent_id", "parentId"), ("parent_index", "parentIndex"), ("prefab", "prefab")):
+        if spec.get(key) is not None and spec.get(key) != "":
+            entry[field] = spec[key]
+    for key, axes in (("position", "xyz"), ("rotation", "xyzw"), ("scale", "xyz")):
+        if spec.get(key) is not None:
+            entry[key] = _vector(spec[key], axes, key, index)
+    if spec.get("components"):
+        components = spec["components"]
+        entry["components"] = components.split(",") if isinstance(components, str) else list(components)
+    return entry
+
+def _vector(value: Any, axes: str, key: str, index: int) -> Dict[str, float]:
+    if isinstance(value, dict):
+        return {axis: float(value[axis]) for axis in axes if axis in value}
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    values = list(value)
+    if len(values) != len(axes):
+        raise ValueError(f"{key} of object {index} must have {len(axes)} values")
+    return {axis: float(v) for axis, v in zip(axes, values)}
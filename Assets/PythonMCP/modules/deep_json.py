@@ -0,0 +1,229 @@
+import json
+import re
+from json.decoder import scanstring
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Any, Callable, Optional, Tuple, Union
+
+# Стандартный модуль json рекурсивен и падает с RecursionError примерно на 1000 уровнях вложенности,
+# а у иерархии сцены каждый уровень объектов дает два уровня JSON (объект и массив children).
+# Поэтому сначала используется быстрый json, а при RecursionError - итеративная реализация.
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?")
+_CONSTANTS = (
+    ("null", None), ("true", True), ("false", False),
+    ("NaN", float("nan")), ("Infinity", float("inf")), ("-Infinity", float("-inf"))
+)
+_END = object()
+_JSON_TYPES = (dict, list, tuple, str, int, float, bool, type(None))
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """json.loads без ограничения глубины вложенности"""
+    try:
+        return json.loads(data)
+    except RecursionError:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode(json.detect_encoding(data), "surrogatepass")
+        return _loads_iterative(data)
+
+def dumps(obj: Any, indent: Optional[Union[int, str]] = None, ensure_ascii: bool = True,
+          separators: Optional[Tuple[str, str]] = None, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """json.dumps без ограничения глубины вложенности
+
+    Поддерживаются dict, list, tuple и скаляры; остальные значения преобразует default, как в json.dumps.
+    """
+    try:
+        return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii, separators=separators, default=default)
+    except RecursionError:
+        return _dumps_iterative(obj, indent, ensure_ascii, separators, default)
+
+def to_json(value: Any) -> Any:
+    """default для dumps: массивы NumPy, array и memoryview - списками, скаляры NumPy - числами, множества - списками"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def copy_tree(obj: Any) -> Any:
+    """Независимая копия вложенных dict и list без ограничения глубины (остальные значения не копируются)"""
+    if not isinstance(obj, (dict, list)):
+        return obj
+    root = {} if isinstance(obj, dict) else []
+    stack = [(obj, root)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in (source.items() if isinstance(source, dict) else enumerate(source)):
+            if isinstance(value, (dict, list)):
+                child = {} if isinstance(value, dict) else []
+                stack.append((value, child))
+                value = child
+            if isinstance(target, dict):
+                target[key] = value
+            else:
+                target.append(value)
+    return root
+
+def _skip(s: str, pos: int) -> int:
+    return _WHITESPACE.match(s, pos).end()
+
+def _read_key(s: str, pos: int) -> Tuple[str, int]:
+    if s[pos:pos + 1] != '"':
+        raise json.JSONDecodeError("Expecting property name enclosed in double quotes", s, pos)
+    key, pos = scanstring(s, pos + 1)
+    pos = _skip(s, pos)
+    if s[pos:pos + 1] != ":":
+        raise json.JSONDecodeError("Expecting ':' delimiter", s, pos)
+    return key, _skip(s, pos + 1)
+
+def _read_scalar(s: str, pos: int) -> Tuple[Any, int]:
+    if s[pos:pos + 1] == '"':
+        return scanstring(s, pos + 1)
+    match = _NUMBER.match(s, pos)
+    if match:
+        integer, frac, exp = match.groups()
+        if frac or exp:
+            return float(integer + (frac or "") + (exp or "")), match.end()
+        return int(integer), match.end()
+    for literal, value in _CONSTANTS:
+        if s.startswith(literal, pos):
+            return value, pos + len(literal)
+    raise json.JSONDecodeError("Expecting value", s, pos)
+
+def _loads_iterative(s: str) -> Any:
+    """Разбор JSON с явным стеком контейнеров вместо рекурсии"""
+    # Элемент стека: [контейнер, ключ для следующего значения словаря]
+    stack = []
+    pos = _skip(s, 0)
+    while True:
+        # Чтение очередного значения
+        ch = s[pos:pos + 1]
+        if ch == "{":
+            pos = _skip(s, pos + 1)
+            if s[pos:pos + 1] != "}":
+                key, pos = _read_key(s, pos)
+                stack.append([{}, key])
+                continue
+            value, pos = {}, pos + 1
+        elif ch == "[":
+            pos = _skip(s, pos + 1)
+            if s[pos:pos + 1] != "]":
+                stack.append([[], None])
+                continue
+            value, pos = [], pos + 1
+        else:
+            value, pos = _read_scalar(s, pos)
+
+        # Добавление значения в контейнер и закрытие завершенных контейнеров
+        while True:
+            if not stack:
+                pos = _skip(s, pos)
+                if pos != len(s):
+                    raise json.JSONDecodeError("Extra data", s, pos)
+                return value
+
+            frame = stack[-1]
+            container = frame[0]
+            if isinstance(container, list):
+                container.append(value)
+            else:
+                container[frame[1]] = value
+
+            pos = _skip(s, pos)
+            ch = s[pos:pos + 1]
+            if ch == ",":
+                pos = _skip(s, pos + 1)
+                if isinstance(container, dict):
+                    frame[1], pos = _read_key(s, pos)
+                break
+            if ch != ("]" if isinstance(container, list) else "}"):
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, pos)
+            pos += 1
+            stack.pop()
+            value = container
+
+def _encode_key(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return _encode_scalar(key, encode_basestring)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+def _encode_scalar(value: Any, encode_str) -> str:
+    if isinstance(value, str):
+        return encode_str(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    if isinstance(value, dict):
+        return "{}"
+    if isinstance(value, (list, tuple)):
+        return "[]"
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _dumps_iterative(obj: Any, indent: Optional[Union[int, str]], ensure_ascii: bool,
+                     separators: Optional[Tuple[str, str]], default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Сериализация с явным стеком итераторов; формат совпадает с json.dumps"""
+    if isinstance(indent, int):
+        indent = " " * indent
+    item_separator, key_separator = separators or ((",", ": ") if indent is not None else (", ", ": "))
+    encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+
+    chunks = []
+    # Элемент стека: [итератор, это словарь, количество записанных элементов]
+    stack = []
+    value = obj
+    while True:
+        if default is not None:
+            while not isinstance(value, _JSON_TYPES):
+                value = default(value)
+        if isinstance(value, dict) and value:
+            chunks.append("{")
+            stack.append([iter(value.items()), True, 0])
+        elif isinstance(value, (list, tuple)) and value:
+            chunks.append("[")
+            stack.append([iter(value), False, 0])
+        else:
+            chunks.append(_encode_scalar(value, encode_str))
+
+        while stack:
+            frame = stack[-1]
+            item = next(frame[0], _END)
+            if item is _END:
+                stack.pop()
+                if indent is not None:
+                    chunks.append("\n" + indent * len(stack))
+                chunks.append("}" if frame[1] else "]")
+                continue
+
+            if frame[2]:
+                chunks.append(item_separator)
+            frame[2] += 1
+            if indent is not None:
+                chunks.append("\n" + indent * len(stack))
+            if frame[1]:
+                key, value = item
+                chunks.append(encode_str(_encode_key(key)))
+                chunks.append(key_separator)
+            else:
+                value = item
+            break
+        else:
+            return "".join(chunks)
@@ -1,12 +1,16 @@
 import requests
 import json
-from typing import Dict
+from typing import Dict, Optional
+
+from .http_transport import HttpTransport
+from .object_handle import ObjectTarget, object_fields
 
 class DeleteObjectModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
-    def execute(self, object_path: str) -> Dict:
+    def execute(self, object_path: ObjectTarget) -> Dict:
         """Удаляет объект из сцены"""
         try:
             if not object_path:
@@ -16,19 +20,9 @@ class DeleteObjectModule:
                     "error": "object_path is required"
                 }
             
-            response = requests.delete(
-                f"{self.base_url}/objects/delete", 
-                json={"path": object_path}
-            )
+            response = self.transport.request(**self.build_request(object_path))
             response.raise_for_status()
-            delete_result = response.json()
-            
-            return {
-                "success": delete_result.get("success", False),
-                "action": "delete_object",
-                "data": delete_result if delete_result.get("success") else None,
-                "error": delete_result.get("error")
-            }
+            return self.parse_response(response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -41,4 +35,27 @@ class DeleteObjectModule:
                 "success": False,
                 "action": "delete_object",
                 "error": f"JSON decode error: {str(e)}"
-            }
\ No newline at end of file
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "delete_object",
+                "error": str(e)
+            }
+    
+    def build_request(self, object_path: ObjectTarget) -> Dict:
+        """Описание HTTP-запроса на удаление объекта"""
+        return {
+            "method": "DELETE",
+            "path": "/objects/delete",
+            "json": object_fields(object_path)
+        }
+    
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        return {
+            "success": result.get("success", False),
+            "action": "delete_object",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
\ No newline at end of file
@@ -0,0 +1,45 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from .http_transport import DEFAULT_POOL_MAXSIZE
+
+# Потоков больше, чем соединений в пуле транспорта, бессмысленно: лишние только ждут соединения
+DEFAULT_FAN_OUT_WORKERS = DEFAULT_POOL_MAXSIZE
+
+def iter_fan_out(func: Callable[[Any], Any], items: Iterable[Any],
+                 max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> Iterator[Tuple[int, Any]]:
+    """Вызывает func для каждого элемента в пуле потоков и отдает (индекс элемента, результат) по мере готовности
+
+    В работе одновременно не больше max_workers вызовов, поэтому и большой список элементов не создает
+    тысяч ожидающих задач. Выход из цикла отменяет еще не начатые вызовы. Исключение func пробрасывается.
+    """
+    items = iter(enumerate(items))
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="unity-api-fan-out") as executor:
+        running = {}
+        try:
+            for index, item in items:
+                running[executor.submit(func, item)] = index
+                if len(running) >= max_workers:
+                    break
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    # Следующий элемент ставится до отдачи результата, чтобы пул не простаивал, пока вызывающий его обрабатывает
+                    for next_index, item in items:
+                        running[executor.submit(func, item)] = next_index
+                        break
+                    yield index, future.result()
+        finally:
+            for future in running:
+                future.cancel()
+
+def fan_out(func: Callable[[Any], Any], items: Iterable[Any],
+            max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> List[Any]:
+    """Результаты iter_fan_out в порядке элементов"""
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    for index, result in iter_fan_out(func, items, max_workers):
+        results[index] = result
+    return results
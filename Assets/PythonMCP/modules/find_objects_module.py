@@ -1,67 +1,235 @@
 import requests
 import json
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+from .http_transport import HttpTransport
+from .hierarchy_cache import HierarchyCache, HierarchyValidator
+from .hierarchy_columnar import COLUMNAR_PARAMS, decode_hierarchy
+from .hierarchy_index import HierarchyIndex
+from .object_filter import ObjectFilter
+from .object_handle import handles
+from .scene_mirror import SceneMirror
+from .scene_stream import DEFAULT_STREAM_CHUNK_SIZE, open_scene_stream
+
+# Размер страницы GET /objects/find (FindObjectsModule.DefaultLimit на сервере)
+FIND_PAGE_SIZE = 1000
+# Наибольшая страница (FindObjectsModule.MaxLimit): столько получает за один запрос команда из пакета
+MAX_FIND_PAGE_SIZE = 10000
+# Ответ сервера без маршрута GET /objects/find
+ENDPOINT_NOT_FOUND = "Endpoint not found"
 
 class FindObjectsModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None,
+                 cache: Optional[HierarchyCache] = None, mirror: Optional[SceneMirror] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
+        self.cache = cache
+        self.validator = cache.validator if cache else HierarchyValidator()
+        self.mirror = mirror
+        # None - еще неизвестно, есть ли у сервера GET /objects/find
+        self.server_find: Optional[bool] = None
     
-    def execute(self, name: str) -> Dict:
-        """Находит объекты по имени в иерархии сцены"""
+    def execute(self, name: Optional[str] = None, stream: bool = False, limit: Optional[int] = None,
+                chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE, tag: Optional[str] = None, layer: Any = None,
+                active: Any = None, components: Any = None, match: Optional[str] = None,
+                cursor: Optional[str] = None, page_size: Optional[int] = None) -> Dict:
+        """Находит объекты по имени (match: substring, glob, regex), тегу, слою, activeInHierarchy и компонентам
+        stream=True - поиск по имени в потоковом ответе GET /scene во время чтения, без загрузки всей иерархии
+        в память и без GET /objects/find (с остальными условиями или страницами stream не учитывается)
+        limit - максимальное число результатов (в потоковом режиме чтение прекращается досрочно)
+        cursor, page_size - одна страница GET /objects/find, продолжение - data["nextCursor"]
+        data["handles"] - ObjectHandle найденных объектов в том же порядке, что и paths
+        """
         try:
-            if not name:
+            object_filter = ObjectFilter(name, match, tag, layer, active, components)
+            if object_filter.is_empty:
                 return {
                     "success": False,
                     "action": "find_objects",
-                    "error": "name is required"
+                    "error": "name or another filter is required"
                 }
+            paged = cursor is not None or page_size is not None
             
-            # Получаем иерархию сцены
-            response = requests.get(f"{self.base_url}/scene")
-            response.raise_for_status()
-            hierarchy = response.json()
+            if object_filter.name_only and not paged:
+                # Локальная копия сцены, догнанная по ленте изменений, дешевле любого запроса
+                if self.mirror is not None and self.mirror.ready and self.mirror.sync():
+                    with self.mirror.lock:
+                        return self.parse_response(self.mirror.hierarchy(), name, self.mirror, limit)
+                
+                # Актуальный снимок из кэша дешевле повторного чтения ответа
+                cached = self.cache.get() if self.cache else None
+                if cached is not None:
+                    return self.parse_response(cached, name, self.cache.index_for(cached), limit)
             
-            if not hierarchy or "error" in hierarchy:
-                return {
-                    "success": False,
-                    "action": "find_objects",
-                    "error": hierarchy.get("error", "Failed to get hierarchy")
-                }
+            # Фильтр на стороне редактора: по сети идут только найденные пути
+            streaming = stream and object_filter.name_only and not paged
+            if self.server_find is not False and not streaming:
+                result = self._find_on_server(object_filter, limit, cursor, page_size)
+                if result is not None:
+                    return result
             
-            paths = []
+            # Старый сервер без GET /objects/find
+            error = self.fallback_error(object_filter, paged)
+            if error is not None:
+                return self._error(error)
+            if not object_filter.name_only:
+                hierarchy = self.cache.get_or_load(self._download) if self.cache else self._download()
+                return self.parse_response(hierarchy, name, limit=limit, object_filter=object_filter)
             
-            def search_recursive(obj_data):
-                if name.lower() in obj_data["name"].lower():
-                    paths.append(obj_data["path"])
-                
-                for child in obj_data.get("children", []):
-                    search_recursive(child)
+            if stream:
+                return self._find_streaming(name, limit, chunk_size)
             
-            for root_obj in hierarchy.get("rootObjects", []):
-                search_recursive(root_obj)
+            # Получаем иерархию сцены
+            hierarchy = self.cache.get_or_load(self._download) if self.cache else self._download()
+            index = self.cache.index_for(hierarchy) if self.cache and "error" not in hierarchy else None
+            return self.parse_response(hierarchy, name, index, limit)
             
-            find_result = {
-                "paths": paths, 
-                "searchTerm": name, 
-                "foundCount": len(paths)
-            }
+        except requests.exceptions.RequestException as e:
+            return self._error(f"Request error: {str(e)}")
+        except json.JSONDecodeError as e:
+            return self._error(f"JSON decode error: {str(e)}")
+        except ValueError as e:
+            return self._error(str(e))
+    
+    def _find_on_server(self, object_filter: ObjectFilter, limit: Optional[int], cursor: Optional[str],
+                        page_size: Optional[int]) -> Optional[Dict]:
+        """Поиск через GET /objects/find (страницами до limit); None - сервер не знает этот маршрут"""
+        paged = cursor is not None or page_size is not None
+        paths: List[str] = []
+        instance_ids: List[Optional[int]] = []
+        next_cursor = cursor or None
+        while True:
+            page_limit = page_size or FIND_PAGE_SIZE
+            if limit:
+                page_limit = min(page_limit, limit - len(paths))
             
-            return {
-                "success": True,
-                "action": "find_objects",
-                "data": find_result,
-                "error": None
-            }
+            response = self.transport.request(**self.build_find_request(object_filter, page_limit, next_cursor))
+            if response.status_code == 404:
+                self.server_find = False
+                return None
+            response.raise_for_status()
+            data = json.loads(response.content)
+            if not self.has_find_route(data):
+                return None
+            if "error" in data:
+                return self._error(data["error"])
             
-        except requests.exceptions.RequestException as e:
+            page_paths = data.get("paths", [])
+            paths.extend(page_paths)
+            instance_ids.extend(data.get("instanceIds") or [None] * len(page_paths))
+            next_cursor = data.get("nextCursor")
+            if paged or not next_cursor or (limit and len(paths) >= limit):
+                break
+        
+        result = self._result(paths, object_filter.name, instance_ids)
+        if paged:
+            result["data"]["nextCursor"] = next_cursor
+        return result
+    
+    def build_find_request(self, object_filter: ObjectFilter, limit: int, cursor: Optional[str] = None) -> Dict:
+        """Описание одной страницы GET /objects/find"""
+        query = dict(object_filter.to_query(), limit=str(limit))
+        if cursor:
+            query["cursor"] = str(cursor)
+        return {"method": "GET", "path": "/objects/find", "params": query}
+    
+    @staticmethod
+    def fallback_error(object_filter: ObjectFilter, paged: bool) -> Optional[str]:
+        """Почему поиск нельзя выполнить по иерархии GET /scene (None - можно)"""
+        if paged:
+            return "cursor paging requires GET /objects/find"
+        if object_filter.tag is not None or object_filter.layer is not None:
+            return "tag and layer filters require GET /objects/find"
+        return None
+    
+    def has_find_route(self, data: Any) -> bool:
+        """Запоминает по ответу GET /objects/find, есть ли у сервера этот маршрут"""
+        self.server_find = not (isinstance(data, dict) and data.get("error") == ENDPOINT_NOT_FOUND)
+        return self.server_find
+    
+    def parse_find_response(self, data: Any, name: Optional[str]) -> Dict:
+        """Одна страница ответа GET /objects/find (продолжение - data["nextCursor"], если есть)"""
+        if not isinstance(data, dict) or "error" in data:
+            return self._error(data.get("error") if isinstance(data, dict) else "Invalid find response")
+        paths = data.get("paths", [])
+        result = self._result(paths, name, data.get("instanceIds") or [None] * len(paths))
+        if data.get("nextCursor"):
+            result["data"]["nextCursor"] = data["nextCursor"]
+        return result
+    
+    def _find_streaming(self, name: str, limit: Optional[int], chunk_size: int) -> Dict:
+        """Поиск по узлам потокового ответа GET /scene"""
+        needle = name.lower()
+        nodes_found = []
+        with open_scene_stream(self.transport, {"method": "GET", "path": "/scene"}, chunk_size) as nodes:
+            for node in nodes:
+                if needle in (node.get("name") or "").lower():
+                    nodes_found.append(node)
+                    if limit and len(nodes_found) >= limit:
+                        break
+        
+        if nodes.error is not None:
+            return self.parse_response({"error": nodes.error}, name)
+        return self._nodes_result(nodes_found, name)
+    
+    def _download(self) -> Dict:
+        """Загружает полную иерархию сцены (условным запросом, если есть ответ с ETag)"""
+        return self.validator.download(self.transport, self.build_request())
+    
+    def build_request(self, name: str = None) -> Dict:
+        """Описание HTTP-запроса: поиск выполняется по полной иерархии сцены (в колоночном формате)"""
+        return {"method": "GET", "path": "/scene", "params": dict(COLUMNAR_PARAMS)}
+    
+    def parse_response(self, hierarchy: Dict, name: str, index: Optional[HierarchyIndex] = None,
+                       limit: Optional[int] = None, object_filter: Optional[ObjectFilter] = None) -> Dict:
+        """Ищет объекты с подходящим именем (или подходящие под object_filter) в полученной иерархии"""
+        hierarchy = decode_hierarchy(hierarchy)
+        if not hierarchy or "error" in hierarchy:
             return {
                 "success": False,
                 "action": "find_objects",
-                "error": f"Request error: {str(e)}"
+                "error": hierarchy.get("error", "Failed to get hierarchy")
             }
-        except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "action": "find_objects",
-                "error": f"JSON decode error: {str(e)}"
-            }
\ No newline at end of file
+        
+        if object_filter is not None:
+            found = [node for node in _iter_nodes(hierarchy) if object_filter.matches_node(node)]
+        else:
+            index = index or HierarchyIndex(hierarchy)
+            found = index.find_by_name(name)
+        if limit:
+            found = found[:limit]
+        return self._nodes_result(found, name)
+    
+    def _nodes_result(self, nodes: List[Dict], name: str) -> Dict:
+        return self._result([node["path"] for node in nodes], name, [node.get("instanceId") for node in nodes])
+    
+    def _result(self, paths: List[str], name: str, instance_ids: List[Optional[int]]) -> Dict:
+        find_result = {
+            "paths": paths, 
+            "searchTerm": name, 
+            "foundCount": len(paths),
+            "handles": handles(paths, instance_ids)
+        }
+        
+        return {
+            "success": True,
+            "action": "find_objects",
+            "data": find_result,
+            "error": None
+        }
+    
+    @staticmethod
+    def _error(message: str) -> Dict:
+        return {
+            "success": False,
+            "action": "find_objects",
+            "error": message
+        }
+
+def _iter_nodes(hierarchy: Dict):
+    """Узлы иерархии в порядке обхода, как в ответе GET /objects/find"""
+    stack = list(reversed(hierarchy.get("rootObjects", []) or []))
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.get("children", []) or []))
\ No newline at end of file
@@ -1,13 +1,21 @@
 import requests
 import json
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from .http_transport import HttpTransport
+from .object_handle import ObjectHandle, ObjectTarget, object_fields, object_label
 
 class GetComponentsModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
-    def execute(self, object_path: str) -> Dict:
-        """Получает компоненты указанного объекта"""
+    def execute(self, object_path: ObjectTarget, component_types: Any = None, properties: Any = None,
+                depth: Optional[int] = None, max_array: Optional[int] = None) -> Dict:
+        """Получает компоненты указанного объекта
+        component_types - только эти компоненты (имена типов), properties - только эти пути свойств,
+        depth - глубина раскрытия массивов и вложенных структур, max_array - число читаемых элементов массива
+        """
         try:
             if not object_path:
                 return {
@@ -16,24 +24,10 @@ class GetComponentsModule:
                     "error": "object_path is required"
                 }
             
-            response = requests.get(
-                f"{self.base_url}/objects/components", 
-                params={"path": object_path}
-            )
+            request = self.build_request(object_path, component_types, properties, depth, max_array)
+            response = self.transport.request(**request)
             response.raise_for_status()
-            components = response.json()
-            
-            filtered_components = self._filter_inspector_properties(components) if components else None
-            
-            return {
-                "success": True,
-                "action": "get_components",
-                "data": {
-                    "object_path": object_path,
-                    "components": filtered_components
-                },
-                "error": components.get("error") if components and "error" in components else None
-            }
+            return self.parse_response(response.json(), object_path)
             
         except requests.exceptions.RequestException as e:
             return {
@@ -47,33 +41,54 @@ class GetComponentsModule:
                 "action": "get_components",
                 "error": f"JSON decode error: {str(e)}"
             }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "get_components",
+                "error": str(e)
+            }
     
-    def _filter_inspector_properties(self, components_data) -> Dict:
-        """Обрабатывает данные компонентов, полученные от Unity API"""
-        if not components_data:
-            return {}
-            
-        if isinstance(components_data, dict) and "error" in components_data:
-            return components_data
-        
-        # Если данные не являются словарем, возвращаем как есть
-        if not isinstance(components_data, dict):
-            return {"error": "Invalid components data format"}
-        
-        # Преобразуем структуру данных для удобства использования
-        filtered_components = {}
-        
-        for component_name, component_data in components_data.items():
-            if component_name == "error":
+    def build_request(self, object_path: ObjectTarget, component_types: Any = None, properties: Any = None,
+                      depth: Optional[int] = None, max_array: Optional[int] = None) -> Dict:
+        """Описание HTTP-запроса за компонентами объекта (сервер читает только выбранные компоненты и свойства)"""
+        params = object_fields(object_path, id_key="instance_id")
+        if "instance_id" in params:
+            params["instance_id"] = str(params["instance_id"])
+        component_types = _parse_list(component_types)
+        if component_types:
+            params["components"] = ",".join(component_types)
+        properties = _parse_list(properties)
+        if properties:
+            params["properties"] = ",".join(properties)
+        for key, value in (("depth", depth), ("max_array", max_array)):
+            if value is None or value == "":
                 continue
-            
-            # Проверяем, что component_data является словарем
-            if not isinstance(component_data, dict):
-                filtered_components[component_name] = component_data
-                continue
-            
-            # Unity API теперь возвращает только Inspector-видимые свойства,
-            # поэтому просто передаем данные как есть
-            filtered_components[component_name] = component_data
+            if isinstance(value, bool) or not str(value).isdigit():
+                raise ValueError(f"{key} must be a non-negative integer")
+            params[key] = str(int(value))
+        return {"method": "GET", "path": "/objects/components", "params": params}
+    
+    def parse_response(self, components: Dict, object_path: ObjectTarget) -> Dict:
+        """Формирует структурированный ответ из данных компонентов (ответ передается без копирования)"""
+        if components is not None and not isinstance(components, dict):
+            components = {"error": "Invalid components data format"}
         
-        return filtered_components
\ No newline at end of file
+        data = {
+            "object_path": (components or {}).get("path") or object_label(object_path),
+            "components": components or None
+        }
+        if components and components.get("instanceId") is not None:
+            data["handle"] = ObjectHandle(components["instanceId"], data["object_path"])
+        return {
+            "success": True,
+            "action": "get_components",
+            "data": data,
+            "error": components.get("error") if components and "error" in components else None
+        }
+
+def _parse_list(value: Any) -> List[str]:
+    """Список или строка через запятую -> список непустых имен"""
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else list(value)
+    return [str(item).strip() for item in items if str(item).strip()]
\ No newline at end of file
@@ -0,0 +1,138 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .deep_json import loads
+from .hierarchy_columnar import decode_hierarchy
+from .hierarchy_index import HierarchyIndex
+
+DEFAULT_HIERARCHY_TTL = 2.0
+
+# Действия, после которых снимок иерархии считается устаревшим
+MUTATING_ACTIONS = ("create_object", "delete_object", "add_component", "remove_component", "open_scene", "set_transforms",
+                    "create_objects")
+
+def invalidates_hierarchy(action: Optional[str], params: Optional[Dict] = None) -> bool:
+    """Меняет ли команда иерархию сцены"""
+    if action in MUTATING_ACTIONS:
+        return True
+    if action == "modify_component":
+        return (params or {}).get("component_type") == "Transform"
+    return False
+
+class HierarchyValidator:
+    """Последний ответ GET /scene с его ETag для условных запросов (If-None-Match)
+
+    Сервер отвечает 304 без тела, если версия сцены не изменилась, и тогда
+    используется сохраненный ответ. В отличие от снимка HierarchyCache, ответ
+    не сбрасывается при инвалидации: устаревшим его признает сам сервер.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._etag: Optional[str] = None
+        self._hierarchy: Optional[Dict] = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._etag
+
+    def request_headers(self) -> Dict[str, str]:
+        """Заголовки условного запроса (пусто, если сохраненного ответа нет)"""
+        with self._lock:
+            return {"If-None-Match": self._etag} if self._etag else {}
+
+    def resolve(self, response: Any) -> Optional[Dict]:
+        """Иерархия из ответа: сохраненная для 304, иначе разобранное тело (с ETag - запоминается).
+        None - ответ 304, но сохраненного ответа уже нет (запрос нужно повторить без условия)"""
+        if response.status_code == 304:
+            with self._lock:
+                return self._hierarchy
+
+        hierarchy = decode_hierarchy(loads(response.content))
+        etag = response.headers.get("ETag")
+        with self._lock:
+            if etag and isinstance(hierarchy, dict) and "error" not in hierarchy:
+                self._etag, self._hierarchy = etag, hierarchy
+            else:
+                self._etag, self._hierarchy = None, None
+        return hierarchy
+
+    def download(self, transport: Any, request: Dict) -> Dict:
+        """Выполняет условный запрос за иерархией через транспорт"""
+        headers = self.request_headers()
+        if headers:
+            request = dict(request, headers={**(request.get("headers") or {}), **headers})
+        response = transport.request(**request)
+        response.raise_for_status()
+        hierarchy = self.resolve(response)
+        if hierarchy is None:
+            response = transport.request(**{k: v for k, v in request.items() if k != "headers"})
+            response.raise_for_status()
+            hierarchy = self.resolve(response)
+        return hierarchy
+
+    def reset(self) -> None:
+        with self._lock:
+            self._etag, self._hierarchy = None, None
+
+class HierarchyCache:
+    """Снимок иерархии сцены (ответ GET /scene) с временем жизни и явной инвалидацией"""
+
+    def __init__(self, ttl: float = DEFAULT_HIERARCHY_TTL):
+        self.ttl = ttl
+        # Общий для модулей последний ответ с ETag: после инвалидации снимок перепроверяется условным запросом
+        self.validator = HierarchyValidator()
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._index: Optional[HierarchyIndex] = None
+        self._loaded_at = 0.0
+        # Счетчик инвалидаций: снимок, загрузка которого началась до инвалидации, не сохраняется
+        self._generation = 0
+
+    def get(self) -> Optional[Dict]:
+        """Возвращает актуальный снимок или None"""
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._snapshot
+            return None
+
+    def get_or_load(self, loader: Callable[[], Dict]) -> Dict:
+        """Возвращает снимок из кэша или загружает его через loader"""
+        if self.ttl <= 0:
+            return loader()
+
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._loaded_at < self.ttl:
+                return self._snapshot
+            generation = self._generation
+
+        hierarchy = loader()
+
+        # Ответы с ошибкой не кэшируются
+        if isinstance(hierarchy, dict) and "error" not in hierarchy:
+            with self._lock:
+                if generation == self._generation:
+                    self._snapshot = hierarchy
+                    self._index = None
+                    self._loaded_at = time.monotonic()
+        return hierarchy
+
+    def index_for(self, hierarchy: Dict) -> HierarchyIndex:
+        """Индекс снимка: для закэшированного снимка строится один раз, для остальных - заново"""
+        with self._lock:
+            if hierarchy is self._snapshot and self._index is not None:
+                return self._index
+
+        index = HierarchyIndex(hierarchy)
+        with self._lock:
+            if hierarchy is self._snapshot:
+                self._index = index
+        return index
+
+    def invalidate(self) -> None:
+        """Сбрасывает снимок и его индекс"""
+        with self._lock:
+            self._snapshot = None
+            self._index = None
+            self._generation += 1
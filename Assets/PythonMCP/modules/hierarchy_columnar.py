@@ -0,0 +1,105 @@
+import gc
+from typing import Any, Dict, List, Optional
+
+# GET /scene?format=columnar: иерархия параллельными массивами в порядке обхода
+COLUMNAR_FORMAT = "columnar"
+COLUMNAR_PARAMS = {"format": COLUMNAR_FORMAT}
+
+def is_columnar(data: Any) -> bool:
+    return isinstance(data, dict) and data.get("format") == COLUMNAR_FORMAT
+
+def decode_hierarchy(data: Any) -> Any:
+    """Колоночный ответ GET /scene -> иерархия в обычном формате; другие ответы возвращаются как есть
+
+    Имена, теги и типы компонентов - индексы в общей таблице строк strings, parent - индекс
+    родителя (-1 у корней). Родитель всегда раньше детей, поэтому пути и дерево
+    восстанавливаются за один проход. Колонки полей, не запрошенных через fields, отсутствуют.
+    """
+    if not is_columnar(data):
+        return data
+
+    # Десятки тысяч новых dict и list запускают сборку мусора, которая обходит все дерево
+    # (без паузы сборщика разбор в несколько раз медленнее); циклических ссылок тут нет
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+def _decode(data: Dict) -> Dict:
+    strings: List[str] = data["strings"]
+    names: List[int] = data["name"]
+    parents: List[int] = data["parent"]
+    fields = data.get("fields")
+    with_name = fields is None or "name" in fields
+    with_path = fields is None or "path" in fields
+    instance_ids: Optional[List[int]] = data.get("instanceId")
+    active: Optional[List[int]] = data.get("active")
+    tags: Optional[List[int]] = data.get("tag")
+    layers: Optional[List[int]] = data.get("layer")
+    positions: Optional[List[float]] = data.get("position")
+    rotations: Optional[List[float]] = data.get("rotation")
+    scales: Optional[List[float]] = data.get("scale")
+    component_counts: Optional[List[int]] = data.get("componentCount")
+    component_types: List[int] = data.get("componentTypes") or []
+    child_counts: Optional[List[int]] = data.get("childCount")
+    # Путь родителя начального объекта (при from_path), пути корней ответа продолжают его
+    base_path: str = data.get("basePath") or ""
+
+    nodes: List[Dict] = []
+    paths: List[str] = []
+    roots: List[Dict] = []
+    offset = 0
+    for i, parent in enumerate(parents):
+        name = strings[names[i]]
+        if parent < 0:
+            path, siblings = (f"{base_path}/{name}" if base_path else name), roots
+        else:
+            path, siblings = f"{paths[parent]}/{name}", nodes[parent]["children"]
+
+        node: Dict[str, Any] = {}
+        if with_name:
+            node["name"] = name
+        if with_path:
+            node["path"] = path
+        if instance_ids is not None:
+            node["instanceId"] = instance_ids[i]
+        if active is not None:
+            node["active"] = bool(active[i])
+        if tags is not None:
+            node["tag"] = strings[tags[i]]
+        if layers is not None:
+            node["layer"] = layers[i]
+        if positions is not None:
+            node["position"] = {"x": positions[3 * i], "y": positions[3 * i + 1], "z": positions[3 * i + 2]}
+        if rotations is not None:
+            node["rotation"] = {"x": rotations[4 * i], "y": rotations[4 * i + 1], "z": rotations[4 * i + 2], "w": rotations[4 * i + 3]}
+        if scales is not None:
+            node["scale"] = {"x": scales[3 * i], "y": scales[3 * i + 1], "z": scales[3 * i + 2]}
+        if component_counts is not None:
+            count = component_counts[i]
+            node["components"] = [strings[t] for t in component_types[offset:offset + count]]
+            offset += count
+        node["children"] = []
+        nodes.append(node)
+        paths.append(path)
+        siblings.append(node)
+
+    # childCount приходит для всех узлов, отброшенные дети есть только у узлов на границе max_depth
+    if child_counts is not None:
+        for node, child_count in zip(nodes, child_counts):
+            if child_count and not node["children"]:
+                node["childCount"] = child_count
+
+    hierarchy = {
+        "sceneName": data.get("sceneName"),
+        "scenePath": data.get("scenePath"),
+        "rootObjects": roots,
+        "totalObjects": data.get("totalObjects", len(nodes))
+    }
+    for key in ("fromPath", "projected"):
+        if key in data:
+            hierarchy[key] = data[key]
+    return hierarchy
@@ -0,0 +1,219 @@
+import difflib
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Минимальное сходство имен (SequenceMatcher.ratio) для группировки объектов
+SIMILARITY_THRESHOLD = 0.75
+
+def components_signature(obj: Dict) -> tuple:
+    """Набор компонентов объекта без учета порядка: ((тип, количество), ...)"""
+    comps = obj.get("components", []) or []
+    if not isinstance(comps, list):
+        return tuple()
+    counter = Counter([str(c) for c in comps])
+    return tuple(sorted(counter.items()))
+
+def rebuild_components_from_signature(sig: tuple) -> List[str]:
+    comps: List[str] = []
+    for type_name, cnt in sig:
+        comps.extend([type_name] * int(cnt))
+    return comps
+
+def get_parent_path(obj_path: str) -> str:
+    """Извлекает путь родителя из пути объекта"""
+    if not obj_path or "/" not in obj_path:
+        return ""
+    return obj_path.rpartition("/")[0]
+
+class _Candidate:
+    """Одиночный объект, участвующий в группировке по сходству имен"""
+    __slots__ = ("name", "lower", "chars", "mask", "sig", "obj")
+
+    def __init__(self, name: str, sig: tuple, obj: Dict):
+        self.name = name
+        self.lower = (name or "").lower()
+        self.chars = Counter(self.lower)
+        # Битовая маска символов (по модулю 128): совпадения битов только ослабляют оценку, но не делают ее неверной
+        self.mask = 0
+        for ch in self.chars:
+            self.mask |= 1 << (ord(ch) & 127)
+        self.sig = sig
+        self.obj = obj
+
+def _is_similar(seed: _Candidate, other: _Candidate) -> bool:
+    """Сходство имен >= SIMILARITY_THRESHOLD; дешевые верхние оценки отсекают заведомо непохожие пары"""
+    if seed.name == other.name:
+        return True
+    total = len(seed.lower) + len(other.lower)
+    if not total:
+        return True
+    # Оценка real_quick_ratio: совпадений не больше длины более короткого имени
+    if 2.0 * min(len(seed.lower), len(other.lower)) / total < SIMILARITY_THRESHOLD:
+        return False
+    # Каждый символ одного имени, отсутствующий в другом, исключает хотя бы одно совпадение
+    common = min(len(seed.lower) - (seed.mask & ~other.mask).bit_count(),
+                 len(other.lower) - (other.mask & ~seed.mask).bit_count())
+    if 2.0 * common / total < SIMILARITY_THRESHOLD:
+        return False
+    # Оценка quick_ratio: совпадений не больше пересечения наборов символов
+    common = sum(min(count, other.chars.get(ch, 0)) for ch, count in seed.chars.items())
+    if 2.0 * common / total < SIMILARITY_THRESHOLD:
+        return False
+    return difflib.SequenceMatcher(None, seed.lower, other.lower).ratio() >= SIMILARITY_THRESHOLD
+
+def group_siblings(children_raw: List[Dict]) -> Tuple[List[Tuple[str, tuple, List[Dict]]], List[List[_Candidate]]]:
+    """Группирует объекты списка детей
+
+    Возвращает точные группы (одинаковые имя и компоненты) в порядке первого появления
+    и группы по сходству имен в порядке первого объекта группы. Группы по сходству
+    собираются жадно: первый свободный объект забирает все последующие свободные объекты
+    с тем же родителем, теми же компонентами и похожим на его имя именем.
+    """
+    exact_groups: Dict[tuple, List[Dict]] = {}
+    for ch in children_raw or []:
+        key = (ch.get("name"), components_signature(ch))
+        exact_groups.setdefault(key, []).append(ch)
+
+    exact: List[Tuple[str, tuple, List[Dict]]] = []
+    singles: List[_Candidate] = []
+    for (name, sig), items in exact_groups.items():
+        if len(items) == 1:
+            singles.append(_Candidate(name, sig, items[0]))
+        else:
+            exact.append((name, sig, items))
+
+    # Сравниваются только объекты с одинаковыми компонентами и родителем
+    buckets: Dict[tuple, List[int]] = {}
+    bucket_keys: List[tuple] = []
+    for i, candidate in enumerate(singles):
+        key = (candidate.sig, get_parent_path(candidate.obj.get("path", "")))
+        buckets.setdefault(key, []).append(i)
+        bucket_keys.append(key)
+
+    similar: List[List[_Candidate]] = []
+    used = [False] * len(singles)
+    for i, seed in enumerate(singles):
+        if used[i]:
+            continue
+        used[i] = True
+        group = [seed]
+        key = bucket_keys[i]
+        remaining: List[int] = []
+        # Все объекты корзины до seed уже распределены, поэтому в ней остаются только последующие
+        for j in buckets[key]:
+            if used[j]:
+                continue
+            if _is_similar(seed, singles[j]):
+                used[j] = True
+                group.append(singles[j])
+            else:
+                remaining.append(j)
+        buckets[key] = remaining
+        similar.append(group)
+
+    return exact, similar
+
+def _format_level(children_raw: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+    """Форматирует один уровень: узлы результата и сырые дети, которыми заполняется их children"""
+    exact, similar = group_siblings(children_raw)
+    formatted: List[Tuple[Dict, List[Dict]]] = []
+
+    # Точно одинаковые объекты
+    for name, sig, items in exact:
+        merged_children_raw: List[Dict] = []
+        for it in items:
+            merged_children_raw.extend(it.get("children", []))
+
+        path_list = [it.get("path") for it in items if it.get("path")]
+        pc = Counter(path_list)
+
+        grouped_node = {
+            "name": name,
+            "count": len(items),
+            "components": rebuild_components_from_signature(sig),
+            "children": []
+        }
+
+        if len(pc) == 1:
+            only_path = next(iter(pc.keys())) if pc else None
+            if only_path:
+                grouped_node["path"] = only_path
+        elif len(pc) > 1:
+            grouped_node["path_groups"] = [
+                {"path": p, "count": c} for p, c in sorted(pc.items())
+            ]
+
+        formatted.append((grouped_node, merged_children_raw))
+
+    # Группы по сходству имен
+    for group in similar:
+        if len(group) == 1:
+            obj = group[0].obj
+            formatted.append((_object_node(obj), obj.get("children", [])))
+            continue
+
+        names = [item.name for item in group]
+        merged_children_raw = []
+        for item in group:
+            merged_children_raw.extend(item.obj.get("children", []))
+
+        # Базовое имя - самое частое, при равенстве первое
+        name_counter = Counter(names)
+        base_name = name_counter.most_common(1)[0][0] if name_counter else names[0]
+
+        formatted.append(({
+            "name": base_name,
+            "names": sorted(list(set(names))),
+            "count": len(group),
+            "components": rebuild_components_from_signature(group[0].sig),
+            "children": []
+        }, merged_children_raw))
+
+    return formatted
+
+def _fill_children(children_raw: List[Dict], target: List[Dict]) -> None:
+    """Заполняет target отформатированными детьми; обход с явным стеком, без рекурсии"""
+    stack = [(children_raw, target)]
+    while stack:
+        raw, formatted = stack.pop()
+        if not raw:
+            continue
+        for node, node_children_raw in _format_level(raw):
+            formatted.append(node)
+            stack.append((node_children_raw, node["children"]))
+
+def _object_node(obj: Dict) -> Dict:
+    node = {
+        "name": obj.get("name"),
+        "path": obj.get("path"),
+        "active": obj.get("active", True),
+        "components": list(obj.get("components", []) or []),
+        "children": []
+    }
+    # Дети за границей max_depth не загружались: показывается только их число
+    if obj.get("childCount"):
+        node["childCount"] = obj["childCount"]
+    return node
+
+def format_children(children_raw: List[Dict]) -> List[Dict]:
+    """Форматирует детей с группировкой одинаковых и похожих по имени объектов"""
+    formatted_children: List[Dict] = []
+    _fill_children(children_raw, formatted_children)
+    return formatted_children
+
+def format_object(obj: Dict) -> Dict:
+    """Форматирует отдельный объект"""
+    node = _object_node(obj)
+    _fill_children(obj.get("children", []), node["children"])
+    return node
+
+def format_hierarchy(hierarchy: Dict) -> Dict:
+    """Форматирует иерархию сцены как JSON дерево с группировкой объектов"""
+    if not hierarchy or "error" in hierarchy:
+        return hierarchy
+
+    return {
+        "scene_name": hierarchy.get("sceneName", "Unknown"),
+        "root_objects": format_children(hierarchy.get("rootObjects", [])),
+        "total_objects": hierarchy.get("totalObjects", 0)
+    }
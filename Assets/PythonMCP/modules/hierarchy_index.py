@@ -0,0 +1,115 @@
+import heapq
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class HierarchyIndex:
+    """Индексы снимка иерархии (ответа GET /scene): путь -> узел, имя -> узлы и триграммы для поиска подстрок
+
+    Строится один раз на снимок. Узлы нумеруются в порядке обхода дерева,
+    поэтому результаты поиска возвращаются в том же порядке, что и при рекурсивном обходе.
+    Сравнение без учета регистра выполняется через lower(), как и в прежнем поиске.
+    """
+
+    def __init__(self, hierarchy: Dict):
+        self.nodes: List[Dict] = []
+        self.by_path: Dict[str, int] = {}
+        # Имя в нижнем регистре -> порядковые номера узлов (по возрастанию)
+        self.by_name: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self._name_trigrams: Optional[Dict[str, Set[str]]] = None
+        self._paths_lower: Optional[List[str]] = None
+        self._path_trigrams: Optional[Dict[str, List[int]]] = None
+
+        stack = list(reversed((hierarchy or {}).get("rootObjects", []) or []))
+        while stack:
+            node = stack.pop()
+            ordinal = len(self.nodes)
+            self.nodes.append(node)
+
+            path = node.get("path")
+            if isinstance(path, str):
+                # При совпадающих путях побеждает первый объект, как в transform.Find
+                self.by_path.setdefault(path, ordinal)
+
+            self.by_name.setdefault((node.get("name") or "").lower(), []).append(ordinal)
+            stack.extend(reversed(node.get("children", []) or []))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def get(self, path: str) -> Optional[Dict]:
+        """Узел с точно совпадающим путем"""
+        ordinal = self.by_path.get(path)
+        return self.nodes[ordinal] if ordinal is not None else None
+
+    def find_by_name(self, text: str) -> List[Dict]:
+        """Узлы, имя которых содержит text без учета регистра, в порядке обхода"""
+        needle = text.lower()
+        postings = [self.by_name[name] for name in self._candidate_names(needle) if needle in name]
+        if len(postings) == 1:
+            return [self.nodes[i] for i in postings[0]]
+        return [self.nodes[i] for i in heapq.merge(*postings)]
+
+    def find_path_containing(self, text: str) -> Optional[Dict]:
+        """Первый в порядке обхода узел, путь которого содержит text без учета регистра"""
+        needle = text.lower()
+        self._ensure_path_index()
+        if len(needle) < 3:
+            candidates: Iterable[int] = range(len(self.nodes))
+        else:
+            candidates = self._intersect([self._path_trigrams.get(t) for t in _trigrams(needle)])
+        for ordinal in candidates:
+            if needle in self._paths_lower[ordinal]:
+                return self.nodes[ordinal]
+        return None
+
+    def _candidate_names(self, needle: str) -> Iterable[str]:
+        """Имена, которые могут содержать needle: пересечение списков по триграммам запроса"""
+        if len(needle) < 3:
+            return self.by_name.keys()
+
+        with self._lock:
+            if self._name_trigrams is None:
+                name_trigrams: Dict[str, Set[str]] = {}
+                for name in self.by_name:
+                    for trigram in _trigrams(name):
+                        name_trigrams.setdefault(trigram, set()).add(name)
+                self._name_trigrams = name_trigrams
+
+        sets = [self._name_trigrams.get(t) for t in _trigrams(needle)]
+        if any(s is None for s in sets):
+            return ()
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def _ensure_path_index(self) -> None:
+        with self._lock:
+            if self._paths_lower is not None:
+                return
+            paths_lower = []
+            path_trigrams: Dict[str, List[int]] = {}
+            for ordinal, node in enumerate(self.nodes):
+                path = node.get("path", "")
+                path = path.lower() if isinstance(path, str) else ""
+                paths_lower.append(path)
+                for trigram in _trigrams(path):
+                    path_trigrams.setdefault(trigram, []).append(ordinal)
+            self._path_trigrams = path_trigrams
+            self._paths_lower = paths_lower
+
+    @staticmethod
+    def _intersect(postings: List[Optional[List[int]]]) -> List[int]:
+        """Пересечение отсортированных списков номеров, результат по возрастанию"""
+        if not postings or any(p is None for p in postings):
+            return []
+        postings = sorted(postings, key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            members = set(other)
+            result = [i for i in result if i in members]
+            if not result:
+                break
+        return result
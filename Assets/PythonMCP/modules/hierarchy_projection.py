@@ -0,0 +1,114 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .hierarchy_index import HierarchyIndex
+
+# Поля узла, которые можно запросить у GET /scene параметром fields (children есть всегда)
+HIERARCHY_FIELDS = ("name", "path", "instanceId", "active", "tag", "layer", "position", "rotation", "scale", "components")
+# Поля узла в ответе без fields (их же хранят снимок HierarchyCache и SceneMirror)
+DEFAULT_HIERARCHY_FIELDS = ("name", "path", "instanceId", "active", "components")
+
+def parse_fields(fields: Any) -> Optional[List[str]]:
+    """fields как список или строка через запятую -> список полей в каноническом порядке (None - все поля по умолчанию)"""
+    if fields is None or fields == "":
+        return None
+    names = fields.split(",") if isinstance(fields, str) else list(fields)
+    names = [str(name).strip() for name in names if str(name).strip()]
+    unknown = [name for name in names if name not in HIERARCHY_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return [name for name in HIERARCHY_FIELDS if name in names] or None
+
+def parse_max_depth(max_depth: Any) -> Optional[int]:
+    if max_depth is None or max_depth == "":
+        return None
+    try:
+        value = int(max_depth)
+    except (TypeError, ValueError):
+        value = -1
+    if value < 0 or isinstance(max_depth, bool):
+        raise ValueError("max_depth must be a non-negative integer")
+    return value
+
+def projection_args(params: Optional[Dict]) -> Tuple[Optional[str], Optional[int], Optional[List[str]]]:
+    """(from_path, max_depth, fields) из параметров get_hierarchy; ValueError - некорректные max_depth или fields"""
+    if not params:
+        return None, None, None
+    from_path = params.get("from_path") or params.get("path") or params.get("path_contains")
+    from_path = from_path.strip() if isinstance(from_path, str) and from_path.strip() else None
+    return from_path, parse_max_depth(params.get("max_depth")), parse_fields(params.get("fields"))
+
+def projection_query(params: Optional[Dict]) -> Dict[str, str]:
+    """Параметры запроса GET /scene для проекции (пусто - нужна вся иерархия)"""
+    from_path, max_depth, fields = projection_args(params)
+    query: Dict[str, str] = {}
+    if from_path:
+        query["from_path"] = from_path
+    if max_depth is not None:
+        query["max_depth"] = str(max_depth)
+    if fields is not None:
+        query["fields"] = ",".join(fields)
+    return query
+
+def find_start(index: Any, needle: str) -> Optional[Dict]:
+    """Узел с точно совпадающим путем, иначе первый узел, путь которого содержит указанную подстроку"""
+    return index.get(needle) or index.find_path_containing(needle)
+
+def project_hierarchy(hierarchy: Dict, from_path: Optional[str] = None, max_depth: Optional[int] = None,
+                      fields: Optional[List[str]] = None, index: Optional[Any] = None) -> Dict:
+    """Проекция полной иерархии с той же семантикой, что у GET /scene?from_path=&max_depth=&fields=
+
+    Поддерево from_path (если объект не найден - вся сцена), глубина max_depth от начальных
+    узлов (у узлов на границе children пуст, а childCount - число отброшенных детей),
+    только поля fields. Без max_depth и fields узлы не копируются.
+    """
+    roots: List[Dict] = hierarchy.get("rootObjects", []) or []
+    result = {"sceneName": hierarchy.get("sceneName", "Unknown"), "scenePath": hierarchy.get("scenePath")}
+    total = hierarchy.get("totalObjects", 0)
+
+    if from_path:
+        found = find_start(index or HierarchyIndex(hierarchy), from_path)
+        if found:
+            roots = [found]
+            result["fromPath"] = found.get("path")
+            total = None
+
+    if max_depth is None and fields is None:
+        result["rootObjects"] = roots
+        result["totalObjects"] = _count_nodes(roots) if total is None else total
+        result["projected"] = True
+        return result
+
+    keep = fields or HIERARCHY_FIELDS
+    projected: List[Dict] = []
+    count = 0
+    stack = [(node, projected, 0) for node in reversed(roots)]
+    while stack:
+        node, siblings, depth = stack.pop()
+        projected_node = {key: node[key] for key in keep if key in node}
+        children = node.get("children", []) or []
+        count += 1
+        if max_depth is not None and depth >= max_depth:
+            child_count = len(children) or node.get("childCount", 0)
+            if child_count:
+                projected_node["childCount"] = child_count
+            projected_node["children"] = []
+        else:
+            if node.get("childCount"):
+                projected_node["childCount"] = node["childCount"]
+            projected_node["children"] = []
+            stack.extend((child, projected_node["children"], depth + 1) for child in reversed(children))
+        siblings.append(projected_node)
+
+    result["rootObjects"] = projected
+    result["totalObjects"] = count
+    result["projected"] = True
+    return result
+
+def _count_nodes(roots: List[Dict]) -> int:
+    total = 0
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        total += 1
+        stack.extend(node.get("children", []) or [])
+    return total
@@ -0,0 +1,82 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterable, Optional, Tuple
+
+DEFAULT_CONNECT_TIMEOUT = 3.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.1
+# Повтор чтения безопасен только для идемпотентных запросов;
+# ошибки установки соединения повторяются для любых методов
+DEFAULT_RETRY_METHODS = ("GET", "HEAD")
+RETRY_STATUS_CODES = (502, 503, 504)
+
+class HttpTransport:
+    """Общий HTTP-транспорт клиента: keep-alive сессия с ограниченным пулом соединений,
+    таймаутами на подключение/чтение и политикой повторов"""
+
+    def __init__(self, base_url: str,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 retry_methods: Iterable[str] = DEFAULT_RETRY_METHODS):
+        self.base_url = base_url.rstrip("/")
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(m.upper() for m in retry_methods),
+            raise_on_status=False
+        )
+        # Все запросы идут на один хост, поэтому достаточно одного пула;
+        # pool_block не дает открывать соединения сверх pool_maxsize
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=True
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, path: str, timeout: Optional[Tuple[float, float]] = None, **kwargs) -> requests.Response:
+        """Выполняет запрос к Unity API через общую сессию"""
+        return self.session.request(
+            method,
+            f"{self.base_url}{path}",
+            timeout=timeout or self.timeout,
+            **kwargs
+        )
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self) -> None:
+        """Закрывает все соединения пула"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,56 +1,185 @@
+import atexit
+import gzip
 import os
+import queue
+import shutil
 import tempfile
-import json
+import threading
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
 
-MAX_LOG_CHARS = 10000000
+from .deep_json import dumps, to_json
+
+MAX_LOG_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_FLUSH_INTERVAL = 0.5
+MAX_QUEUED_RECORDS = 10000
 LOG_FILENAME = "unity_api_client.log.txt"
 
 class LoggingModule:
-    def __init__(self):
-        self._clear_log_file()
-    
+    """Журнал команд: одна строка JSON на запись, дозапись в файл из фонового потока
+
+    Записи ставятся в очередь и сбрасываются на диск пачками. Когда файл превышает
+    max_bytes, он переименовывается в .1 (старые сегменты сдвигаются, хранится backup_count
+    сегментов, при compress=True они сжимаются gzip; max_bytes=0 отключает ротацию).
+    Если очередь переполнена, записи отбрасываются: логирование не должно тормозить
+    основную работу (drop_when_full=False - вместо этого ждать места в очереди).
+    """
+
+    def __init__(self, log_path: Optional[str] = None, max_bytes: int = MAX_LOG_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, compress: bool = False,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, clear_on_start: bool = True,
+                 drop_when_full: bool = True):
+        self.log_path = log_path or os.path.join(tempfile.gettempdir(), LOG_FILENAME)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.drop_when_full = drop_when_full
+        self.dropped_records = 0
+        # Записи, которые не удалось сериализовать, и последняя такая ошибка
+        self.failed_records = 0
+        self.last_error: Optional[str] = None
+
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(MAX_QUEUED_RECORDS)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        if clear_on_start:
+            self._clear_log_file()
+
     def get_log_file_path(self) -> str:
         """Публичный метод: получить путь к лог-файлу"""
         return self._get_log_path()
-    
+
     def log_structured(self, request_payload: Dict, response_payload: Dict) -> None:
         """Логирует структурированный запрос и ответ"""
+        self.log_record({
+            "ts": datetime.utcnow().isoformat() + "Z",
+            "request": request_payload,
+            "response": response_payload
+        })
+
+    def log_record(self, record: Dict) -> None:
+        """Записывает произвольную запись одной строкой JSON"""
+        try:
+            # Сериализация в вызывающем потоке: ответ может измениться после возврата вызывающему коду.
+            # Массивы (NumPy, array, memoryview) в параметрах команд записываются списками
+            line = dumps(record, ensure_ascii=False, separators=(",", ":"), default=to_json)
+        except Exception as e:
+            # Логирование ошибок логгера не должно мешать основной работе, но потеря записи учитывается
+            self.failed_records += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            return
+        self._enqueue(line)
+
+    def flush(self) -> None:
+        """Дожидается записи всех поставленных в очередь записей"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Записывает оставшиеся записи и останавливает фоновый поток"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+            # Регистрация в atexit держит ссылку на логгер до выхода из процесса
+            atexit.unregister(self.close)
+
+    def _enqueue(self, line: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer_loop, name="UnityAPILogWriter", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
         try:
-            ts = datetime.utcnow().isoformat() + "Z"
-            entry = (
-                f"[{ts}] REQUEST:\n" +
-                json.dumps(request_payload, ensure_ascii=False, indent=2) +
-                "\nRESPONSE:\n" +
-                json.dumps(response_payload, ensure_ascii=False, indent=2) +
-                "\n\n"
-            )
-            log_path = self._get_log_path()
+            self._queue.put(line, block=not self.drop_when_full)
+        except queue.Full:
+            self.dropped_records += 1
+
+    def _writer_loop(self) -> None:
+        """Фоновый поток: забирает записи пачками и дописывает их в файл"""
+        stop = False
+        while not stop:
             try:
-                with open(log_path, "r", encoding="utf-8") as f:
-                    existing = f.read()
-            except FileNotFoundError:
-                existing = ""
-            combined = existing + entry
-            if len(combined) > MAX_LOG_CHARS:
-                combined = combined[-MAX_LOG_CHARS:]
-            with open(log_path, "w", encoding="utf-8") as f:
-                f.write(combined)
-        except Exception:
-            # Логирование ошибок логгера не должно мешать основной работе
-            pass
-    
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch: List[Optional[str]] = [first]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [line for line in batch if line is not None]
+            stop = len(lines) != len(batch)
+            try:
+                if lines:
+                    self._write("\n".join(lines) + "\n")
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, text: str) -> None:
+        log_path = self._get_log_path()
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(text)
+            size = f.tell()
+        if self.max_bytes and size >= self.max_bytes:
+            self._rotate()
+
+    def _segment_path(self, index: int) -> str:
+        suffix = ".gz" if self.compress else ""
+        return f"{self._get_log_path()}.{index}{suffix}"
+
+    def _rotate(self) -> None:
+        """Сдвигает сегменты: текущий файл становится .1, самый старый удаляется"""
+        log_path = self._get_log_path()
+        if self.backup_count <= 0:
+            os.remove(log_path)
+            return
+
+        oldest = self._segment_path(self.backup_count)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self._segment_path(index)
+            if os.path.exists(source):
+                os.replace(source, self._segment_path(index + 1))
+
+        if self.compress:
+            with open(log_path, "rb") as src, gzip.open(self._segment_path(1), "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(log_path)
+        else:
+            os.replace(log_path, self._segment_path(1))
+
     def _get_log_path(self) -> str:
         """Получает путь к файлу логов"""
-        return os.path.join(tempfile.gettempdir(), LOG_FILENAME)
-    
+        return self.log_path
+
     def _clear_log_file(self) -> None:
-        """Удаляет временный файл логов перед началом работы"""
-        try:
-            log_path = self._get_log_path()
-            if os.path.exists(log_path):
-                os.remove(log_path)
-        except Exception:
-            # Ошибки при удалении лог-файла не должны мешать основной работе
-            pass
\ No newline at end of file
+        """Удаляет файл логов и его сегменты перед началом работы"""
+        paths = [self._get_log_path()]
+        for index in range(1, self.backup_count + 1):
+            paths.append(f"{self._get_log_path()}.{index}")
+            paths.append(f"{self._get_log_path()}.{index}.gz")
+        for log_path in paths:
+            try:
+                if os.path.exists(log_path):
+                    os.remove(log_path)
+            except Exception:
+                # Ошибки при удалении лог-файла не должны мешать основной работе
+                pass
@@ -1,12 +1,16 @@
 import requests
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from .http_transport import HttpTransport
+from .object_handle import ObjectTarget, object_fields
 
 class ModifyComponentModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
-    def execute(self, object_path: str, component_type: str, properties: Dict[str, Any]) -> Dict:
+    def execute(self, object_path: ObjectTarget, component_type: str, properties: Dict[str, Any]) -> Dict:
         """Модифицирует свойства компонента объекта"""
         try:
             if not all([object_path, component_type]):
@@ -16,23 +20,9 @@ class ModifyComponentModule:
                     "error": "object_path and component_type are required"
                 }
             
-            response = requests.put(
-                f"{self.base_url}/objects/components/modify", 
-                json={
-                    "path": object_path, 
-                    "componentType": component_type, 
-                    "properties": properties
-                }
-            )
+            response = self.transport.request(**self.build_request(object_path, component_type, properties))
             response.raise_for_status()
-            modify_result = response.json()
-            
-            return {
-                "success": modify_result.get("success", False),
-                "action": "modify_component",
-                "data": modify_result if modify_result.get("success") else None,
-                "error": modify_result.get("error")
-            }
+            return self.parse_response(response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -46,20 +36,47 @@ class ModifyComponentModule:
                 "action": "modify_component",
                 "error": f"JSON decode error: {str(e)}"
             }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "modify_component",
+                "error": str(e)
+            }
+    
+    def build_request(self, object_path: ObjectTarget, component_type: str, properties: Dict[str, Any]) -> Dict:
+        """Описание HTTP-запроса на модификацию компонента"""
+        return {
+            "method": "PUT",
+            "path": "/objects/components/modify",
+            "json": {
+                **object_fields(object_path),
+                "componentType": component_type, 
+                "properties": properties
+            }
+        }
+    
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        return {
+            "success": result.get("success", False),
+            "action": "modify_component",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
     
-    def move_object(self, object_path: str, x: float, y: float, z: float) -> Dict:
+    def move_object(self, object_path: ObjectTarget, x: float, y: float, z: float) -> Dict:
         """Перемещает объект в указанную позицию"""
         return self.execute(object_path, "Transform", {
             "position": {"x": x, "y": y, "z": z}
         })
     
-    def rotate_object(self, object_path: str, x: float, y: float, z: float, w: float) -> Dict:
+    def rotate_object(self, object_path: ObjectTarget, x: float, y: float, z: float, w: float) -> Dict:
         """Поворачивает объект с указанным кватернионом"""
         return self.execute(object_path, "Transform", {
             "rotation": {"x": x, "y": y, "z": z, "w": w}
         })
     
-    def scale_object(self, object_path: str, x: float, y: float, z: float) -> Dict:
+    def scale_object(self, object_path: ObjectTarget, x: float, y: float, z: float) -> Dict:
         """Масштабирует объект"""
         return self.execute(object_path, "Transform", {
             "localScale": {"x": x, "y": y, "z": z}
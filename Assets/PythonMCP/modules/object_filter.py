@@ -0,0 +1,120 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+# Способы сравнения имени в GET /objects/find (параметр match)
+MATCH_MODES = ("substring", "glob", "regex")
+
+class ObjectFilter:
+    """Условия поиска объектов GET /objects/find: имя, тег, слой, activeInHierarchy, обязательные компоненты
+
+    Имя сравнивается без учета регистра: substring - вхождение подстроки (как прежний поиск),
+    glob - шаблон с * и ? на все имя, regex - регулярное выражение, найденное в любом месте имени.
+    Компоненты сравниваются по имени типа, объект должен иметь все перечисленные.
+    Некорректные параметры вызывают ValueError.
+    """
+
+    def __init__(self, name: Optional[str] = None, match: Optional[str] = None, tag: Optional[str] = None,
+                 layer: Any = None, active: Any = None, components: Any = None):
+        self.name = name or None
+        self.match = (match or "substring").lower()
+        if self.match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode: {match} (expected one of: {', '.join(MATCH_MODES)})")
+        self.tag = tag or None
+        self.layer = _parse_layer(layer)
+        self.active = _parse_bool(active, "active")
+        self.components = _parse_list(components)
+
+        self._needle = self.name.lower() if self.name and self.match == "substring" else None
+        self._pattern = None
+        if self.name and self.match == "glob":
+            # Только * и ?, как в редакторе: остальные символы сравниваются буквально
+            glob = "".join(".*" if ch == "*" else "." if ch == "?" else re.escape(ch) for ch in self.name)
+            self._pattern = re.compile(glob, re.IGNORECASE | re.DOTALL)
+        elif self.name and self.match == "regex":
+            try:
+                self._pattern = re.compile(self.name, re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regex: {e}")
+
+    @classmethod
+    def from_params(cls, params: Dict) -> "ObjectFilter":
+        return cls(params.get("name"), params.get("match"), params.get("tag"), params.get("layer"),
+                   params.get("active"), params.get("components"))
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.name or self.tag or self.layer is not None or self.active is not None or self.components)
+
+    @property
+    def name_only(self) -> bool:
+        """Только подстрока имени: такой поиск умеют индексы снимка и локальной копии сцены"""
+        return self.match == "substring" and not (self.tag or self.layer is not None or self.active is not None or self.components)
+
+    def matches_name(self, name: str) -> bool:
+        if not self.name:
+            return True
+        if self._needle is not None:
+            return self._needle in name.lower()
+        if self.match == "glob":
+            return self._pattern.fullmatch(name) is not None
+        return self._pattern.search(name) is not None
+
+    def matches(self, name: str, tag: Optional[str] = None, layer: Optional[int] = None,
+                active: Optional[bool] = None, components: Iterable[str] = ()) -> bool:
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.layer is not None and layer != self.layer:
+            return False
+        if self.active is not None and bool(active) != self.active:
+            return False
+        if self.components and not set(self.components) <= set(components):
+            return False
+        return self.matches_name(name)
+
+    def matches_node(self, node: Dict) -> bool:
+        """Проверка узла ответа GET /scene (тег и слой есть в узле только при запросе этих полей)"""
+        return self.matches(node.get("name") or "", node.get("tag"), node.get("layer"),
+                            node.get("active", True), node.get("components") or ())
+
+    def to_query(self) -> Dict[str, str]:
+        """Параметры запроса GET /objects/find"""
+        query: Dict[str, str] = {}
+        if self.name:
+            query["name"] = self.name
+        if self.match != "substring":
+            query["match"] = self.match
+        if self.tag:
+            query["tag"] = self.tag
+        if self.layer is not None:
+            query["layer"] = str(self.layer)
+        if self.active is not None:
+            query["active"] = "true" if self.active else "false"
+        if self.components:
+            query["components"] = ",".join(self.components)
+        return query
+
+def _parse_layer(layer: Any) -> Optional[int]:
+    if layer is None or layer == "":
+        return None
+    try:
+        return int(layer)
+    except (TypeError, ValueError):
+        raise ValueError(f"layer must be an integer: {layer}")
+
+def _parse_bool(value: Any, name: str) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "1", "yes"):
+        return True
+    if text in ("false", "0", "no"):
+        return False
+    raise ValueError(f"{name} must be true or false: {value}")
+
+def _parse_list(value: Any) -> List[str]:
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else list(value)
+    return [str(item).strip() for item in items if str(item).strip()]
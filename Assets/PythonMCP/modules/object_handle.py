@@ -0,0 +1,61 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Начало ошибки сервера для instanceId, который больше не указывает на объект сцены
+STALE_HANDLE_ERROR = "Stale object handle"
+
+class ObjectHandle(NamedTuple):
+    """Ссылка на объект сцены: instanceId и последний известный путь
+
+    Сервер находит объект по instanceId за O(1), без разбора пути, поэтому ссылка переживает
+    переименование, перенос и одинаковые имена соседей. Если объект удален, сервер отвечает
+    ошибкой "Stale object handle" (путь при этом не используется). В JSON - [instance_id, path].
+    """
+    instance_id: int
+    path: Optional[str] = None
+
+    @classmethod
+    def from_node(cls, node: Optional[Dict]) -> Optional["ObjectHandle"]:
+        """Handle узла иерархии (None, если в узле нет instanceId)"""
+        if not node or node.get("instanceId") is None:
+            return None
+        return cls(node["instanceId"], node.get("path"))
+
+ObjectTarget = Union[str, int, ObjectHandle]
+
+def object_ref(target: Any) -> Tuple[Optional[str], Optional[int]]:
+    """Путь, instanceId, ObjectHandle, [instance_id, path] или узел иерархии -> (path, instance_id)"""
+    if isinstance(target, ObjectHandle):
+        return target.path, target.instance_id
+    if isinstance(target, str):
+        return target, None
+    if isinstance(target, int) and not isinstance(target, bool):
+        return None, target
+    if isinstance(target, dict) and isinstance(target.get("instanceId"), int):
+        return target.get("path"), target["instanceId"]
+    # ObjectHandle после JSON (например, в записанной команде) - список [instance_id, path]
+    if isinstance(target, (list, tuple)) and len(target) == 2 and isinstance(target[0], int):
+        return target[1], target[0]
+    raise ValueError(f"Invalid object reference: {target!r}")
+
+def object_label(target: Any) -> Optional[str]:
+    """Путь для сообщений и полей ответа (для handle без пути - #instanceId)"""
+    path, instance_id = object_ref(target)
+    return path if path else f"#{instance_id}"
+
+def object_fields(target: Any, path_key: str = "path", id_key: str = "instanceId") -> Dict[str, Any]:
+    """Поля тела или query-параметры запроса, задающие объект"""
+    path, instance_id = object_ref(target)
+    fields: Dict[str, Any] = {}
+    if path:
+        fields[path_key] = path
+    if instance_id is not None:
+        fields[id_key] = instance_id
+    return fields
+
+def handles(paths: List[Optional[str]], instance_ids: List[Optional[int]]) -> List[Optional[ObjectHandle]]:
+    return [ObjectHandle(i, p) if i is not None else None for p, i in zip(paths, instance_ids)]
+
+def is_stale(result: Optional[Dict]) -> bool:
+    """Команда завершилась ошибкой устаревшего handle"""
+    error = (result or {}).get("error")
+    return isinstance(error, str) and error.startswith(STALE_HANDLE_ERROR)
@@ -1,12 +1,16 @@
 import requests
 import json
-from typing import Dict
+from typing import Dict, Optional
+
+from .http_transport import HttpTransport
+from .object_handle import ObjectTarget, object_fields
 
 class RemoveComponentModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
-    def execute(self, object_path: str, component_type: str) -> Dict:
+    def execute(self, object_path: ObjectTarget, component_type: str) -> Dict:
         """Удаляет компонент с объекта"""
         try:
             if not all([object_path, component_type]):
@@ -16,19 +20,9 @@ class RemoveComponentModule:
                     "error": "object_path and component_type are required"
                 }
             
-            response = requests.delete(
-                f"{self.base_url}/objects/components/remove", 
-                json={"path": object_path, "componentType": component_type}
-            )
+            response = self.transport.request(**self.build_request(object_path, component_type))
             response.raise_for_status()
-            remove_result = response.json()
-            
-            return {
-                "success": remove_result.get("success", False),
-                "action": "remove_component",
-                "data": remove_result if remove_result.get("success") else None,
-                "error": remove_result.get("error")
-            }
+            return self.parse_response(response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -41,4 +35,27 @@ class RemoveComponentModule:
                 "success": False,
                 "action": "remove_component",
                 "error": f"JSON decode error: {str(e)}"
-            }
\ No newline at end of file
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "remove_component",
+                "error": str(e)
+            }
+    
+    def build_request(self, object_path: ObjectTarget, component_type: str) -> Dict:
+        """Описание HTTP-запроса на удаление компонента"""
+        return {
+            "method": "DELETE",
+            "path": "/objects/components/remove",
+            "json": {**object_fields(object_path),"componentType": component_type}
+        }
+    
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        return {
+            "success": result.get("success", False),
+            "action": "remove_component",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
\ No newline at end of file
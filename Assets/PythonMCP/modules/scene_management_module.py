@@ -2,9 +2,12 @@ import requests
 import json
 from typing import Dict, Optional
 
+from .http_transport import HttpTransport
+
 class SceneManagementModule:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
         self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
     
     def open_scene(self, scene_path: str) -> Dict:
         """Открывает указанную сцену"""
@@ -16,19 +19,9 @@ class SceneManagementModule:
                     "error": "scene_path is required"
                 }
             
-            response = requests.post(
-                f"{self.base_url}/scene/open", 
-                json={"scenePath": scene_path}
-            )
+            response = self.transport.request(**self.build_request("open_scene", scene_path))
             response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": result.get("success", False),
-                "action": "open_scene",
-                "data": result if result.get("success") else None,
-                "error": result.get("error")
-            }
+            return self.parse_response("open_scene", response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -40,16 +33,9 @@ class SceneManagementModule:
     def get_build_scenes(self) -> Dict:
         """Получает список сцен в настройках сборки"""
         try:
-            response = requests.get(f"{self.base_url}/build/scenes")
+            response = self.transport.request(**self.build_request("get_build_scenes"))
             response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": True,
-                "action": "get_build_scenes",
-                "data": result,
-                "error": result.get("error") if "error" in result else None
-            }
+            return self.parse_response("get_build_scenes", response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -68,19 +54,9 @@ class SceneManagementModule:
                     "error": "scene_path is required"
                 }
             
-            response = requests.post(
-                f"{self.base_url}/build/scenes/add", 
-                json={"scenePath": scene_path}
-            )
+            response = self.transport.request(**self.build_request("add_scene_to_build", scene_path))
             response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": result.get("success", False),
-                "action": "add_scene_to_build",
-                "data": result if result.get("success") else None,
-                "error": result.get("error")
-            }
+            return self.parse_response("add_scene_to_build", response.json())
             
         except requests.exceptions.RequestException as e:
             return {
@@ -99,23 +75,42 @@ class SceneManagementModule:
                     "error": "scene_path is required"
                 }
             
-            response = requests.delete(
-                f"{self.base_url}/build/scenes/remove", 
-                json={"scenePath": scene_path}
-            )
+            response = self.transport.request(**self.build_request("remove_scene_from_build", scene_path))
             response.raise_for_status()
-            result = response.json()
-            
-            return {
-                "success": result.get("success", False),
-                "action": "remove_scene_from_build",
-                "data": result if result.get("success") else None,
-                "error": result.get("error")
-            }
+            return self.parse_response("remove_scene_from_build", response.json())
             
         except requests.exceptions.RequestException as e:
             return {
                 "success": False,
                 "action": "remove_scene_from_build",
                 "error": f"Request error: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    def build_request(self, action: str, scene_path: str = None) -> Dict:
+        """Описание HTTP-запроса для указанной операции со сценами"""
+        if action == "open_scene":
+            return {"method": "POST", "path": "/scene/open", "json": {"scenePath": scene_path}}
+        if action == "get_build_scenes":
+            return {"method": "GET", "path": "/build/scenes"}
+        if action == "add_scene_to_build":
+            return {"method": "POST", "path": "/build/scenes/add", "json": {"scenePath": scene_path}}
+        if action == "remove_scene_from_build":
+            return {"method": "DELETE", "path": "/build/scenes/remove", "json": {"scenePath": scene_path}}
+        raise ValueError(f"Unknown scene action: {action}")
+    
+    def parse_response(self, action: str, result: Dict) -> Dict:
+        """Формирует структурированный ответ из результата Unity API"""
+        if action == "get_build_scenes":
+            return {
+                "success": True,
+                "action": "get_build_scenes",
+                "data": result,
+                "error": result.get("error") if "error" in result else None
+            }
+        
+        return {
+            "success": result.get("success", False),
+            "action": action,
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
\ No newline at end of file
@@ -0,0 +1,300 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .deep_json import loads
+from .hierarchy_columnar import COLUMNAR_PARAMS, decode_hierarchy
+from .hierarchy_index import _trigrams
+
+class SceneMirror:
+    """Локальная копия иерархии сцены, поддерживаемая лентой изменений GET /scene/changes
+
+    Первая синхронизация загружает GET /scene (узлы с instanceId, версия - из ETag),
+    дальше каждая синхронизация запрашивает только изменения после известной версии
+    и применяет их к дереву на месте. Если сервер ответил resync (курсор устарел, сменилась
+    сцена или сервер перезапущен), иерархия загружается заново.
+
+    hierarchy() возвращает живое дерево в формате ответа GET /scene: читать его
+    (и узлы из find_by_name/get) нужно под self.lock, изменять нельзя.
+    Если сервер не поддерживает ленту изменений, supported становится False, а sync() - всегда False.
+    """
+
+    def __init__(self, transport: Any):
+        self.transport = transport
+        self.lock = threading.RLock()
+        self.supported: Optional[bool] = None
+        self.epoch: Optional[str] = None
+        self.version: Optional[int] = None
+        self.resyncs = 0
+        self.applied_changes = 0
+        self._clear()
+
+    def sync(self) -> bool:
+        """Приводит копию к текущему состоянию сцены; False - копией пользоваться нельзя"""
+        with self.lock:
+            if self.supported is False:
+                return False
+
+            params = {"since": self.version, "epoch": self.epoch} if self._hierarchy is not None else None
+            response = self.transport.request("GET", "/scene/changes", params=params)
+            if response.status_code == 404:
+                self.supported = False
+                return False
+            response.raise_for_status()
+            data = loads(response.content)
+            if not isinstance(data, dict) or data.get("error"):
+                if isinstance(data, dict) and data.get("error") == "Endpoint not found":
+                    self.supported = False
+                return False
+
+            if data.get("resync") or self._hierarchy is None:
+                return self._resync()
+
+            changes = data.get("changes") or []
+            self._apply(changes)
+            self.applied_changes += len(changes)
+            self.version = data.get("version", self.version)
+            return True
+
+    @property
+    def ready(self) -> bool:
+        """Копия уже загружена (следующая синхронизация не потребует полной загрузки, если курсор не устарел)"""
+        return self._hierarchy is not None
+
+    def hierarchy(self) -> Optional[Dict]:
+        """Живое дерево в формате ответа GET /scene"""
+        return self._hierarchy
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, path: str) -> Optional[Dict]:
+        """Узел с точно совпадающим путем (при совпадающих путях - первый в порядке обхода)"""
+        ids = self._path_ids.get(path)
+        if not ids:
+            return None
+        return self._nodes[min(ids, key=self._order_key)]
+
+    def find_by_name(self, text: str) -> List[Dict]:
+        """Узлы, имя которых содержит text без учета регистра, в порядке обхода"""
+        needle = text.lower()
+        ids: List[int] = []
+        for name in self._candidate_names(needle):
+            if needle in name:
+                ids.extend(self._name_ids[name])
+        ids.sort(key=self._order_key)
+        return [self._nodes[i] for i in ids]
+
+    def find_path_containing(self, text: str) -> Optional[Dict]:
+        """Первый в порядке обхода узел, путь которого содержит text без учета регистра"""
+        needle = text.lower()
+        stack = list(reversed(self._hierarchy.get("rootObjects", []))) if self._hierarchy else []
+        while stack:
+            node = stack.pop()
+            if needle in node["path"].lower():
+                return node
+            stack.extend(reversed(node["children"]))
+        return None
+
+    def _clear(self) -> None:
+        self._hierarchy: Optional[Dict] = None
+        self._nodes: Dict[int, Dict] = {}
+        self._parent: Dict[int, int] = {}
+        # id родителя (0 - корни сцены) -> id детей по порядку; позиция объекта среди соседей
+        self._children_ids: Dict[int, List[int]] = {}
+        self._position: Dict[int, int] = {}
+        self._name_ids: Dict[str, Set[int]] = {}
+        self._name_trigrams: Dict[str, Set[str]] = {}
+        self._path_ids: Dict[str, Set[int]] = {}
+
+    def _resync(self) -> bool:
+        """Загружает иерархию целиком и строит индексы"""
+        response = self.transport.request("GET", "/scene", params=dict(COLUMNAR_PARAMS))
+        response.raise_for_status()
+        hierarchy = decode_hierarchy(loads(response.content))
+        version = _parse_etag(response.headers.get("ETag"))
+        if not isinstance(hierarchy, dict) or hierarchy.get("error"):
+            return False
+
+        self._clear()
+        stack: List[Tuple[Dict, int]] = [(node, 0) for node in hierarchy.get("rootObjects", [])]
+        self._set_children(0, [node.get("instanceId") for node in hierarchy.get("rootObjects", [])], hierarchy["rootObjects"])
+        while stack:
+            node, parent_id = stack.pop()
+            object_id = node.get("instanceId")
+            if object_id is None:
+                # Сервер без instanceId в /scene: копию не построить
+                self._clear()
+                self.supported = False
+                return False
+            node.setdefault("children", [])
+            self._nodes[object_id] = node
+            self._parent[object_id] = parent_id
+            self._index_name(object_id, node.get("name") or "")
+            self._path_ids.setdefault(node.get("path") or "", set()).add(object_id)
+            if node["children"]:
+                self._set_children(object_id, [child.get("instanceId") for child in node["children"]], node["children"])
+                stack.extend((child, object_id) for child in node["children"])
+
+        if version is None:
+            self._clear()
+            self.supported = False
+            return False
+
+        self._hierarchy = hierarchy
+        self.epoch, self.version = version
+        self.supported = True
+        self.resyncs += 1
+        return True
+
+    def _apply(self, changes: Iterable[Dict]) -> None:
+        """Применяет события ленты; пути пересчитываются после всех событий пачки"""
+        moved: Set[int] = set()
+        for change in changes:
+            kind = change.get("type")
+            object_id = change.get("id")
+            node = self._nodes.get(object_id)
+
+            if kind == "created":
+                if node is None:
+                    node = {"name": "", "path": "", "instanceId": object_id, "active": True, "components": [], "children": []}
+                    self._nodes[object_id] = node
+                else:
+                    self._unindex_name(object_id, node["name"])
+                node["name"] = change.get("name") or ""
+                node["active"] = change.get("active", True)
+                node["components"] = list(change.get("components") or [])
+                self._index_name(object_id, node["name"])
+                self._parent[object_id] = change.get("parentId") or 0
+                moved.add(object_id)
+            elif kind == "reordered":
+                if object_id == 0 or object_id in self._nodes:
+                    ids = [i for i in change.get("children") or [] if i in self._nodes]
+                    target = self._hierarchy["rootObjects"] if object_id == 0 else self._nodes[object_id]["children"]
+                    self._set_children(object_id, ids, target, rebuild=True)
+                    for child_id in ids:
+                        if self._parent.get(child_id) != object_id:
+                            self._parent[child_id] = object_id
+                            moved.add(child_id)
+            elif kind == "destroyed":
+                if node is not None:
+                    self._remove(object_id, node)
+            elif node is None:
+                continue
+            elif kind == "reparented":
+                self._parent[object_id] = change.get("parentId") or 0
+                moved.add(object_id)
+            elif kind == "renamed":
+                self._unindex_name(object_id, node["name"])
+                node["name"] = change.get("name") or ""
+                self._index_name(object_id, node["name"])
+                moved.add(object_id)
+            elif kind == "active_changed":
+                node["active"] = change.get("active", True)
+            elif kind == "components_changed":
+                node["components"] = list(change.get("components") or [])
+
+        self._update_paths(moved)
+        self._hierarchy["totalObjects"] = len(self._nodes)
+
+    def _set_children(self, parent_id: int, ids: List[int], target: List[Dict], rebuild: bool = False) -> None:
+        if rebuild:
+            target[:] = [self._nodes[i] for i in ids]
+        if ids:
+            self._children_ids[parent_id] = ids
+        else:
+            self._children_ids.pop(parent_id, None)
+        for position, child_id in enumerate(ids):
+            self._position[child_id] = position
+
+    def _remove(self, object_id: int, node: Dict) -> None:
+        self._unindex_name(object_id, node["name"])
+        self._unindex_path(object_id, node["path"])
+        del self._nodes[object_id]
+        self._parent.pop(object_id, None)
+        self._position.pop(object_id, None)
+        self._children_ids.pop(object_id, None)
+
+    def _update_paths(self, moved: Set[int]) -> None:
+        """Пересчитывает пути у переименованных, перемещенных и созданных объектов и их потомков"""
+        for object_id in moved:
+            if object_id not in self._nodes or self._has_moved_ancestor(object_id, moved):
+                continue
+            parent_id = self._parent.get(object_id, 0)
+            stack = [(self._nodes[object_id], self._nodes[parent_id]["path"] if parent_id else "")]
+            while stack:
+                node, parent_path = stack.pop()
+                path = f"{parent_path}/{node['name']}" if parent_path else node["name"]
+                if node["path"] != path:
+                    self._unindex_path(node["instanceId"], node["path"])
+                    node["path"] = path
+                    self._path_ids.setdefault(path, set()).add(node["instanceId"])
+                elif node["instanceId"] not in self._path_ids.get(path, ()):
+                    self._path_ids.setdefault(path, set()).add(node["instanceId"])
+                stack.extend((child, path) for child in node["children"])
+
+    def _has_moved_ancestor(self, object_id: int, moved: Set[int]) -> bool:
+        parent_id = self._parent.get(object_id, 0)
+        while parent_id:
+            if parent_id in moved:
+                return True
+            parent_id = self._parent.get(parent_id, 0)
+        return False
+
+    def _order_key(self, object_id: int) -> Tuple[int, ...]:
+        """Ключ порядка обхода: позиции объекта и его предков среди соседей, от корня"""
+        key = []
+        while object_id:
+            key.append(self._position.get(object_id, 0))
+            object_id = self._parent.get(object_id, 0)
+        key.reverse()
+        return tuple(key)
+
+    def _candidate_names(self, needle: str) -> Iterable[str]:
+        if len(needle) < 3:
+            return list(self._name_ids)
+        sets = [self._name_trigrams.get(t) for t in _trigrams(needle)]
+        if any(s is None for s in sets):
+            return ()
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def _index_name(self, object_id: int, name: str) -> None:
+        lower = name.lower()
+        ids = self._name_ids.get(lower)
+        if ids is None:
+            ids = self._name_ids[lower] = set()
+            for trigram in _trigrams(lower):
+                self._name_trigrams.setdefault(trigram, set()).add(lower)
+        ids.add(object_id)
+
+    def _unindex_name(self, object_id: int, name: str) -> None:
+        lower = name.lower()
+        ids = self._name_ids.get(lower)
+        if ids is None:
+            return
+        ids.discard(object_id)
+        if not ids:
+            del self._name_ids[lower]
+            for trigram in _trigrams(lower):
+                names = self._name_trigrams.get(trigram)
+                if names is not None:
+                    names.discard(lower)
+                    if not names:
+                        del self._name_trigrams[trigram]
+
+    def _unindex_path(self, object_id: int, path: str) -> None:
+        ids = self._path_ids.get(path)
+        if ids is not None:
+            ids.discard(object_id)
+            if not ids:
+                del self._path_ids[path]
+
+def _parse_etag(etag: Optional[str]) -> Optional[Tuple[str, int]]:
+    """ETag вида "<epoch>-<version>" -> (epoch, version)"""
+    if not etag:
+        return None
+    epoch, _, version = etag.strip().lstrip("W/").strip('"').rpartition("-")
+    try:
+        return epoch, int(version)
+    except ValueError:
+        return None
@@ -0,0 +1,270 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from .object_handle import ObjectHandle
+
+DEFAULT_PREFETCH_WORKERS = 2
+
+class SceneNode:
+    """Объект в ленивом дереве сцены SceneTree
+
+    Имя, путь, instanceId, активность и типы компонентов известны сразу, дети загружаются
+    при первом обращении к children. Корень дерева - сама сцена (path=None, depth=-1).
+    """
+    __slots__ = ("tree", "parent", "index", "name", "path", "instance_id", "active", "components",
+                 "child_count", "reachable", "_raw_children", "_children", "_loading")
+
+    def __init__(self, tree: "SceneTree", parent: Optional["SceneNode"], index: int, raw: Dict, reachable: bool):
+        self.tree = tree
+        self.parent = parent
+        # Позиция среди детей родителя: по ней находится объект, недоступный по пути
+        self.index = index
+        self.name: str = raw.get("name")
+        self.path: Optional[str] = raw.get("path")
+        self.instance_id: Optional[int] = raw.get("instanceId")
+        self.active: Optional[bool] = raw.get("active")
+        self.components: List[str] = raw.get("components") or []
+        children = raw.get("children") or []
+        self.child_count: int = len(children) or raw.get("childCount", 0)
+        # Находит ли поиск по пути именно этот объект (не второй из одноименных соседей, без '/' в имени)
+        self.reachable = reachable
+        # Дети из того же ответа (снимок или предзагрузка), еще не превращенные в узлы
+        self._raw_children: Optional[List[Dict]] = children or None
+        self._children: Optional[List[SceneNode]] = None if self.child_count else []
+        self._loading: Optional[Future] = None
+
+    @property
+    def children(self) -> List["SceneNode"]:
+        """Дети объекта (при первом обращении - из снимка иерархии или запросом поддерева)"""
+        return self.tree._children_of(self)
+
+    @property
+    def loaded(self) -> bool:
+        return self._children is not None
+
+    @property
+    def depth(self) -> int:
+        depth, node = -1, self.parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    @property
+    def handle(self) -> ObjectHandle:
+        """Ссылка на объект для команд клиента (get_components, delete_object и др.)"""
+        return ObjectHandle(self.instance_id, self.path)
+
+    def child(self, name: str) -> Optional["SceneNode"]:
+        """Первый ребенок с указанным именем, как transform.Find"""
+        return next((child for child in self.children if child.name == name), None)
+
+    def find(self, relative_path: str) -> Optional["SceneNode"]:
+        """Потомок по пути относительно объекта; загружаются только дети объектов на этом пути"""
+        node: Optional[SceneNode] = self
+        for name in relative_path.split("/"):
+            node = node.child(name) if node is not None else None
+        return node
+
+    def walk(self) -> Iterator["SceneNode"]:
+        """Потомки в порядке обхода в глубину (загружает все поддерево)"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def refresh(self) -> None:
+        """Забывает загруженных детей: следующее обращение загрузит их заново"""
+        self.tree._forget(self)
+
+    def __iter__(self) -> Iterator["SceneNode"]:
+        return iter(self.children)
+
+    def __len__(self) -> int:
+        return self.child_count
+
+    def __bool__(self) -> bool:
+        # Узел без детей - тоже объект: "if node" не должно зависеть от __len__
+        return True
+
+    def __repr__(self) -> str:
+        return f"SceneNode({self.path!r}, instance_id={self.instance_id}, children={self.child_count})"
+
+class SceneTree:
+    """Ленивое дерево объектов сцены поверх GET /scene
+
+    Дети объекта загружаются при первом обращении: из актуального снимка HierarchyCache, если он есть,
+    иначе запросом поддерева (from_path, max_depth) на один уровень. Следом в фоне загружается
+    следующий уровень, чтобы раскрытие ребенка обычно не ждало сервера. В памяти остаются только
+    посещенные объекты и один уровень под ними. Дерево - снимок на момент загрузки каждого уровня,
+    refresh() у узла перечитывает его детей.
+    """
+
+    def __init__(self, hierarchy_module: Any, prefetch: bool = True,
+                 prefetch_workers: int = DEFAULT_PREFETCH_WORKERS):
+        self.module = hierarchy_module
+        self.prefetch = prefetch
+        self.prefetch_workers = prefetch_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.root = SceneNode(self, None, 0, {"childCount": 1}, True)
+        # Число запросов поддеревьев (для оценки, сколько сцены загружено)
+        self.requests = 0
+
+    @property
+    def roots(self) -> List[SceneNode]:
+        """Корневые объекты сцены"""
+        return self.root.children
+
+    def find(self, path: str) -> Optional[SceneNode]:
+        """Объект по полному пути"""
+        return self.root.find(path)
+
+    def close(self) -> None:
+        """Дожидается фоновой предзагрузки и останавливает ее потоки"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _children_of(self, node: SceneNode) -> List[SceneNode]:
+        while True:
+            with self._lock:
+                if node._children is not None:
+                    return node._children
+                if node._raw_children is not None:
+                    children = node._children = self._wrap(node, node._raw_children)
+                    node._raw_children = None
+                    node.child_count = len(children)
+                    self._schedule_prefetch(node, children)
+                    return children
+                loading = node._loading
+                owner = loading is None
+                if owner:
+                    loading = node._loading = Future()
+
+            if not owner:
+                # Дети уже загружаются (другим потоком или предзагрузкой): ждем, при ошибке загружаем сами
+                try:
+                    loading.result()
+                except Exception:
+                    pass
+                continue
+
+            try:
+                raw_children = self._load(node)
+            except BaseException as e:
+                with self._lock:
+                    node._loading = None
+                loading.set_exception(e)
+                raise
+            with self._lock:
+                node._raw_children = raw_children
+                node._loading = None
+            loading.set_result(None)
+
+    def _load(self, node: SceneNode) -> List[Dict]:
+        """Дети объекта в виде узлов ответа GET /scene: из снимка иерархии, иначе запросом"""
+        cache = getattr(self.module, "cache", None)
+        snapshot = cache.get() if cache is not None else None
+        if snapshot is not None and "error" not in snapshot:
+            if node.path is None:
+                return snapshot.get("rootObjects") or []
+            if node.reachable:
+                raw = cache.index_for(snapshot).get(node.path)
+                if raw is not None and raw.get("instanceId") == node.instance_id:
+                    return raw.get("children") or []
+        return self._fetch(node, 0).get("children") or []
+
+    def _fetch(self, node: SceneNode, extra_depth: int) -> Dict:
+        """Узел ответа GET /scene для объекта с детьми (и extra_depth уровнями под ними)
+
+        Недоступный по пути объект загружается в поддереве ближайшего доступного предка
+        и находится в нем по позициям среди детей.
+        """
+        anchor, positions = node, []
+        while anchor.path is not None and not anchor.reachable:
+            positions.append(anchor.index)
+            anchor = anchor.parent
+        max_depth = node.depth - anchor.depth + extra_depth + (1 if anchor.path is not None else 0)
+
+        hierarchy = self.module.download_subtree(anchor.path, max_depth)
+        with self._lock:
+            self.requests += 1
+        if not isinstance(hierarchy, dict) or "error" in hierarchy:
+            raise RuntimeError(hierarchy.get("error") if isinstance(hierarchy, dict) else "Invalid hierarchy format")
+
+        if anchor.path is None:
+            raw = {"children": hierarchy.get("rootObjects") or []}
+        else:
+            roots = hierarchy.get("rootObjects") or []
+            # Сервер без найденного from_path отвечает всей сценой
+            if hierarchy.get("fromPath") != anchor.path or not roots or roots[0].get("instanceId") != anchor.instance_id:
+                raise LookupError(f"Object not found: {anchor.path}")
+            raw = roots[0]
+
+        for index in reversed(positions):
+            children = raw.get("children") or []
+            raw = children[index] if index < len(children) else {}
+        if node.path is not None and raw.get("instanceId") != node.instance_id:
+            raise LookupError(f"Object not found: {node.path}")
+        return raw
+
+    def _wrap(self, parent: SceneNode, raw_children: List[Dict]) -> List[SceneNode]:
+        names = set()
+        children = []
+        for index, raw in enumerate(raw_children):
+            name = raw.get("name") or ""
+            reachable = parent.reachable and "/" not in name and name not in names
+            names.add(name)
+            children.append(SceneNode(self, parent, index, raw, reachable))
+        return children
+
+    def _schedule_prefetch(self, node: SceneNode, children: List[SceneNode]) -> None:
+        """Ставит в фон загрузку детей для еще не загруженных детей node (вызывается под блокировкой)"""
+        if not self.prefetch:
+            return
+        targets = [child for child in children
+                   if child._children is None and child._raw_children is None and child._loading is None]
+        if not targets:
+            return
+
+        loading = Future()
+        for child in targets:
+            child._loading = loading
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.prefetch_workers, thread_name_prefix="unity-api-prefetch")
+        self._executor.submit(self._prefetch, node, targets, loading)
+
+    def _prefetch(self, node: SceneNode, targets: List[SceneNode], loading: Future) -> None:
+        try:
+            raw_children = self._fetch(node, 1).get("children") or []
+        except BaseException as e:
+            with self._lock:
+                for child in targets:
+                    if child._loading is loading:
+                        child._loading = None
+            loading.set_exception(e)
+            return
+
+        with self._lock:
+            for child in targets:
+                raw = raw_children[child.index] if child.index < len(raw_children) else None
+                if child._loading is loading:
+                    child._loading = None
+                    if raw is not None and raw.get("instanceId") == child.instance_id and child._children is None:
+                        child._raw_children = raw.get("children") or []
+        loading.set_result(None)
+
+    def _forget(self, node: SceneNode) -> None:
+        with self._lock:
+            if node._loading is None:
+                node._children = None
+                node._raw_children = None
@@ -0,0 +1,282 @@
+import codecs
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+_TOKEN = re.compile(
+    r"[ \t\n\r]*(?:([{}\[\]:,])|\"([^\"\\]*)\"|(\")|(-?\d[\d.eE+-]*)|(true|false|null|NaN|Infinity|-Infinity))"
+)
+_PUNCT, _SIMPLE_STRING, _STRING, _NUMBER_TOKEN, _LITERAL = 1, 2, 3, 4, 5
+# Токен числа захватывается жадно, чтобы число на границе куска ("-2." + "25") не разбиралось по частям
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?\Z")
+_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "NaN": float("nan"), "Infinity": float("inf"), "-Infinity": float("-inf")
+}
+# Самый длинный литерал; более длинный нераспознанный хвост буфера - ошибка, а не неполный токен
+_MAX_PARTIAL_TOKEN = len("-Infinity")
+
+class JsonEventParser:
+    """Инкрементальный разбор JSON: на вход куски текста, на выход события
+    start_map / map_key / end_map / start_array / end_array / value
+
+    Неполный токен на границе куска остается в буфере до следующего вызова feed.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        # Стек открытых контейнеров: True - объект, False - массив
+        self._containers: List[bool] = []
+        self._expect_key = False
+
+    def feed(self, text: str, final: bool = False) -> List[Tuple[str, Any]]:
+        buffer = self._buffer + text if self._buffer else text
+        events: List[Tuple[str, Any]] = []
+        containers = self._containers
+        size = len(buffer)
+        pos = 0
+
+        scanner = _TOKEN.scanner(buffer, pos)
+        while True:
+            match = scanner.match()
+            if match is None:
+                rest = buffer[pos:].lstrip(" \t\n\r")
+                if rest and (final or len(rest) > _MAX_PARTIAL_TOKEN):
+                    raise json.JSONDecodeError("Unexpected data", buffer, size - len(rest))
+                pos = size if not rest else size - len(rest)
+                break
+
+            kind = match.lastindex
+            if kind == _PUNCT:
+                pos = match.end()
+                punct = match.group(1)
+                if punct == "{":
+                    events.append(("start_map", None))
+                    containers.append(True)
+                    self._expect_key = True
+                elif punct == "[":
+                    events.append(("start_array", None))
+                    containers.append(False)
+                elif punct == "}":
+                    events.append(("end_map", None))
+                    containers.pop()
+                elif punct == "]":
+                    events.append(("end_array", None))
+                    containers.pop()
+                elif punct == ",":
+                    self._expect_key = bool(containers) and containers[-1]
+                else:
+                    self._expect_key = False
+                continue
+
+            if kind == _SIMPLE_STRING or kind == _STRING:
+                if kind == _SIMPLE_STRING:
+                    # Строка без экранирования - самый частый случай
+                    value, pos = match.group(2), match.end()
+                else:
+                    if _STRING_END.match(buffer, match.end()) is None:
+                        if final:
+                            raise json.JSONDecodeError("Unterminated string", buffer, match.start(3))
+                        pos = match.start(3)
+                        break
+                    value, pos = scanstring(buffer, match.end())
+                    scanner = _TOKEN.scanner(buffer, pos)
+                if self._expect_key and containers and containers[-1]:
+                    events.append(("map_key", value))
+                    self._expect_key = False
+                else:
+                    events.append(("value", value))
+                continue
+
+            # Число или литерал, упирающийся в конец буфера, может продолжиться в следующем куске
+            if match.end() == size and not final:
+                pos = match.start(kind)
+                break
+            pos = match.end()
+            if kind == _NUMBER_TOKEN:
+                number = match.group(4)
+                if not _NUMBER.match(number):
+                    raise json.JSONDecodeError("Invalid number", buffer, match.start(4))
+                events.append(("value", float(number) if any(c in number for c in ".eE") else int(number)))
+            else:
+                events.append(("value", _LITERALS[match.group(5)]))
+
+        self._buffer = buffer[pos:]
+        if final and containers:
+            raise json.JSONDecodeError("Unexpected end of data", buffer, size)
+        return events
+
+class _ValueBuilder:
+    """Собирает вложенное значение (объект или массив) из событий парсера"""
+
+    def __init__(self, event: str):
+        self.value: Any = {} if event == "start_map" else []
+        self._stack = [[self.value, None]]
+
+    def add(self, event: str, value: Any) -> bool:
+        """Добавляет событие; True, когда значение собрано полностью"""
+        top = self._stack[-1]
+        if event == "map_key":
+            top[1] = value
+            return False
+        if event in ("end_map", "end_array"):
+            self._stack.pop()
+            return not self._stack
+
+        item = {} if event == "start_map" else [] if event == "start_array" else value
+        if isinstance(top[0], list):
+            top[0].append(item)
+        else:
+            top[0][top[1]] = item
+        if event in ("start_map", "start_array"):
+            self._stack.append([item, None])
+        return False
+
+class _Frame:
+    __slots__ = ("kind", "key", "data", "depth", "parent_path", "yielded")
+
+    def __init__(self, kind: str, depth: int = 0, parent_path: str = ""):
+        self.kind = kind
+        self.key: Optional[str] = None
+        self.data: Dict = {}
+        self.depth = depth
+        self.parent_path = parent_path
+        self.yielded = False
+
+class SceneNodeStream:
+    """Потоковый обход ответа GET /scene
+
+    Узлы выдаются по мере чтения ответа в порядке обхода дерева: словарь полей объекта
+    (name, path, active, components, ...) без children, с добавленными depth и path
+    (если сервер его не прислал, путь собирается из пути родителя). Память - O(глубины),
+    а не O(размера сцены); выход из цикла прекращает чтение и закрывает ответ.
+    Поля сцены (sceneName, scenePath, totalObjects, error) доступны в атрибутах
+    после того, как парсер до них дошел; totalObjects приходит в конце ответа.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], on_close: Optional[Callable[[], None]] = None):
+        self.scene_name: Optional[str] = None
+        self.scene_path: Optional[str] = None
+        self.total_objects: Optional[int] = None
+        self.error: Optional[str] = None
+        self.metadata: Dict = {}
+        self._chunks = chunks
+        self._on_close = on_close
+        self._started = False
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._started:
+            raise RuntimeError("SceneNodeStream can only be iterated once")
+        self._started = True
+        return self._iterate()
+
+    def close(self) -> None:
+        """Прекращает чтение ответа и освобождает соединение"""
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _iterate(self) -> Iterator[Dict]:
+        parser = JsonEventParser()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        stack: List[_Frame] = []
+        # Сборщик вложенного значения поля и фрейм, в который оно запишется
+        builder: Optional[_ValueBuilder] = None
+        target: Optional[_Frame] = None
+
+        try:
+            for chunk, final in self._texts(decoder):
+                for event, value in parser.feed(chunk, final):
+                    if builder is not None:
+                        if builder.add(event, value):
+                            self._store(target, target.key, builder.value)
+                            builder = None
+                        continue
+
+                    if not stack:
+                        if event != "start_map":
+                            raise ValueError("Scene response must be a JSON object")
+                        stack.append(_Frame("scene"))
+                        continue
+
+                    top = stack[-1]
+                    if top.kind == "nodes":
+                        if event == "start_map":
+                            stack.append(_Frame("node", top.depth, top.parent_path))
+                        elif event == "end_array":
+                            stack.pop()
+                        else:
+                            raise ValueError("Scene objects array must contain only objects")
+                        continue
+
+                    # Объект сцены или объект GameObject
+                    if event == "map_key":
+                        top.key = value
+                    elif event == "end_map":
+                        stack.pop()
+                        if top.kind == "node" and not top.yielded:
+                            yield self._node(top)
+                    elif event == "start_array" and top.key == ("rootObjects" if top.kind == "scene" else "children"):
+                        if top.kind == "scene":
+                            stack.append(_Frame("nodes", 0, ""))
+                        else:
+                            # children идут последними полями объекта, поэтому узел готов к выдаче
+                            node = self._node(top)
+                            stack.append(_Frame("nodes", top.depth + 1, node["path"]))
+                            yield node
+                    elif event in ("start_map", "start_array"):
+                        builder, target = _ValueBuilder(event), top
+                    else:
+                        self._store(top, top.key, value)
+        finally:
+            self.close()
+
+    def _texts(self, decoder) -> Iterator[Tuple[str, bool]]:
+        for chunk in self._chunks:
+            if chunk:
+                yield (decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk), False
+        yield decoder.decode(b"", final=True), True
+
+    def _store(self, frame: _Frame, key: str, value: Any) -> None:
+        if frame.kind == "node":
+            frame.data[key] = value
+            return
+        self.metadata[key] = value
+        if key == "sceneName":
+            self.scene_name = value
+        elif key == "scenePath":
+            self.scene_path = value
+        elif key == "totalObjects":
+            self.total_objects = value
+        elif key == "error":
+            self.error = value
+
+    @staticmethod
+    def _node(frame: _Frame) -> Dict:
+        node = frame.data
+        if not node.get("path"):
+            name = node.get("name") or ""
+            node["path"] = f"{frame.parent_path}/{name}" if frame.parent_path else name
+        node["depth"] = frame.depth
+        frame.yielded = True
+        return node
+
+def open_scene_stream(transport: Any, request: Dict, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> SceneNodeStream:
+    """Отправляет запрос за иерархией и возвращает поток ее узлов (ответ читается по мере обхода)"""
+    response = transport.request(**request, stream=True)
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    return SceneNodeStream(response.iter_content(chunk_size), on_close=response.close)
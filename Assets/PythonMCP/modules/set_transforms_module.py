@@ -0,0 +1,130 @@
+import base64
+import json
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Union
+
+import requests
+
+from .http_transport import HttpTransport
+from .object_handle import object_ref
+
+# Кодировка массивов в теле POST /objects/transforms: float32 little-endian в base64
+PACKED_ENCODING = "base64-f32"
+TRANSFORM_SPACES = ("world", "local")
+
+Target = Union[str, int]
+
+class SetTransformsModule:
+    """Массовая запись позиций, поворотов и масштабов одним запросом POST /objects/transforms
+
+    Массивы принимаются в любом виде: NumPy (n, 3) / (n, 4), любые объекты с буферным
+    протоколом (array, memoryview), вложенные списки или словари {"x", "y", "z"(, "w")}.
+    По сети они идут упакованными float32, редактор применяет их за один проход.
+    """
+
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
+        self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
+
+    def execute(self, targets: Any, positions: Any = None, rotations: Any = None,
+                scales: Any = None, space: str = "world") -> Dict:
+        """Задает трансформации объектов: targets - пути, instanceId или ObjectHandle, i-я строка массивов - i-й объект"""
+        try:
+            response = self.transport.request(**self.build_request(targets, positions, rotations, scales, space))
+            response.raise_for_status()
+            return self.parse_response(response.json())
+
+        except requests.exceptions.RequestException as e:
+            return {
+                "success": False,
+                "action": "set_transforms",
+                "error": f"Request error: {str(e)}"
+            }
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "action": "set_transforms",
+                "error": f"JSON decode error: {str(e)}"
+            }
+        except ValueError as e:
+            return {
+                "success": False,
+                "action": "set_transforms",
+                "error": str(e)
+            }
+
+    def build_request(self, targets: Any, positions: Any = None, rotations: Any = None,
+                      scales: Any = None, space: str = "world") -> Dict:
+        """Описание HTTP-запроса; ValueError - пустые цели, нет данных или размеры массивов не совпадают"""
+        targets = _targets(targets)
+        if not targets:
+            raise ValueError("targets are required")
+        if space not in TRANSFORM_SPACES:
+            raise ValueError(f"space must be one of: {', '.join(TRANSFORM_SPACES)}")
+        if positions is None and rotations is None and scales is None:
+            raise ValueError("positions, rotations or scales are required")
+
+        body: Dict[str, Any] = {"targets": targets, "space": space, "encoding": PACKED_ENCODING}
+        for key, values, width in (("positions", positions, 3), ("rotations", rotations, 4), ("scales", scales, 3)):
+            if values is not None:
+                body[key] = pack_floats(values, len(targets), width, key)
+        return {"method": "POST", "path": "/objects/transforms", "json": body}
+
+    def parse_response(self, result: Dict) -> Dict:
+        """Формирует структурированный ответ: число примененных объектов и индексы ненайденных"""
+        return {
+            "success": result.get("success", False),
+            "action": "set_transforms",
+            "data": result if result.get("success") else None,
+            "error": result.get("error")
+        }
+
+def _targets(targets: Any) -> List[Target]:
+    if hasattr(targets, "tolist"):
+        targets = targets.tolist()
+    if isinstance(targets, (str, int)):
+        targets = [targets]
+    resolved: List[Target] = []
+    for target in targets or []:
+        if not isinstance(target, (str, int)) and hasattr(target, "__index__"):
+            target = int(target)
+        # Handle передается своим instanceId, путь - только если id неизвестен
+        path, instance_id = object_ref(target)
+        resolved.append(instance_id if instance_id is not None else path)
+    return resolved
+
+def pack_floats(values: Any, count: int, width: int, name: str = "values") -> str:
+    """count строк по width чисел -> base64 упакованных float32 little-endian"""
+    data = _float32(values)
+    if len(data) != count * width:
+        raise ValueError(f"{name} must contain {count} rows of {width} values, got {len(data)} values")
+    if sys.byteorder == "big":
+        data.byteswap()
+    return base64.b64encode(data.tobytes()).decode("ascii")
+
+def _float32(values: Any) -> array:
+    # Буферный протокол (NumPy, array, memoryview): без обхода элементов в Python
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None:
+        typecode = view.format.lstrip("@=<")
+        if typecode in ("f", "d") and (view.format[0] != "<" or sys.byteorder == "little"):
+            raw = array(typecode)
+            # tobytes собирает и несмежные срезы в порядке строк
+            raw.frombytes(view.tobytes())
+            return raw if typecode == "f" else array("f", raw)
+
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    data = array("f")
+    for row in values:
+        if isinstance(row, dict):
+            data.extend(float(row[axis]) for axis in ("x", "y", "z", "w") if axis in row)
+        elif isinstance(row, (list, tuple)):
+            data.extend(float(value) for value in row)
+        else:
+            data.append(float(row))
+    return data
@@ -0,0 +1,86 @@
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from .deep_json import copy_tree
+
+# Команды только для чтения: одинаковые одновременные вызовы выполняются одним запросом
+COALESCED_ACTIONS = ("get_hierarchy", "get_components", "find_objects", "get_build_scenes")
+# Команды, не меняющие сцену: после остальных новые чтения не присоединяются к уже идущим
+READ_ACTIONS = COALESCED_ACTIONS + ("get_stats",)
+
+def flight_key(action: str, params: Optional[Dict] = None) -> Optional[str]:
+    """Ключ команды для объединения (None - параметры не сериализуются в JSON, например массивы NumPy)"""
+    # Незаданные параметры не различают команды: get_components с properties=None и без них - одна команда
+    params = {name: value for name, value in (params or {}).items() if value is not None}
+    try:
+        return json.dumps([action, params], sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+class SingleFlight:
+    """Объединение одинаковых одновременных команд чтения
+
+    Первый вызов с ключом выполняет команду, вызовы с тем же ключом до ее завершения ждут
+    и получают тот же результат. Каждый участник получает свою копию, если вызовов было больше одного.
+    forget() после изменяющей команды отвязывает новые вызовы от уже идущих запросов,
+    чтобы чтение после записи не получило ответ, запрошенный до нее.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        # Сколько вызовов получили результат чужого запроса
+        self.coalesced = 0
+
+    def do(self, key: Optional[str], func: Callable[[], Any]) -> Any:
+        """Выполняет func или присоединяется к идущему вызову с тем же ключом"""
+        if key is None:
+            return func()
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+
+        return self._lead(key, flight, func) if leader else self._follow(flight)
+
+    def forget(self) -> None:
+        """Новые вызовы больше не присоединяются к уже идущим"""
+        with self._lock:
+            self._flights.clear()
+
+    def _lead(self, key: str, flight: _Flight, func: Callable[[], Any]) -> Any:
+        try:
+            flight.result = func()
+        except BaseException as e:
+            flight.error = e
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            shared = flight.followers > 0
+        flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+        # Исходный результат остается неизменным, пока с него копируют ожидавшие вызовы
+        return copy_tree(flight.result) if shared else flight.result
+
+    def _follow(self, flight: _Flight) -> Any:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return copy_tree(flight.result)
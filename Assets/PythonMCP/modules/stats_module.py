@@ -0,0 +1,78 @@
+import requests
+import json
+import time
+from typing import Dict, Optional
+
+from .http_transport import HttpTransport
+
+# Интервал опроса GET /stats при ожидании разгрузки очереди редактора
+DEFAULT_POLL_INTERVAL = 0.05
+
+class StatsModule:
+    """Статистика очереди главного потока редактора (GET /stats)
+
+    queueDepth - сколько запросов ждет главного потока (queued - по приоритетам high, normal, low),
+    wait и execution - время ожидания и выполнения по приоритетам (count, avgMs, maxMs, p95Ms),
+    update - длительность одного кадра обработки, budgetExhausted - сколько кадров не уложились в бюджет.
+    Сервер отвечает на этот запрос вне главного потока, поэтому он доступен и под нагрузкой.
+    """
+
+    def __init__(self, base_url: str, transport: Optional[HttpTransport] = None):
+        self.base_url = base_url
+        self.transport = transport or HttpTransport(base_url)
+
+    def execute(self) -> Dict:
+        """Получает статистику очереди"""
+        try:
+            response = self.transport.request(**self.build_request())
+            response.raise_for_status()
+            return self.parse_response(response.json())
+
+        except requests.exceptions.RequestException as e:
+            return {
+                "success": False,
+                "action": "get_stats",
+                "error": f"Request error: {str(e)}"
+            }
+        except json.JSONDecodeError as e:
+            return {
+                "success": False,
+                "action": "get_stats",
+                "error": f"JSON decode error: {str(e)}"
+            }
+
+    def wait_for_capacity(self, max_queue_depth: int, timeout: float = 10.0,
+                          poll_interval: float = DEFAULT_POLL_INTERVAL) -> Dict:
+        """Ждет, пока в очереди редактора останется не больше max_queue_depth запросов (ошибка - по таймауту)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            result = self.execute()
+            if not result.get("success") or result["data"].get("queueDepth", 0) <= max_queue_depth:
+                return result
+            if time.monotonic() >= deadline:
+                return {
+                    "success": False,
+                    "action": "get_stats",
+                    "data": result["data"],
+                    "error": f"Queue depth is still {result['data'].get('queueDepth')} after {timeout} s"
+                }
+            time.sleep(poll_interval)
+
+    def build_request(self) -> Dict:
+        """Описание HTTP-запроса за статистикой"""
+        return {"method": "GET", "path": "/stats"}
+
+    def parse_response(self, result: Dict) -> Dict:
+        """Старые версии сервера отвечают {"error": "Endpoint not found"}"""
+        if not isinstance(result, dict) or "error" in result:
+            return {
+                "success": False,
+                "action": "get_stats",
+                "error": result.get("error") if isinstance(result, dict) else "Invalid stats format"
+            }
+        return {
+            "success": True,
+            "action": "get_stats",
+            "data": result,
+            "error": None
+        }
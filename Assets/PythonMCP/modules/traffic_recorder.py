@@ -0,0 +1,181 @@
+import itertools
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+from .deep_json import loads
+from .logging_module import LoggingModule
+
+class TrafficRecorder:
+    """Запись трафика клиента для последующего воспроизведения
+
+    Файл - JSON Lines, дописывается и не очищается при запуске. Каждая запись содержит
+    session (идентификатор сессии записи), seq (порядковый номер), t (секунды от начала
+    сессии до начала запроса), ts (время начала, UTC) и duration_ms. Записи двух типов:
+    "command" - команда execute_command и ее результат, "http" - HTTP-запрос транспорта
+    (method, path, params, json, ifNoneMatch) и ответ (status, etag, body).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.session = uuid.uuid4().hex[:12]
+        # Запись без ротации и без потерь: при переполнении очереди вызывающий код ждет
+        self._writer = LoggingModule(path, max_bytes=0, clear_on_start=False, drop_when_full=False)
+        self._seq = itertools.count()
+        self._epoch = time.perf_counter()
+        self._wall_epoch = datetime.utcnow()
+
+    def record_command(self, command: Any, result: Any, started: float) -> None:
+        """Записывает команду; started - time.perf_counter() перед ее выполнением"""
+        record = self._base("command", started)
+        record["request"] = command
+        record["response"] = result
+        self._writer.log_record(record)
+
+    def record_http(self, request: Dict, started: float, status: Optional[int] = None,
+                    body: Optional[str] = None, error: Optional[str] = None, etag: Optional[str] = None) -> None:
+        """Записывает HTTP-обмен; request - аргументы transport.request (method, path, params, json, headers)"""
+        record = self._base("http", started)
+        record.update({
+            "method": request.get("method"),
+            "path": request.get("path"),
+            "params": request.get("params"),
+            "json": request.get("json"),
+            # Условный запрос и ETag ответа: без них воспроизведение не отличит 304 от полного ответа
+            "ifNoneMatch": _header(request.get("headers"), "If-None-Match"),
+            "status": status,
+            "etag": etag,
+            "body": body
+        })
+        if error is not None:
+            record["error"] = error
+        self._writer.log_record(record)
+
+    def flush(self) -> None:
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def _base(self, record_type: str, started: float) -> Dict:
+        offset = started - self._epoch
+        return {
+            "type": record_type,
+            "session": self.session,
+            "seq": next(self._seq),
+            "t": round(offset, 6),
+            "ts": (self._wall_epoch + timedelta(seconds=offset)).isoformat() + "Z",
+            "duration_ms": round((time.perf_counter() - started) * 1000.0, 3)
+        }
+
+class RecordingTransport:
+    """Обертка над HttpTransport, записывающая каждый запрос и ответ
+
+    Потоковые ответы (stream=True) дочитываются целиком, чтобы попасть в запись;
+    iter_content потом отдает уже прочитанные данные.
+    """
+
+    def __init__(self, transport: Any, recorder: TrafficRecorder):
+        self.transport = transport
+        self.recorder = recorder
+        self.base_url = transport.base_url
+
+    def request(self, method: str, path: str, **kwargs) -> Any:
+        started = time.perf_counter()
+        call = {"method": method, "path": path, "params": kwargs.get("params"), "json": kwargs.get("json"),
+                "headers": kwargs.get("headers")}
+        try:
+            response = self.transport.request(method, path, **kwargs)
+            body = response.text
+        except Exception as e:
+            self.recorder.record_http(call, started, error=str(e))
+            raise
+        self.recorder.record_http(call, started, response.status_code, body, etag=_header(response.headers, "ETag"))
+        return response
+
+    def get(self, path: str, **kwargs) -> Any:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> Any:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> Any:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> Any:
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self) -> None:
+        self.transport.close()
+        self.recorder.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+class AsyncRecordingTransport:
+    """Обертка над AsyncHttpTransport, записывающая каждый запрос и ответ"""
+
+    def __init__(self, transport: Any, recorder: TrafficRecorder):
+        self.transport = transport
+        self.recorder = recorder
+        self.base_url = transport.base_url
+
+    async def request(self, method: str, path: str, **kwargs) -> Any:
+        started = time.perf_counter()
+        call = {"method": method, "path": path, "params": kwargs.get("params"), "json": kwargs.get("json"),
+                "headers": kwargs.get("headers")}
+        try:
+            response = await self.transport.request(method, path, **kwargs)
+            body = response.text
+        except Exception as e:
+            self.recorder.record_http(call, started, error=str(e))
+            raise
+        self.recorder.record_http(call, started, response.status_code, body, etag=_header(response.headers, "ETag"))
+        return response
+
+    async def get(self, path: str, **kwargs) -> Any:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> Any:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> Any:
+        return await self.request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Any:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def close(self) -> None:
+        await self.transport.close()
+        self.recorder.flush()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+def _header(headers: Optional[Dict[str, str]], name: str) -> Optional[str]:
+    """Значение заголовка без учета регистра имени (у AsyncHttpResponse имена в нижнем регистре)"""
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is not None:
+        return value
+    name = name.lower()
+    return next((v for k, v in headers.items() if k.lower() == name), None)
+
+def iter_trace(path: str) -> Iterator[Dict]:
+    """Читает записи файла трафика по одной"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+def load_trace(path: str, record_type: Optional[str] = None) -> List[Dict]:
+    """Загружает записи файла трафика (только указанного типа, если задан)"""
+    return [r for r in iter_trace(path) if record_type is None or r.get("type") == record_type]
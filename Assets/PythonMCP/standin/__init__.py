@@ -0,0 +1,30 @@
+"""Заглушка Unity Scene API
+
+Python-реализация маршрутов SceneAPIHandler поверх сцены в памяти,
+чтобы клиент можно было запускать и проверять без редактора Unity:
+
+- scene: Модель сцены (объекты, компоненты, поиск по пути)
+- change_log: Лента изменений сцены для GET /scene/changes
+- dispatcher: Очередь "главного потока" с бюджетом кадра и приоритетами (как MainThreadDispatcher)
+- handler: Обработчик маршрутов с теми же форматами ответов, что у редактора
+- server: HTTP-сервер (python -m standin.server --port 8080)
+- replay: Сервер, отвечающий записанными ответами (python -m standin.replay trace.jsonl)
+"""
+
+from .scene import StandInObject, StandInScene
+from .change_log import StandInChangeLog
+from .dispatcher import StandInDispatcher
+from .handler import StandInRequest, StandInSceneAPIHandler
+from .server import StandInSceneAPIServer
+from .replay import ReplaySceneAPIHandler
+
+__all__ = [
+    'StandInObject',
+    'StandInScene',
+    'StandInChangeLog',
+    'StandInDispatcher',
+    'StandInRequest',
+    'StandInSceneAPIHandler',
+    'StandInSceneAPIServer',
+    'ReplaySceneAPIHandler'
+]
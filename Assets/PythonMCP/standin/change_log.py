@@ -0,0 +1,247 @@
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from .scene import StandInObject, StandInScene
+
+DEFAULT_CHANGE_LOG_CAPACITY = 10000
+
+# Состояние объекта для сравнения: имя, id родителя (0 - корень сцены), activeInHierarchy, компоненты
+_State = Tuple[str, int, bool, Tuple[str, ...]]
+
+class StandInChangeLog:
+    """Аналог SceneChangeLog: лента изменений сцены для GET /scene/changes
+
+    Изменения находятся сравнением состояния объектов с предыдущим: сравниваются только объекты,
+    отмеченные mark_dirty (в редакторе - по ObjectChangeEvents и запросам API), их дети и родители.
+    Вся сцена обходится при первом запросе, для другой сцены и после rescan (изменение без
+    известных объектов). События содержат итоговое состояние, поэтому повторное применение безвредно.
+    """
+
+    def __init__(self, version: Callable[[], int], bump: Callable[[], None],
+                 capacity: int = DEFAULT_CHANGE_LOG_CAPACITY):
+        self._version = version
+        self._bump = bump
+        self.capacity = capacity
+        self._states: Optional[Dict[int, _State]] = None
+        self._children: Dict[int, List[int]] = {}
+        self._scene_id: Optional[int] = None
+        # instanceId объектов, изменившихся после предыдущего сравнения, и признак полного обхода
+        self._dirty: Set[int] = set()
+        self._rescan = False
+        # Изменения с версией не выше floor вытеснены из буфера: более старые курсоры синхронизируются заново
+        self.floor: Optional[int] = None
+        self._entries: Deque[Dict] = deque()
+
+    def changes_since(self, scene: StandInScene, since: Optional[int], epoch: Optional[str], current_epoch: str) -> Dict:
+        self._collect(scene)
+        current = self._version()
+        if since is None or (epoch and epoch != current_epoch) or since < self.floor or since > current:
+            return {"resync": True, "epoch": current_epoch, "version": current}
+        return {
+            "resync": False,
+            "epoch": current_epoch,
+            "version": current,
+            "changes": [entry for entry in self._entries if entry["version"] > since]
+        }
+
+    def mark_dirty(self, obj: Union[StandInObject, int]) -> None:
+        """Отмечает объект, у которого могли измениться имя, родитель, активность, компоненты или дети (0 - корни сцены)"""
+        self._dirty.add(obj.instance_id if isinstance(obj, StandInObject) else obj)
+
+    def rescan(self) -> None:
+        """Изменение без известных объектов (аналог hierarchyChanged без ObjectChangeEvents): следующий запрос обойдет всю сцену"""
+        self._rescan = True
+
+    def _collect(self, scene: StandInScene) -> None:
+        if self._states is not None and id(scene) == self._scene_id and not self._rescan:
+            if self._dirty:
+                self._refresh(scene)
+            return
+
+        states, children, order = self._scan(scene)
+        if self._states is None or id(scene) != self._scene_id:
+            # Первый обход или другая сцена: сравнивать не с чем, все курсоры синхронизируются заново
+            self._entries.clear()
+            self.floor = self._next_version()
+        else:
+            self._diff(states, children, order)
+
+        self._states = states
+        self._children = children
+        self._scene_id = id(scene)
+        self._dirty.clear()
+        self._rescan = False
+
+    @staticmethod
+    def _scan(scene: StandInScene) -> Tuple[Dict[int, _State], Dict[int, List[int]], List[int]]:
+        states: Dict[int, _State] = {}
+        children: Dict[int, List[int]] = {0: [obj.instance_id for obj in scene.root_objects]}
+        order: List[int] = []
+        stack = [(obj, 0, True) for obj in reversed(scene.root_objects)]
+        while stack:
+            obj, parent_id, parent_active = stack.pop()
+            active = parent_active and obj.active
+            states[obj.instance_id] = (obj.name, parent_id, active, tuple(obj.components.keys()))
+            order.append(obj.instance_id)
+            if obj.children:
+                children[obj.instance_id] = [child.instance_id for child in obj.children]
+                stack.extend((child, obj.instance_id, active) for child in reversed(obj.children))
+        return states, children, order
+
+    def _diff(self, states: Dict[int, _State], children: Dict[int, List[int]], order: List[int]) -> None:
+        old_states = self._states
+        events: List[Dict] = []
+
+        # Созданные объекты в порядке иерархии: родитель раньше детей
+        for object_id in order:
+            old = old_states.get(object_id)
+            if old is None:
+                events.append(_created_event(object_id, states[object_id]))
+            else:
+                events.extend(_change_events(object_id, old, states[object_id]))
+
+        # Порядок детей каждого родителя, у которого изменился состав или порядок детей
+        for parent_id, ids in children.items():
+            if self._children.get(parent_id) != ids:
+                events.append({"type": "reordered", "id": parent_id, "children": ids})
+        for parent_id in self._children:
+            if parent_id not in children and (parent_id == 0 or parent_id in states):
+                events.append({"type": "reordered", "id": parent_id, "children": []})
+
+        for object_id in old_states:
+            if object_id not in states:
+                events.append({"type": "destroyed", "id": object_id})
+
+        self._publish(events)
+
+    def _refresh(self, scene: StandInScene) -> None:
+        """Сравнивает только отмеченные объекты; порядок событий тот же, что у _diff"""
+        dirty, self._dirty = self._dirty, set()
+        events: List[Dict] = []
+        destroyed: List[Dict] = []
+        # Родители, у которых мог измениться состав или порядок детей (0 - корни сцены)
+        parents: Set[int] = set()
+        for object_id in dirty:
+            obj = scene.find_by_instance_id(object_id) if object_id != 0 else None
+            if object_id == 0:
+                parents.add(0)
+            elif obj is None:
+                self._remove(scene, object_id, events, destroyed, parents)
+            else:
+                self._update(obj, events, parents)
+
+        reordered: List[Dict] = []
+        while parents:
+            parent_id = parents.pop()
+            if parent_id == 0:
+                objects = scene.root_objects
+            else:
+                parent = scene.find_by_instance_id(parent_id)
+                if parent is None or parent_id not in self._states:
+                    continue
+                objects = parent.children
+            ids = [obj.instance_id for obj in objects]
+            old_ids = self._children.get(parent_id, [])
+            if ids == old_ids:
+                continue
+
+            # Дети, перенесенные или удаленные без отметки, находятся по разнице списков
+            current = set(ids)
+            for child_id in old_ids:
+                if child_id not in current:
+                    child = scene.find_by_instance_id(child_id)
+                    if child is None:
+                        self._remove(scene, child_id, events, destroyed, parents)
+                    else:
+                        self._update(child, events, parents)
+            for child in objects:
+                state = self._states.get(child.instance_id)
+                if state is None or state[1] != parent_id:
+                    self._update(child, events, parents)
+
+            if ids or parent_id == 0:
+                self._children[parent_id] = ids
+            else:
+                self._children.pop(parent_id, None)
+            reordered.append({"type": "reordered", "id": parent_id, "children": ids})
+
+        self._publish(events + reordered + destroyed)
+
+    def _update(self, obj: StandInObject, events: List[Dict], parents: Set[int]) -> None:
+        """Сравнивает объект с сохраненным состоянием; новые объекты добавляются вместе с поддеревом"""
+        # Новый объект добавляется от верхнего нового предка, чтобы родитель был в ленте раньше детей
+        while obj.parent is not None and obj.parent.instance_id not in self._states:
+            obj = obj.parent
+        stack = [(obj, obj.active_in_hierarchy)]
+        while stack:
+            obj, active = stack.pop()
+            object_id = obj.instance_id
+            parent_id = obj.parent.instance_id if obj.parent is not None else 0
+            state = (obj.name, parent_id, active, tuple(obj.components.keys()))
+            old = self._states.get(object_id)
+            self._states[object_id] = state
+            if old is None:
+                events.append(_created_event(object_id, state))
+                parents.add(parent_id)
+                descend = True
+            else:
+                events.extend(_change_events(object_id, old, state))
+                parents.update((old[1], parent_id))
+                # activeInHierarchy потомков следует за предком
+                descend = old[2] != active
+            parents.add(object_id)
+            if descend:
+                stack.extend((child, active and child.active) for child in reversed(obj.children))
+
+    def _remove(self, scene: StandInScene, object_id: int, events: List[Dict], destroyed: List[Dict], parents: Set[int]) -> None:
+        """Удаляет поддерево объекта из сохраненного состояния; потомки, перенесенные до удаления, обновляются"""
+        old = self._states.get(object_id)
+        if old is None:
+            return
+        parents.add(old[1])
+        stack = [object_id]
+        while stack:
+            current = stack.pop()
+            obj = scene.find_by_instance_id(current) if current != object_id else None
+            if obj is not None:
+                self._update(obj, events, parents)
+                continue
+            if self._states.pop(current, None) is None:
+                continue
+            stack.extend(self._children.pop(current, []))
+            destroyed.append({"type": "destroyed", "id": current})
+
+    def _publish(self, events: List[Dict]) -> None:
+        if not events:
+            return
+
+        # Новая версия выше всех выданных ранее: ни один курсор не пропустит эти события
+        version = self._next_version()
+        for event in events:
+            event["version"] = version
+            self._entries.append(event)
+        while len(self._entries) > self.capacity:
+            self.floor = max(self.floor, self._entries.popleft()["version"])
+
+    def _next_version(self) -> int:
+        self._bump()
+        return self._version()
+
+def _created_event(object_id: int, state: _State) -> Dict:
+    name, parent_id, active, components = state
+    return {"type": "created", "id": object_id, "parentId": parent_id, "name": name,
+            "active": active, "components": list(components)}
+
+def _change_events(object_id: int, old: _State, state: _State) -> List[Dict]:
+    name, parent_id, active, components = state
+    old_name, old_parent_id, old_active, old_components = old
+    events = []
+    if old_parent_id != parent_id:
+        events.append({"type": "reparented", "id": object_id, "parentId": parent_id, "previousParentId": old_parent_id})
+    if old_name != name:
+        events.append({"type": "renamed", "id": object_id, "name": name})
+    if old_active != active:
+        events.append({"type": "active_changed", "id": object_id, "active": active})
+    if old_components != components:
+        events.append({"type": "components_changed", "id": object_id, "components": list(components)})
+    return events
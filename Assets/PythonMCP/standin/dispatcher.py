@@ -0,0 +1,203 @@
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .handler import StandInRequest
+
+# Приоритеты как DispatchPriority в редакторе: дешевые чтения, изменения, выгрузки сцены и массовые операции
+HIGH, NORMAL, LOW = 0, 1, 2
+PRIORITY_NAMES = ("high", "normal", "low")
+LOW_PRIORITY_ROUTES = ("GET /scene", "POST /batch", "POST /objects/create/bulk")
+
+DEFAULT_BUDGET_MS = 10.0
+DEFAULT_STARVATION_MS = 250.0
+# Пауза между кадрами редактора (EditorApplication.update)
+DEFAULT_FRAME_INTERVAL = 0.005
+
+def request_priority(request: "StandInRequest") -> int:
+    """Аналог SceneAPIHandler.GetPriority"""
+    if f"{request.method} {request.path}" in LOW_PRIORITY_ROUTES:
+        return LOW
+    return HIGH if request.method == "GET" else NORMAL
+
+class _Metric:
+    """Число, среднее, максимум и 95-й перцентиль последних значений (как Metric в MainThreadDispatcher)"""
+    __slots__ = ("count", "total", "max", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=256)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def snapshot(self) -> Dict:
+        ordered = sorted(self.recent)
+        return {
+            "count": self.count,
+            "avgMs": round(self.total / self.count, 3) if self.count else 0,
+            "maxMs": round(self.max, 3),
+            "p95Ms": round(ordered[-(-len(ordered) * 95 // 100) - 1], 3) if ordered else 0
+        }
+
+class _WorkItem:
+    __slots__ = ("func", "priority", "enqueued", "done", "result", "error")
+
+    def __init__(self, func: Callable[[], Any], priority: int):
+        self.func = func
+        self.priority = priority
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+class StandInDispatcher:
+    """Аналог MainThreadDispatcher: отдельный поток в роли главного потока редактора
+
+    Каждый кадр забирает накопленные запросы одной заменой списка под блокировкой и выполняет их
+    по приоритетам, пока не исчерпан бюджет кадра; остальное ждет следующего кадра. Запрос,
+    ждущий дольше starvation_ms, выполняется раньше более приоритетных. Статистика - в формате GET /stats.
+    """
+
+    def __init__(self, budget_ms: float = DEFAULT_BUDGET_MS, frame_interval: float = DEFAULT_FRAME_INTERVAL,
+                 starvation_ms: float = DEFAULT_STARVATION_MS):
+        self.budget_ms = budget_ms
+        self.frame_interval = frame_interval
+        self.starvation_ms = starvation_ms
+        self._lock = threading.Lock()
+        self._pending: List[_WorkItem] = []
+        self._ready: List[Deque[_WorkItem]] = [deque() for _ in PRIORITY_NAMES]
+        self._queued = [0] * len(PRIORITY_NAMES)
+        self._max_queue_depth = 0
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._stats_lock = threading.Lock()
+        self._waits = [_Metric() for _ in PRIORITY_NAMES]
+        self._executions = [_Metric() for _ in PRIORITY_NAMES]
+        self._updates = _Metric()
+        self._failed = 0
+        self._budget_exhausted = 0
+
+    def start(self) -> "StandInDispatcher":
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._loop, name="standin-main-thread", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def run(self, func: Callable[[], Any], priority: int = NORMAL) -> Any:
+        """Выполняет func в "главном потоке" и ждет результата (исключение пробрасывается вызывающему)"""
+        item = _WorkItem(func, priority)
+        with self._lock:
+            self._pending.append(item)
+            self._queued[priority] += 1
+            self._max_queue_depth = max(self._max_queue_depth, sum(self._queued))
+        self._wake.set()
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    @property
+    def queue_depth(self) -> int:
+        with self._lock:
+            return sum(self._queued)
+
+    def stats(self) -> Dict:
+        """Ответ GET /stats; доступен из любого потока, не ждет главного"""
+        with self._lock:
+            queued = list(self._queued)
+            max_queue_depth = self._max_queue_depth
+        with self._stats_lock:
+            return {
+                "queueDepth": sum(queued),
+                "maxQueueDepth": max_queue_depth,
+                "queued": dict(zip(PRIORITY_NAMES, queued)),
+                "budgetMs": self.budget_ms,
+                "failed": self._failed,
+                "budgetExhausted": self._budget_exhausted,
+                "update": self._updates.snapshot(),
+                "wait": {name: metric.snapshot() for name, metric in zip(PRIORITY_NAMES, self._waits)},
+                "execution": {name: metric.snapshot() for name, metric in zip(PRIORITY_NAMES, self._executions)}
+            }
+
+    def _loop(self) -> None:
+        while not self._stopped.is_set():
+            if not self._has_work():
+                # Простой: ждем нового запроса вместо пустых кадров
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            self._update()
+            time.sleep(self.frame_interval)
+
+    def _has_work(self) -> bool:
+        with self._lock:
+            return bool(self._pending) or any(self._ready)
+
+    def _update(self) -> None:
+        with self._lock:
+            incoming, self._pending = self._pending, []
+        for item in incoming:
+            self._ready[item.priority].append(item)
+
+        start = time.perf_counter()
+        budget = self.budget_ms / 1000
+        ran = False
+        # Хотя бы одна задача за кадр: задача длиннее бюджета тоже выполняется
+        while True:
+            item = self._take()
+            if item is None:
+                break
+            started = time.perf_counter()
+            try:
+                item.result = item.func()
+            except BaseException as e:
+                item.error = e
+            finished = time.perf_counter()
+            with self._lock:
+                self._queued[item.priority] -= 1
+            with self._stats_lock:
+                self._waits[item.priority].add((started - item.enqueued) * 1000)
+                self._executions[item.priority].add((finished - started) * 1000)
+                if item.error is not None:
+                    self._failed += 1
+            item.done.set()
+            ran = True
+
+            if finished - start >= budget:
+                if any(self._ready):
+                    with self._stats_lock:
+                        self._budget_exhausted += 1
+                break
+
+        if ran:
+            with self._stats_lock:
+                self._updates.add((time.perf_counter() - start) * 1000)
+
+    def _take(self) -> Optional[_WorkItem]:
+        now = time.perf_counter()
+        # Сначала самая старая задача низкого приоритета, если она ждет слишком долго, затем строго по приоритету
+        for queue in reversed(self._ready[1:]):
+            if queue and (now - queue[0].enqueued) * 1000 >= self.starvation_ms:
+                return queue.popleft()
+        for queue in self._ready:
+            if queue:
+                return queue.popleft()
+        return None
@@ -0,0 +1,529 @@
+import base64
+import json
+import uuid
+from array import array
+from typing import Any, Dict, List, Optional
+
+from modules.deep_json import dumps, loads
+from modules.hierarchy_projection import parse_fields, parse_max_depth
+from modules.object_filter import ObjectFilter
+
+from .change_log import StandInChangeLog
+from .dispatcher import StandInDispatcher
+from .scene import StandInObject, StandInScene
+
+MAX_BATCH_SIZE = 1000
+# Как FindObjectsModule.DefaultLimit и MaxLimit
+DEFAULT_FIND_LIMIT = 1000
+MAX_FIND_LIMIT = 10000
+# Как CreateObjectsModule.MaxObjects
+MAX_BULK_CREATE = 10000
+# Как SceneAPIHandler.MutatingRoutes: POST /batch сюда не входит, его подзапросы проходят через handle сами
+MUTATING_ROUTES = frozenset((
+    "POST /scene/open",
+    "POST /objects/create",
+    "POST /objects/create/bulk",
+    "DELETE /objects/delete",
+    "POST /objects/transforms",
+    "POST /objects/components/add",
+    "PUT /objects/components/modify",
+    "DELETE /objects/components/remove",
+))
+
+def _dumps(payload: Any, indented: bool = False) -> str:
+    # Newtonsoft: Formatting.Indented - отступ в 2 пробела
+    return dumps(payload, ensure_ascii=False, indent=2 if indented else None,
+                 separators=None if indented else (",", ":"))
+
+def _changed_scene(response: str) -> bool:
+    # Как SceneAPIHandler.ChangedScene: успешный ответ, применивший хотя бы одно изменение
+    try:
+        result = json.loads(response)
+    except json.JSONDecodeError:
+        return False
+    if not isinstance(result, dict) or result.get("success") is not True:
+        return False
+    count = result.get("created", result.get("applied"))
+    return count is None or count > 0
+
+def _split_list(value: Optional[str]) -> Optional[List[str]]:
+    items = [item.strip() for item in (value or "").split(",") if item.strip()]
+    return items or None
+
+class StandInRequest:
+    """Аналог SceneAPIRequest: метод, путь, query, заголовки и тело запроса"""
+
+    def __init__(self, method: str, path: str, query: Optional[Dict[str, str]] = None,
+                 headers: Optional[Dict[str, str]] = None, body: str = ""):
+        self.method = method.upper()
+        self.path = path
+        self.query = query or {}
+        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self.body = body or ""
+        self.status_code = 200
+        self.response_headers: Dict[str, str] = {}
+
+    @classmethod
+    def from_batch_entry(cls, entry: Dict) -> "StandInRequest":
+        body = entry.get("body")
+        query = {k: v if isinstance(v, str) else json.dumps(v) for k, v in (entry.get("query") or {}).items() if v is not None}
+        return cls(
+            entry.get("method") or "GET",
+            entry.get("path") or "",
+            query,
+            entry.get("headers") or {},
+            "" if body is None else json.dumps(body, ensure_ascii=False)
+        )
+
+    def json_body(self) -> Optional[Dict]:
+        return json.loads(self.body) if self.body else None
+
+class StandInSceneAPIHandler:
+    """Python-заглушка SceneAPIHandler: те же маршруты и форматы ответов, что у редактора"""
+
+    def __init__(self, scene: Optional[StandInScene] = None):
+        self.scene = scene or StandInScene.sample()
+        self.scenes: Dict[str, StandInScene] = {self.scene.path: self.scene}
+        # Аналог SceneVersion: ETag ответа GET /scene
+        self.version = 0
+        self._epoch = uuid.uuid4().hex[:8]
+        self.change_log = StandInChangeLog(lambda: self.version, self._next_version)
+        # Ассеты префабов для POST /objects/create/bulk: путь ассета -> корневой объект шаблона
+        self.prefabs: Dict[str, StandInObject] = {}
+        # Очередь "главного потока"; ее запускает StandInSceneAPIServer
+        self.dispatcher = StandInDispatcher()
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._epoch}-{self.version}"'
+
+    def bump_version(self) -> None:
+        """Отмечает изменение сцены без известных объектов (в редакторе - hierarchyChanged, он же сбрасывает индекс путей)"""
+        self.version += 1
+        self.scene.hierarchy_changed()
+        self.change_log.rescan()
+
+    def _next_version(self) -> None:
+        self.version += 1
+
+    def handle(self, request: StandInRequest) -> str:
+        routes = {
+            # Служебные маршруты
+            "GET /capabilities": self.capabilities,
+            "POST /batch": self.batch,
+            "GET /stats": self.get_stats,
+            # Сцена
+            "GET /scene": self.get_hierarchy,
+            "GET /scene/changes": self.get_scene_changes,
+            "POST /scene/open": self.open_scene,
+            "GET /build/scenes": self.get_build_scenes,
+            "POST /build/scenes/add": self.add_scene_to_build,
+            "DELETE /build/scenes/remove": self.remove_scene_from_build,
+            # Объекты
+            "POST /objects/create": self.create_object,
+            "POST /objects/create/bulk": self.create_objects,
+            "DELETE /objects/delete": self.delete_object,
+            "GET /objects/find": self.find_objects,
+            "POST /objects/transforms": self.set_transforms,
+            # Компоненты
+            "GET /objects/components": self.get_components,
+            "POST /objects/components/add": self.add_component,
+            "PUT /objects/components/modify": self.modify_component,
+            "DELETE /objects/components/remove": self.remove_component,
+        }
+        key = f"{request.method} {request.path}"
+        route = routes.get(key)
+        if route is None:
+            response = _dumps({"error": "Endpoint not found"})
+        else:
+            try:
+                response = route(request)
+            except Exception as e:
+                response = _dumps({"error": str(e)})
+
+        # Как в SceneAPIHandler: версию меняет только успешное изменение сцены (индекс путей при этом не сбрасывается)
+        if key in MUTATING_ROUTES and _changed_scene(response):
+            self.version += 1
+        return response
+
+    def capabilities(self, request: StandInRequest) -> str:
+        return _dumps({"batch": True, "maxBatchSize": MAX_BATCH_SIZE, "find": True, "maxFindLimit": MAX_FIND_LIMIT, "transforms": True,
+                       "bulkCreate": True, "maxBulkCreate": MAX_BULK_CREATE, "stats": True})
+
+    def get_stats(self, request: StandInRequest) -> str:
+        """Аналог StatsModule (сервер отвечает на GET /stats сам, этот маршрут нужен для пакетов)"""
+        return _dumps(self.dispatcher.stats())
+
+    def batch(self, request: StandInRequest) -> str:
+        """Аналог BatchModule: все команды выполняются за один проход"""
+        try:
+            data = request.json_body()
+            commands = data.get("commands") if isinstance(data, dict) else None
+            if not isinstance(commands, list):
+                return _dumps({"success": False, "error": "Commands array is required"})
+            if len(commands) > MAX_BATCH_SIZE:
+                return _dumps({"success": False, "error": f"Batch is too large: {len(commands)} commands (max {MAX_BATCH_SIZE})"})
+
+            stop_on_error = data.get("stopOnError", True)
+            results = []
+            stopped = False
+            for i, entry in enumerate(commands):
+                status = 200
+                if not isinstance(entry, dict):
+                    status, body = 400, {"error": "Invalid batch entry"}
+                else:
+                    sub_request = StandInRequest.from_batch_entry(entry)
+                    if sub_request.path == "/batch":
+                        status, body = 400, {"error": "Nested batch requests are not supported"}
+                    else:
+                        text = self.handle(sub_request)
+                        status = sub_request.status_code
+                        try:
+                            body = loads(text) if text else None
+                        except json.JSONDecodeError:
+                            body = text
+
+                results.append({"index": i, "status": status, "body": body})
+                if stop_on_error and self._is_error(body):
+                    stopped = i < len(commands) - 1
+                    break
+
+            return _dumps({
+                "success": True,
+                "results": results,
+                "completed": len(results),
+                "total": len(commands),
+                "stopped": stopped
+            })
+        except Exception as e:
+            return _dumps({"success": False, "error": f"Error executing batch: {e}"})
+
+    def get_hierarchy(self, request: StandInRequest) -> str:
+        request.response_headers["ETag"] = self.etag
+        if self._etag_matches(request.headers.get("if-none-match")):
+            request.status_code = 304
+            return ""
+        try:
+            max_depth = parse_max_depth(request.query.get("max_depth"))
+            fields = parse_fields(request.query.get("fields"))
+        except ValueError as e:
+            return _dumps({"error": str(e)})
+        from_path = (request.query.get("from_path") or "").strip() or None
+        if request.query.get("format") == "columnar":
+            return _dumps(self.scene.to_columnar(from_path, max_depth, fields))
+        return _dumps(self.scene.to_hierarchy(from_path, max_depth, fields))
+
+    def get_scene_changes(self, request: StandInRequest) -> str:
+        try:
+            since = int(request.query.get("since", ""))
+        except ValueError:
+            since = None
+        return _dumps(self.change_log.changes_since(self.scene, since, request.query.get("epoch"), self._epoch))
+
+    def _etag_matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == self.etag:
+                return True
+        return False
+
+    def open_scene(self, request: StandInRequest) -> str:
+        data = request.json_body() or {}
+        scene_path = data.get("scenePath")
+        if not scene_path:
+            return _dumps({"success": False, "error": "Scene path is required"})
+        scene = self.scenes.get(scene_path)
+        if scene is None:
+            return _dumps({"success": False, "error": f"Error opening scene: Cannot open scene '{scene_path}'"})
+        self.scene = scene
+        return _dumps({"success": True, "message": f"Scene opened: {scene_path}"})
+
+    def get_build_scenes(self, request: StandInRequest) -> str:
+        scenes = self.scene.build_scenes
+        return _dumps({"scenes": scenes, "totalCount": len(scenes)}, indented=True)
+
+    def add_scene_to_build(self, request: StandInRequest) -> str:
+        data = request.json_body() or {}
+        scene_path = data.get("scenePath")
+        if not scene_path:
+            return _dumps({"success": False, "error": "Scene path is required"})
+        if any(s["path"] == scene_path for s in self.scene.build_scenes):
+            return _dumps({"success": False, "error": "Scene already in build settings"})
+        self.scene.build_scenes.append({"path": scene_path, "enabled": True, "guid": "0" * 32})
+        return _dumps({"success": True, "message": f"Scene added to build: {scene_path}"})
+
+    def remove_scene_from_build(self, request: StandInRequest) -> str:
+        data = request.json_body() or {}
+        scene_path = data.get("scenePath")
+        if not scene_path:
+            return _dumps({"success": False, "error": "Scene path is required"})
+        for scene in self.scene.build_scenes:
+            if scene["path"] == scene_path:
+                self.scene.build_scenes.remove(scene)
+                return _dumps({"success": True, "message": f"Scene removed from build: {scene_path}"})
+        return _dumps({"success": False, "error": "Scene not found in build settings"})
+
+    def create_object(self, request: StandInRequest) -> str:
+        data = request.json_body() or {}
+        name = data.get("name") or "GameObject"
+        parent_path = data.get("parentPath") or ""
+        parent = None
+        if isinstance(data.get("parentId"), int):
+            parent, error = self.scene.resolve(parent_path, data["parentId"])
+            if parent is None:
+                return _dumps({"success": False, "error": error})
+            parent_path = self.scene.path_of(parent)
+        elif parent_path:
+            parent = self.scene.find_by_path(parent_path)
+
+        obj = StandInObject(name)
+        if parent is not None:
+            parent.add_child(obj)
+        else:
+            self.scene.add_root(obj)
+        self.change_log.mark_dirty(obj)
+
+        return _dumps({
+            "success": True,
+            "path": f"{parent_path}/{name}" if parent_path else name,
+            "instanceId": obj.instance_id,
+            "message": f"Object created: {name}"
+        })
+
+    def create_objects(self, request: StandInRequest) -> str:
+        """Аналог CreateObjectsModule: объекты создаются по порядку, parentIndex ссылается на более раннюю запись"""
+        data = request.json_body() or {}
+        specs = data.get("objects")
+        if not isinstance(specs, list):
+            return _dumps({"success": False, "error": "Objects array is required"})
+        if len(specs) > MAX_BULK_CREATE:
+            return _dumps({"success": False, "error": f"Too many objects: {len(specs)} (max {MAX_BULK_CREATE})"})
+
+        parents_by_path: Dict[str, Optional[StandInObject]] = {}
+        created: List[Optional[StandInObject]] = []
+        paths: List[Optional[str]] = []
+        errors = []
+        for i, spec in enumerate(specs):
+            parent, parent_path, error = None, None, None
+            if not isinstance(spec, dict):
+                error = "Invalid object spec"
+            elif isinstance(spec.get("parentIndex"), int):
+                index = spec["parentIndex"]
+                if 0 <= index < i and created[index] is not None:
+                    parent, parent_path = created[index], paths[index]
+                else:
+                    error = f"Parent entry {index} was not created before entry {i}"
+            elif isinstance(spec.get("parentId"), int):
+                parent, error = self.scene.resolve(None, spec["parentId"])
+                if parent is not None:
+                    parent_path = self.scene.path_of(parent)
+            elif spec.get("parentPath"):
+                parent_path = spec["parentPath"]
+                if parent_path not in parents_by_path:
+                    parents_by_path[parent_path] = self.scene.find_by_path(parent_path)
+                parent = parents_by_path[parent_path]
+                if parent is None:
+                    error = f"Parent object not found: {parent_path}"
+
+            prefab = None
+            if error is None and spec.get("prefab"):
+                prefab = self.prefabs.get(spec["prefab"])
+                if prefab is None:
+                    error = f"Prefab not found: {spec['prefab']}"
+            if error is not None:
+                created.append(None)
+                paths.append(None)
+                errors.append({"index": i, "error": error})
+                continue
+
+            if prefab is not None:
+                obj = prefab.clone()
+                obj.name = spec.get("name") or obj.name
+            else:
+                obj = StandInObject(spec.get("name") or "GameObject")
+            for component_type in spec.get("components") or []:
+                obj.components.setdefault(component_type, {})
+            transform = obj.components["Transform"]
+            for key, prop in (("position", "m_LocalPosition"), ("rotation", "m_LocalRotation"), ("scale", "m_LocalScale")):
+                if isinstance(spec.get(key), dict):
+                    transform[prop] = dict(transform[prop], **{axis: float(v) for axis, v in spec[key].items()})
+            if parent is not None:
+                parent.add_child(obj)
+            else:
+                self.scene.add_root(obj)
+            self.change_log.mark_dirty(obj)
+            created.append(obj)
+            paths.append(f"{parent_path}/{obj.name}" if parent_path else obj.name)
+
+        count = len(specs) - len(errors)
+        return _dumps({
+            "success": True,
+            "created": count,
+            "instanceIds": [obj.instance_id if obj is not None else None for obj in created],
+            "paths": paths,
+            "errors": errors,
+            "message": f"Objects created: {count} of {len(specs)}"
+        })
+
+    def delete_object(self, request: StandInRequest) -> str:
+        data = request.json_body() or {}
+        object_path = data.get("path")
+        instance_id = data.get("instanceId")
+        if not object_path and instance_id is None:
+            return _dumps({"success": False, "error": "Object path is required"})
+        obj, error = self.scene.resolve(object_path, instance_id)
+        if obj is None:
+            return _dumps({"success": False, "error": error})
+        if instance_id is not None:
+            object_path = self.scene.path_of(obj)
+        self.scene.remove(obj)
+        self.change_log.mark_dirty(obj)
+        return _dumps({"success": True, "message": f"Object deleted: {object_path}"})
+
+    def find_objects(self, request: StandInRequest) -> str:
+        """Аналог FindObjectsModule: фильтр в порядке иерархии, nextCursor - instanceId первого непросмотренного объекта"""
+        try:
+            object_filter = ObjectFilter.from_params(request.query)
+        except ValueError as e:
+            return _dumps({"error": str(e)})
+        limit = request.query.get("limit")
+        if limit:
+            if not limit.isdigit() or int(limit) <= 0:
+                return _dumps({"error": "limit must be a positive integer"})
+            limit = min(int(limit), MAX_FIND_LIMIT)
+        else:
+            limit = DEFAULT_FIND_LIMIT
+        cursor = request.query.get("cursor")
+        try:
+            cursor = int(cursor) if cursor else None
+        except ValueError:
+            return _dumps({"error": f"Invalid cursor: {cursor}"})
+        if object_filter.is_empty:
+            return _dumps({"error": "name or another filter is required"})
+
+        start = None
+        if cursor is not None:
+            start = self.scene.find_by_instance_id(cursor)
+            if start is None:
+                return _dumps({"error": "Cursor object no longer exists"})
+
+        paths = []
+        instance_ids = []
+        next_cursor = None
+        for obj, path in self.scene.iter_from(start):
+            if len(paths) >= limit:
+                next_cursor = str(obj.instance_id)
+                break
+            if object_filter.matches(obj.name, obj.tag, obj.layer, obj.active_in_hierarchy, obj.components):
+                paths.append(path)
+                instance_ids.append(obj.instance_id)
+        return _dumps({"paths": paths, "instanceIds": instance_ids, "foundCount": len(paths), "nextCursor": next_cursor})
+
+    def set_transforms(self, request: StandInRequest) -> str:
+        """Аналог SetTransformsModule: строка i массивов задает трансформацию targets[i] (мировые координаты = локальные)"""
+        data = request.json_body() or {}
+        targets = data.get("targets")
+        if not isinstance(targets, list) or not targets:
+            return _dumps({"success": False, "error": "Targets array is required"})
+        space = data.get("space") or "world"
+        if space not in ("world", "local"):
+            return _dumps({"success": False, "error": f"Unknown space: {space}"})
+
+        columns = {}
+        for key, width in (("positions", 3), ("rotations", 4), ("scales", 3)):
+            values = data.get(key)
+            if values is None:
+                continue
+            if data.get("encoding") == "base64-f32":
+                packed = array("f")
+                packed.frombytes(base64.b64decode(values))
+                values = packed
+            if len(values) != len(targets) * width:
+                return _dumps({"success": False, "error": f"{key} must contain {len(targets)} rows of {width} values, got {len(values)} values"})
+            columns[key] = values
+
+        missing = []
+        for i, target in enumerate(targets):
+            obj = self.scene.find_by_instance_id(target) if isinstance(target, int) else self.scene.find_by_path(target)
+            if obj is None:
+                missing.append(i)
+                continue
+            transform = obj.components.setdefault("Transform", {})
+            for key, prop, axes in (("positions", "m_LocalPosition", "xyz"), ("rotations", "m_LocalRotation", "xyzw"),
+                                    ("scales", "m_LocalScale", "xyz")):
+                if key in columns:
+                    values = columns[key]
+                    transform[prop] = {axis: float(values[len(axes) * i + j]) for j, axis in enumerate(axes)}
+
+        applied = len(targets) - len(missing)
+        return _dumps({"success": True, "applied": applied, "missing": missing,
+                       "message": f"Transforms set: {applied} of {len(targets)}"})
+
+    def get_components(self, request: StandInRequest) -> str:
+        object_path = request.query.get("path")
+        instance_id = request.query.get("instance_id")
+        instance_id = int(instance_id) if instance_id and instance_id.lstrip("-").isdigit() else None
+        if not object_path and instance_id is None:
+            return _dumps({"error": "Object path is required"})
+        obj, error = self.scene.resolve(object_path, instance_id)
+        if obj is None:
+            return _dumps({"error": error})
+        if instance_id is not None:
+            object_path = self.scene.path_of(obj)
+        for key in ("depth", "max_array"):
+            value = request.query.get(key)
+            if value and not value.isdigit():
+                return _dumps({"error": f"{key} must be a non-negative integer"})
+        component_types = _split_list(request.query.get("components"))
+        properties = _split_list(request.query.get("properties"))
+        return _dumps({"path": object_path, "instanceId": obj.instance_id,
+                       "components": self.scene.components_of(obj, component_types, properties)})
+
+    def add_component(self, request: StandInRequest) -> str:
+        obj, component_type, error = self._resolve_component_request(request)
+        if error:
+            return error
+        if component_type not in obj.components:
+            obj.components[component_type] = {}
+            self.change_log.mark_dirty(obj)
+        return _dumps({"success": True, "message": f"Component {component_type} added to {self.scene.path_of(obj)}"})
+
+    def modify_component(self, request: StandInRequest) -> str:
+        obj, component_type, error = self._resolve_component_request(request)
+        if error:
+            return error
+        component = obj.components.get(component_type)
+        if component is None:
+            return _dumps({"success": False, "error": f"Component {component_type} not found on object"})
+        component.update((request.json_body() or {}).get("properties") or {})
+        return _dumps({"success": True, "message": f"Component {component_type} modified on {self.scene.path_of(obj)}"})
+
+    def remove_component(self, request: StandInRequest) -> str:
+        obj, component_type, error = self._resolve_component_request(request)
+        if error:
+            return error
+        if component_type not in obj.components:
+            return _dumps({"success": False, "error": f"Component {component_type} not found on object"})
+        del obj.components[component_type]
+        self.change_log.mark_dirty(obj)
+        return _dumps({"success": True, "message": f"Component {component_type} removed from {self.scene.path_of(obj)}"})
+
+    def _resolve_component_request(self, request: StandInRequest):
+        data = request.json_body() or {}
+        object_path = data.get("path")
+        instance_id = data.get("instanceId")
+        component_type = data.get("componentType")
+        if (not object_path and instance_id is None) or not component_type:
+            return None, None, _dumps({"success": False, "error": "Object path and component type are required"})
+        obj, error = self.scene.resolve(object_path, instance_id)
+        if obj is None:
+            return None, None, _dumps({"success": False, "error": error})
+        return obj, component_type, None
+
+    @staticmethod
+    def _is_error(body: Any) -> bool:
+        if not isinstance(body, dict):
+            return False
+        return body.get("error") is not None or body.get("success") is False
@@ -0,0 +1,109 @@
+import argparse
+import json
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from modules.deep_json import dumps
+from modules.traffic_recorder import load_trace
+
+from .handler import StandInRequest
+from .server import StandInSceneAPIServer
+
+_Key = Tuple[str, str, str, str, str]
+
+def _canonical_body(body) -> str:
+    return "" if body is None else dumps(body, ensure_ascii=False, separators=(",", ":"))
+
+def _recorded_key(record: Dict) -> _Key:
+    # requests и AsyncHttpTransport передают значения query через str(), None пропускается
+    params = {k: str(v) for k, v in (record.get("params") or {}).items() if v is not None}
+    return (
+        (record.get("method") or "GET").upper(),
+        record.get("path") or "",
+        json.dumps(params, sort_keys=True) if params else "",
+        _canonical_body(record.get("json")),
+        record.get("ifNoneMatch") or ""
+    )
+
+def _request_key(request: StandInRequest) -> _Key:
+    try:
+        body = _canonical_body(json.loads(request.body)) if request.body else ""
+    except json.JSONDecodeError:
+        body = request.body
+    return (
+        request.method,
+        request.path,
+        json.dumps(request.query, sort_keys=True) if request.query else "",
+        body,
+        request.headers.get("if-none-match") or ""
+    )
+
+class ReplaySceneAPIHandler:
+    """Отвечает записанными ответами вместо сцены
+
+    Запрос сопоставляется с записями по методу, пути, query, телу и If-None-Match; одинаковые запросы
+    получают записанные ответы по очереди, после исчерпания повторяется последний.
+    Перед ответом выдерживается записанная задержка, умноженная на time_scale
+    (0 - отвечать сразу). Незаписанные запросы получают {"error": ...}, как
+    неизвестный маршрут в SceneAPIHandler.
+    """
+
+    def __init__(self, records: Iterable[Dict], time_scale: float = 1.0):
+        self.time_scale = time_scale
+        self.served = 0
+        self.missed: List[str] = []
+        self._responses: Dict[_Key, List[Dict]] = {}
+        self._cursors: Dict[_Key, int] = {}
+        self._lock = threading.Lock()
+        for record in records:
+            if record.get("type") == "http" and record.get("status") is not None:
+                self._responses.setdefault(_recorded_key(record), []).append(record)
+
+    @property
+    def recorded_count(self) -> int:
+        return sum(len(v) for v in self._responses.values())
+
+    def handle(self, request: StandInRequest) -> str:
+        key = _request_key(request)
+        with self._lock:
+            recorded = self._responses.get(key)
+            if not recorded:
+                self.missed.append(f"{request.method} {request.path}")
+                return dumps({"error": f"No recorded response for {request.method} {request.path}"})
+            cursor = self._cursors.get(key, 0)
+            record = recorded[min(cursor, len(recorded) - 1)]
+            self._cursors[key] = cursor + 1
+            self.served += 1
+
+        delay = (record.get("duration_ms") or 0.0) / 1000.0 * self.time_scale
+        if delay > 0:
+            time.sleep(delay)
+        request.status_code = record["status"]
+        if record.get("etag"):
+            request.response_headers["ETag"] = record["etag"]
+        return record.get("body") or ""
+
+def main():
+    parser = argparse.ArgumentParser(description="Сервер, воспроизводящий записанные ответы Unity Scene API")
+    parser.add_argument("trace", help="файл записи (UnitySceneAPI(record_path=...))")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--time-scale", type=float, default=1.0, help="множитель записанных задержек (0 - без задержек)")
+    parser.add_argument("--session", help="воспроизводить только указанную сессию записи")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    records = [r for r in load_trace(args.trace, "http") if not args.session or r.get("session") == args.session]
+    handler = ReplaySceneAPIHandler(records, args.time_scale)
+    server = StandInSceneAPIServer(args.host, args.port, verbose=args.verbose, api_handler=handler)
+    print(f"Replaying {handler.recorded_count} recorded responses on http://{server.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    if handler.missed:
+        print(f"{len(handler.missed)} requests had no recorded response")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,444 @@
+import copy
+import itertools
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_instance_ids = itertools.count(10000)
+# Все живые объекты по instanceId, как таблица объектов редактора за EditorUtility.InstanceIDToObject
+_objects_by_id: "weakref.WeakValueDictionary[int, StandInObject]" = weakref.WeakValueDictionary()
+_MISSING = object()
+
+STALE_HANDLE_ERROR = "Stale object handle"
+
+# Поля узла GET /scene по умолчанию и колонки колоночного формата (кроме name, parent и компонентов)
+DEFAULT_FIELDS = ("name", "path", "instanceId", "active", "components")
+COLUMNAR_FIELDS = ("instanceId", "active", "tag", "layer", "position", "rotation", "scale")
+
+def default_component_properties(component_type: str) -> Dict:
+    """Свойства, которые Unity показывает для компонента по умолчанию"""
+    if component_type == "Transform":
+        return {
+            "m_LocalRotation": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+            "m_LocalPosition": {"x": 0.0, "y": 0.0, "z": 0.0},
+            "m_LocalScale": {"x": 1.0, "y": 1.0, "z": 1.0}
+        }
+    return {}
+
+class StandInObject:
+    """GameObject сцены-заглушки: имя, флаги, компоненты и дочерние объекты"""
+    __slots__ = ("instance_id", "name", "active", "tag", "layer", "components", "parent", "children", "__weakref__")
+
+    def __init__(self, name: str, components: Optional[List[str]] = None,
+                 active: bool = True, tag: str = "Untagged", layer: int = 0):
+        self.instance_id = next(_instance_ids)
+        self.name = name
+        self.active = active
+        self.tag = tag
+        self.layer = layer
+        self.components: Dict[str, Dict] = {}
+        self.parent: Optional["StandInObject"] = None
+        self.children: List["StandInObject"] = []
+        _objects_by_id[self.instance_id] = self
+        for component_type in ["Transform"] + [c for c in (components or []) if c != "Transform"]:
+            self.components[component_type] = default_component_properties(component_type)
+
+    def add_child(self, child: "StandInObject") -> "StandInObject":
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def clone(self) -> "StandInObject":
+        """Копия поддерева с новыми instanceId (как экземпляр префаба)"""
+        root = None
+        stack: List[Tuple["StandInObject", Optional["StandInObject"]]] = [(self, None)]
+        while stack:
+            source, parent = stack.pop()
+            copy_obj = StandInObject(source.name, active=source.active, tag=source.tag, layer=source.layer)
+            copy_obj.components = copy.deepcopy(source.components)
+            if parent is None:
+                root = copy_obj
+            else:
+                parent.add_child(copy_obj)
+            stack.extend((child, copy_obj) for child in reversed(source.children))
+        return root
+
+    @property
+    def path(self) -> str:
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "/".join(reversed(parts))
+
+    @property
+    def active_in_hierarchy(self) -> bool:
+        node = self
+        while node is not None:
+            if not node.active:
+                return False
+            node = node.parent
+        return True
+
+def _index_level(objects: List[StandInObject], parent_path: Optional[str], reachable: bool) -> List[Tuple[StandInObject, str, bool]]:
+    names = set()
+    level = []
+    for obj in objects:
+        first = reachable and "/" not in obj.name and obj.name not in names
+        names.add(obj.name)
+        level.append((obj, f"{parent_path}/{obj.name}" if parent_path is not None else obj.name, first))
+    return level
+
+def _matches_path(obj: StandInObject, path: str) -> bool:
+    """Как ScenePathIndex.Matches: имя объекта и имена всех предков в точности совпадают с сегментами пути"""
+    end = len(path)
+    node = obj
+    while node is not None:
+        start = end - len(node.name)
+        if start < 0 or not path.startswith(node.name, start, end):
+            return False
+        if node.parent is None:
+            return start == 0
+        if start == 0 or path[start - 1] != "/":
+            return False
+        end = start - 1
+        node = node.parent
+    return False
+
+class StandInScene:
+    """Сцена-заглушка в памяти с той же семантикой поиска объектов, что и в редакторе"""
+
+    def __init__(self, name: str = "SampleScene", path: str = "Assets/Scenes/SampleScene.unity"):
+        self.name = name
+        self.path = path
+        self.root_objects: List[StandInObject] = []
+        # Аналог ScenePathIndex: путь -> объект и instanceId -> путь, строятся при первом поиске по пути
+        self._objects_by_path: Optional[Dict[str, StandInObject]] = None
+        self._paths_by_id: Optional[Dict[int, str]] = None
+        self.build_scenes: List[Dict] = [{"path": path, "enabled": True, "guid": "0" * 32}]
+
+    def add_root(self, obj: StandInObject) -> StandInObject:
+        obj.parent = None
+        self.root_objects.append(obj)
+        return obj
+
+    def iter_objects(self) -> Iterator[StandInObject]:
+        """Обход всех объектов в порядке иерархии без рекурсии"""
+        stack = list(reversed(self.root_objects))
+        while stack:
+            obj = stack.pop()
+            yield obj
+            stack.extend(reversed(obj.children))
+
+    def hierarchy_changed(self) -> None:
+        """Аналог EditorApplication.hierarchyChanged: сбрасывает индекс путей"""
+        self._objects_by_path = None
+        self._paths_by_id = None
+
+    def find_by_path(self, path: str) -> Optional[StandInObject]:
+        """Аналог GameObjectUtilities.FindGameObjectByPath через ScenePathIndex: поиск в индексе, промах - обходом"""
+        if not path:
+            return None
+        if self._objects_by_path is None:
+            self._build_path_index()
+        obj = self._objects_by_path.get(path)
+        if obj is not None and _matches_path(obj, path):
+            return obj
+        # Новые объекты добавляются после существующих братьев, устареть может только промах
+        found = self.walk_path(path)
+        if found is not obj:
+            self.hierarchy_changed()
+        return found
+
+    def path_of(self, obj: StandInObject) -> str:
+        """Аналог GameObjectUtilities.GetPath: из построенного индекса, иначе подъемом по родителям"""
+        path = self._paths_by_id.get(obj.instance_id) if self._paths_by_id is not None else None
+        return path if path is not None and _matches_path(obj, path) else obj.path
+
+    def walk_path(self, path: str) -> Optional[StandInObject]:
+        """Поиск без индекса: корень по имени, затем transform.Find"""
+        parts = path.split("/")
+        current = next((o for o in self.root_objects if o.name == parts[0]), None)
+        for part in parts[1:]:
+            if current is None:
+                return None
+            current = next((c for c in current.children if c.name == part), None)
+        return current
+
+    def _build_path_index(self) -> None:
+        """Один обход сцены; по пути доступен только первый из одноименных братьев, как у transform.Find"""
+        by_path: Dict[str, StandInObject] = {}
+        by_id: Dict[int, str] = {}
+        stack = list(reversed(_index_level(self.root_objects, None, True)))
+        while stack:
+            obj, path, reachable = stack.pop()
+            by_id[obj.instance_id] = path
+            if reachable:
+                by_path[path] = obj
+            stack.extend(reversed(_index_level(obj.children, path, reachable)))
+        self._objects_by_path = by_path
+        self._paths_by_id = by_id
+
+    def find_by_instance_id(self, instance_id: int) -> Optional[StandInObject]:
+        """Аналог EditorUtility.InstanceIDToObject для объектов сцены: O(1) по таблице и проверка, что объект не удален"""
+        obj = _objects_by_id.get(instance_id)
+        if obj is None:
+            return None
+        root = obj
+        while root.parent is not None:
+            root = root.parent
+        return obj if any(r is root for r in self.root_objects) else None
+
+    def resolve(self, path: Optional[str], instance_id: Optional[int] = None) -> Tuple[Optional[StandInObject], Optional[str]]:
+        """Аналог GameObjectUtilities.ResolveGameObject: по instanceId, если он задан, иначе по пути; (объект, ошибка)"""
+        if instance_id is not None:
+            obj = self.find_by_instance_id(instance_id)
+            if obj is not None:
+                return obj, None
+            suffix = f" (last known path: {path})" if path else ""
+            return None, f"{STALE_HANDLE_ERROR}: {instance_id}{suffix}"
+        obj = self.find_by_path(path) if path else None
+        return obj, None if obj is not None else "Object not found"
+
+    def iter_from(self, start: Optional[StandInObject] = None) -> Iterator[Tuple[StandInObject, str]]:
+        """Обход (объект, путь) в порядке иерархии с объекта start, как при продолжении поиска по курсору"""
+        stack: List[Tuple[StandInObject, str]] = []
+        if start is None:
+            stack.extend((obj, "") for obj in reversed(self.root_objects))
+        else:
+            # Стек восстанавливается по цепочке предков: оставшиеся братья каждого уровня, затем сам объект
+            chain = []
+            node = start
+            while node is not None:
+                chain.append(node)
+                node = node.parent
+            parent_path = ""
+            for node in reversed(chain):
+                siblings = node.parent.children if node.parent is not None else self.root_objects
+                position = next(i for i, sibling in enumerate(siblings) if sibling is node)
+                stack.extend((sibling, parent_path) for sibling in reversed(siblings[position + 1:]))
+                if node is start:
+                    stack.append((start, parent_path))
+                parent_path = f"{parent_path}/{node.name}" if parent_path else node.name
+
+        while stack:
+            obj, parent_path = stack.pop()
+            path = f"{parent_path}/{obj.name}" if parent_path else obj.name
+            yield obj, path
+            stack.extend((child, path) for child in reversed(obj.children))
+
+    def remove(self, obj: StandInObject) -> None:
+        siblings = obj.parent.children if obj.parent is not None else self.root_objects
+        siblings.remove(obj)
+        obj.parent = None
+        # В редакторе уничтоженный объект отличим от живого; здесь индекс сбрасывается сразу
+        self.hierarchy_changed()
+
+    def find_start(self, from_path: str) -> Optional[StandInObject]:
+        """Как GetHierarchyModule.FindStart: точный путь (первый в порядке обхода), иначе первый путь с подстрокой без учета регистра"""
+        obj = self.find_by_path(from_path)
+        if obj is not None:
+            return obj
+        needle = from_path.lower()
+        contains = None
+        stack = [(o, "") for o in reversed(self.root_objects)]
+        while stack:
+            obj, parent_path = stack.pop()
+            path = f"{parent_path}/{obj.name}" if parent_path else obj.name
+            if path == from_path:
+                return obj
+            if contains is None and needle in path.lower():
+                contains = obj
+            stack.extend((child, path) for child in reversed(obj.children))
+        return contains
+
+    def _projection_roots(self, from_path: Optional[str]) -> Tuple[List[StandInObject], str, bool, Optional[str]]:
+        """Начальные объекты проекции, путь и activeInHierarchy их родителя, найденный путь from_path"""
+        start = self.find_start(from_path) if from_path else None
+        if start is None:
+            return self.root_objects, "", True, None
+        parent = start.parent
+        return [start], self.path_of(parent) if parent is not None else "", parent is None or parent.active_in_hierarchy, self.path_of(start)
+
+    def _field_values(self, obj: StandInObject, active: bool) -> Dict:
+        # Заглушка не считает мировые координаты: position и rotation - локальные значения Transform
+        transform = obj.components.get("Transform", {})
+        return {
+            "instanceId": obj.instance_id,
+            "active": active,
+            "tag": obj.tag,
+            "layer": obj.layer,
+            "position": dict(transform.get("m_LocalPosition", {"x": 0.0, "y": 0.0, "z": 0.0})),
+            "rotation": dict(transform.get("m_LocalRotation", {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0})),
+            "scale": dict(transform.get("m_LocalScale", {"x": 1.0, "y": 1.0, "z": 1.0})),
+            "components": list(obj.components.keys())
+        }
+
+    def to_hierarchy(self, from_path: Optional[str] = None, max_depth: Optional[int] = None,
+                     fields: Optional[List[str]] = None) -> Dict:
+        """Иерархия в формате ответа GET /scene (с проекцией from_path, max_depth, fields как у редактора)"""
+        roots, base_path, base_active, found_path = self._projection_roots(from_path)
+        keys = fields or DEFAULT_FIELDS
+        root_nodes: List[Dict] = []
+        total = 0
+        # Путь и activeInHierarchy родителя передаются вниз, а не вычисляются заново от корня
+        stack = [(obj, root_nodes, base_path, base_active, 0) for obj in reversed(roots)]
+        while stack:
+            obj, siblings, parent_path, parent_active, depth = stack.pop()
+            path = f"{parent_path}/{obj.name}" if parent_path else obj.name
+            active = parent_active and obj.active
+            if keys is DEFAULT_FIELDS:
+                node = {
+                    "name": obj.name,
+                    "path": path,
+                    "instanceId": obj.instance_id,
+                    "active": active,
+                    "components": list(obj.components.keys())
+                }
+            else:
+                values = self._field_values(obj, active)
+                values["name"], values["path"] = obj.name, path
+                node = {key: values[key] for key in keys}
+            node["children"] = []
+            siblings.append(node)
+            total += 1
+            if max_depth is not None and depth >= max_depth:
+                if obj.children:
+                    node["childCount"] = len(obj.children)
+                continue
+            stack.extend((child, node["children"], path, active, depth + 1) for child in reversed(obj.children))
+
+        hierarchy = {
+            "sceneName": self.name,
+            "scenePath": self.path,
+            "rootObjects": root_nodes,
+            "totalObjects": total
+        }
+        return self._mark_projection(hierarchy, from_path, max_depth, fields, found_path)
+
+    def to_columnar(self, from_path: Optional[str] = None, max_depth: Optional[int] = None,
+                    fields: Optional[List[str]] = None) -> Dict:
+        """Иерархия в колоночном формате GET /scene?format=columnar (как GetHierarchyModule.WriteColumnar)"""
+        roots, base_path, base_active, found_path = self._projection_roots(from_path)
+        keys = fields or DEFAULT_FIELDS
+        strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = string_ids[value] = len(strings)
+                strings.append(value)
+            return string_id
+
+        names: List[int] = []
+        parents: List[int] = []
+        columns: Dict[str, List] = {key: [] for key in COLUMNAR_FIELDS if key in keys}
+        component_counts: List[int] = []
+        component_types: List[int] = []
+        child_counts: List[int] = []
+        stack = [(obj, -1, base_active, 0) for obj in reversed(roots)]
+        while stack:
+            obj, parent, parent_active, depth = stack.pop()
+            index = len(names)
+            active = parent_active and obj.active
+            names.append(intern(obj.name))
+            parents.append(parent)
+            if "instanceId" in columns:
+                columns["instanceId"].append(obj.instance_id)
+            if "active" in columns:
+                columns["active"].append(1 if active else 0)
+            if "tag" in columns:
+                columns["tag"].append(intern(obj.tag))
+            if "layer" in columns:
+                columns["layer"].append(obj.layer)
+            for key, axes in (("position", "xyz"), ("rotation", "xyzw"), ("scale", "xyz")):
+                if key in columns:
+                    columns[key].extend(self._field_values(obj, active)[key][axis] for axis in axes)
+            if "components" in keys:
+                component_counts.append(len(obj.components))
+                component_types.extend(intern(component_type) for component_type in obj.components)
+            child_counts.append(len(obj.children))
+            if max_depth is None or depth < max_depth:
+                stack.extend((child, index, active, depth + 1) for child in reversed(obj.children))
+
+        columnar: Dict = {
+            "format": "columnar",
+            "sceneName": self.name,
+            "scenePath": self.path,
+            "totalObjects": len(names),
+            "strings": strings,
+            "name": names,
+            "parent": parents
+        }
+        columnar.update(columns)
+        if "components" in keys:
+            columnar["componentCount"] = component_counts
+            columnar["componentTypes"] = component_types
+        if max_depth is not None:
+            columnar["childCount"] = child_counts
+        if fields is not None:
+            columnar["fields"] = fields
+        if base_path:
+            columnar["basePath"] = base_path
+        return self._mark_projection(columnar, from_path, max_depth, fields, found_path)
+
+    @staticmethod
+    def _mark_projection(response: Dict, from_path: Optional[str], max_depth: Optional[int],
+                         fields: Optional[List[str]], found_path: Optional[str]) -> Dict:
+        if found_path is not None:
+            response["fromPath"] = found_path
+        if from_path or max_depth is not None or fields is not None:
+            response["projected"] = True
+        return response
+
+    def components_of(self, obj: StandInObject, component_types: Optional[List[str]] = None,
+                      properties: Optional[List[str]] = None) -> Dict:
+        """Компоненты объекта; как ComponentSelection - только указанные типы и пути свойств (через точку, как FindProperty)"""
+        components = {}
+        for component_type, values in obj.components.items():
+            if component_types is not None and component_type not in component_types:
+                continue
+            if properties is None:
+                components[component_type] = copy.deepcopy(values)
+                continue
+            selected = {}
+            for path in properties:
+                value = values
+                for part in path.split("."):
+                    value = value.get(part, _MISSING) if isinstance(value, dict) else _MISSING
+                if value is not _MISSING:
+                    selected[path] = copy.deepcopy(value)
+            components[component_type] = selected
+        return components
+
+    @classmethod
+    def chain(cls, depth: int, name: str = "Node") -> "StandInScene":
+        """Сцена из одной цепочки вложенных объектов заданной глубины (для проверки обходов без рекурсии)"""
+        scene = cls("ChainScene", "Assets/Scenes/ChainScene.unity")
+        node = scene.add_root(StandInObject(name))
+        for _ in range(depth - 1):
+            node = node.add_child(StandInObject(name))
+        return scene
+
+    @classmethod
+    def sample(cls) -> "StandInScene":
+        """Небольшая сцена, похожая на SampleScene платформера"""
+        scene = cls()
+        scene.add_root(StandInObject("Main Camera", ["Camera", "AudioListener", "CinemachineBrain"], tag="MainCamera"))
+        scene.add_root(StandInObject("CM vcam1", ["CinemachineVirtualCamera"]))
+        scene.add_root(StandInObject("GameController", ["GameController", "MetaGameController"]))
+        player = scene.add_root(StandInObject("Player", ["SpriteRenderer", "Animator", "Rigidbody2D", "CapsuleCollider2D", "PlayerController", "AudioSource"], tag="Player"))
+        player.add_child(StandInObject("Health", ["Health"]))
+        enemies = scene.add_root(StandInObject("Enemies"))
+        for i in range(3):
+            enemy = enemies.add_child(StandInObject("Enemy" if i == 0 else f"Enemy ({i})", ["SpriteRenderer", "Animator", "Rigidbody2D", "BoxCollider2D", "EnemyController", "AudioSource"]))
+            enemy.add_child(StandInObject("Health", ["Health"]))
+        tokens = scene.add_root(StandInObject("Tokens", ["TokenController"]))
+        for i in range(5):
+            tokens.add_child(StandInObject(f"Token ({i})" if i else "Token", ["SpriteRenderer", "CircleCollider2D", "TokenInstance"]))
+        level = scene.add_root(StandInObject("Level"))
+        level.add_child(StandInObject("Grid", ["Grid"])).add_child(StandInObject("Tilemap", ["Tilemap", "TilemapRenderer", "TilemapCollider2D"]))
+        scene.add_root(StandInObject("SpawnPoint"))
+        scene.add_root(StandInObject("Victory Zone", ["BoxCollider2D", "VictoryZone"]))
+        return scene
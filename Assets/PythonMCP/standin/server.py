@@ -0,0 +1,173 @@
+import argparse
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+from .dispatcher import StandInDispatcher, request_priority
+from .handler import StandInRequest, StandInSceneAPIHandler, _dumps
+from .scene import StandInScene
+
+# Как в UnitySceneAPIServer: меньшие ответы не сжимаются
+MIN_COMPRESSED_LENGTH = 1024
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Разрешает ли Accept-Encoding ответ в gzip (q=0 - явный отказ)"""
+    for part in (accept_encoding or "").split(","):
+        coding, *parameters = [token.strip() for token in part.split(";")]
+        if coding.lower() not in ("gzip", "*"):
+            continue
+        refused = False
+        for parameter in parameters:
+            name, _, value = parameter.replace(" ", "").partition("=")
+            try:
+                refused = refused or (name == "q" and float(value) <= 0)
+            except ValueError:
+                pass
+        if not refused:
+            return True
+    return False
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Заголовки и тело уходят отдельными записями; без TCP_NODELAY каждый ответ ждет задержанного ACK (~40 мс)
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_PUT(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        # Тело и заголовки читаются в потоке соединения, как и в UnitySceneAPIServer
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        request = StandInRequest(
+            self.command,
+            url.path,
+            dict(parse_qsl(url.query, keep_blank_values=True)),
+            {k: v for k, v in self.headers.items()},
+            body
+        )
+
+        # Как в UnitySceneAPIServer: статистика отдается сразу, остальное ждет "главного потока" в очереди по приоритетам
+        if request.method == "GET" and request.path == "/stats":
+            response = _dumps(self.server.dispatcher.stats())
+        else:
+            response = self.server.dispatcher.run(lambda: self.server.api_handler.handle(request),
+                                                  request_priority(request))
+
+        payload = response.encode("utf-8") if response else b""
+        compressed = len(payload) >= MIN_COMPRESSED_LENGTH and accepts_gzip(self.headers.get("Accept-Encoding"))
+        if compressed:
+            payload = gzip.compress(payload, compresslevel=1)
+        self.send_response(request.status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        for name, value in request.response_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # Клиент прекратил чтение ответа (например, потоковый поиск нашел результат)
+            self.close_connection = True
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, api_handler: Any, dispatcher: StandInDispatcher, verbose: bool = False):
+        super().__init__(address, _RequestHandler)
+        self.api_handler = api_handler
+        self.dispatcher = dispatcher
+        self.verbose = verbose
+
+class StandInSceneAPIServer:
+    """HTTP-сервер заглушки Unity Scene API для работы клиента без редактора"""
+
+    def __init__(self, host: str = "localhost", port: int = 0,
+                 scene: Optional[StandInScene] = None, verbose: bool = False,
+                 api_handler: Optional[StandInSceneAPIHandler] = None):
+        self.api_handler = api_handler or StandInSceneAPIHandler(scene)
+        # Очередь обработчика, чтобы GET /stats внутри пакета видел ту же статистику; у записанных ответов ее нет
+        self.dispatcher: StandInDispatcher = getattr(self.api_handler, "dispatcher", None) or StandInDispatcher()
+        self._httpd = _HTTPServer((host, port), self.api_handler, self.dispatcher, verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._httpd.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def start(self) -> "StandInSceneAPIServer":
+        """Запускает сервер в фоновом потоке"""
+        self.dispatcher.start()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.dispatcher.stop()
+
+    def serve_forever(self) -> None:
+        self.dispatcher.start()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self.dispatcher.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Заглушка Unity Scene API")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--chain-depth", type=int, default=0,
+                        help="вместо SampleScene отдавать цепочку вложенных объектов заданной глубины")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="бюджет кадра главного потока в миллисекундах (как MainThreadDispatcher.BudgetMs)")
+    args = parser.parse_args()
+
+    scene = StandInScene.chain(args.chain_depth) if args.chain_depth > 0 else None
+    server = StandInSceneAPIServer(args.host, args.port, scene=scene, verbose=args.verbose)
+    if args.budget_ms is not None:
+        server.dispatcher.budget_ms = args.budget_ms
+    print(f"Stand-in Scene API server listening on http://{server.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
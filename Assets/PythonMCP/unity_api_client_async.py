@@ -0,0 +1,243 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from modules import (
+    GetHierarchyModule,
+    GetComponentsModule,
+    CreateObjectModule,
+    CreateObjectsModule,
+    DeleteObjectModule,
+    ModifyComponentModule,
+    SetTransformsModule,
+    AddComponentModule,
+    RemoveComponentModule,
+    FindObjectsModule,
+    SceneManagementModule,
+    StatsModule,
+    LoggingModule,
+    BatchModule,
+    CommandRouter,
+    AsyncHttpTransport,
+    AsyncHttpError
+)
+from modules.object_handle import ObjectTarget
+from modules.traffic_recorder import AsyncRecordingTransport, TrafficRecorder
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+class AsyncUnitySceneAPI:
+    """Асинхронный аналог UnitySceneAPI: те же действия и формат ответов execute_command,
+    но запросы выполняются неблокирующе и могут идти параллельно через asyncio.gather"""
+
+    def __init__(self, host: str = "localhost", port: int = 8080,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 transport: Optional[AsyncHttpTransport] = None, record_path: Optional[str] = None):
+        self.base_url = f"http://{host}:{port}"
+        self.transport = transport or AsyncHttpTransport(self.base_url, pool_maxsize=max_concurrency)
+        # Режим записи: команды и HTTP-обмен дописываются в record_path для воспроизведения
+        self.recorder = TrafficRecorder(record_path) if record_path else None
+        if self.recorder is not None:
+            self.transport = AsyncRecordingTransport(self.transport, self.recorder)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Модули используются только для описания запросов и разбора ответов,
+        # сетевой обмен выполняет асинхронный транспорт
+        self.hierarchy_module = GetHierarchyModule(self.base_url)
+        self.components_module = GetComponentsModule(self.base_url)
+        self.create_object_module = CreateObjectModule(self.base_url)
+        self.create_objects_module = CreateObjectsModule(self.base_url)
+        self.delete_object_module = DeleteObjectModule(self.base_url)
+        self.modify_component_module = ModifyComponentModule(self.base_url)
+        self.set_transforms_module = SetTransformsModule(self.base_url)
+        self.add_component_module = AddComponentModule(self.base_url)
+        self.remove_component_module = RemoveComponentModule(self.base_url)
+        self.find_objects_module = FindObjectsModule(self.base_url)
+        self.scene_management_module = SceneManagementModule(self.base_url)
+        self.stats_module = StatsModule(self.base_url)
+        self.batch_module = BatchModule(self.base_url)
+        self.logging_module = LoggingModule()
+        self.router = CommandRouter(self)
+        self._batch_supported: Optional[bool] = None
+
+    async def close(self) -> None:
+        """Закрывает соединения транспорта, дописывает журнал и запись трафика"""
+        await self.transport.close()
+        # Дописывает журнал и останавливает его фоновый поток (и снимает регистрацию в atexit)
+        self.logging_module.close()
+        if self.recorder is not None:
+            self.recorder.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def get_log_file_path(self) -> str:
+        """Получить путь к лог-файлу"""
+        return self.logging_module.get_log_file_path()
+
+    async def execute_command(self, command: Union[Dict, List[Dict]], stop_on_error: bool = True) -> Union[Dict, List[Dict]]:
+        """
+        Асинхронно выполняет структурированную команду и возвращает структурированный ответ
+        Формат запроса: {"action": "get_hierarchy|get_components|create_object|...", "params": {...}}
+        Список команд выполняется пакетом (см. execute_batch) и возвращает список ответов
+        """
+        if isinstance(command, list):
+            return await self.execute_batch(command, stop_on_error)
+
+        started = time.perf_counter()
+        result = await self._execute_single(command)
+        if self.recorder is not None:
+            self.recorder.record_command(command, result, started)
+        return result
+
+    async def _execute_single(self, command: Dict) -> Dict:
+        """Выполняет одну команду execute_command"""
+        action = command.get("action", "unknown")
+        try:
+            result = await self._send(command)
+            if self.router.needs_retry(result):
+                # Сервер без GET /objects/find: повтор идет через GET /scene
+                result = await self._send(command)
+
+            self.logging_module.log_structured(command, result)
+            return result
+
+        except Exception as e:
+            result = {"success": False, "action": action, "error": str(e)}
+            self.logging_module.log_structured(command, result)
+            return result
+
+    async def _send(self, command: Dict) -> Dict:
+        """Отправляет запрос команды через роутер и разбирает ответ"""
+        action = command.get("action", "unknown")
+        request, result = self.router.build_request(command)
+        if request is None:
+            return result
+        try:
+            async with self._semaphore:
+                response = await self.transport.request(**request)
+            response.raise_for_status()
+            return self.router.parse_response(command, response.json())
+        except AsyncHttpError as e:
+            return {"success": False, "action": action, "error": f"Request error: {str(e)}"}
+        except json.JSONDecodeError as e:
+            return {"success": False, "action": action, "error": f"JSON decode error: {str(e)}"}
+
+    async def execute_many(self, commands: Iterable[Dict]) -> List[Dict]:
+        """Выполняет команды конкурентно; результаты возвращаются в порядке команд"""
+        return await asyncio.gather(*(self.execute_command(c) for c in commands))
+
+    async def execute_batch(self, commands: List[Dict], stop_on_error: bool = True) -> List[Dict]:
+        """Выполняет список команд за один запрос POST /batch (или последовательно,
+        если сервер не поддерживает пакеты); ответы возвращаются в порядке команд"""
+        if not commands:
+            return []
+
+        started = time.perf_counter()
+        results = await self._execute_batch(commands, stop_on_error)
+        if self.recorder is not None:
+            self.recorder.record_command(commands, results, started)
+        return results
+
+    async def _execute_batch(self, commands: List[Dict], stop_on_error: bool) -> List[Dict]:
+        """Выполняет непустой список команд пакетом"""
+        if not await self._supports_batch():
+            results: List[Dict] = []
+            failed = False
+            for command in commands:
+                if failed and stop_on_error:
+                    result = self.batch_module.skipped_result(command)
+                    self.logging_module.log_structured(command, result)
+                else:
+                    result = await self._execute_single(command)
+                    failed = failed or self.batch_module.is_failure(result)
+                results.append(result)
+            return results
+
+        entries, indices, results = self.batch_module.prepare(commands, self.router, stop_on_error)
+        batch_result = {"success": True, "data": {"results": []}}
+        if entries:
+            try:
+                async with self._semaphore:
+                    response = await self.transport.request(**self.batch_module.build_request(entries, stop_on_error))
+                response.raise_for_status()
+                batch_result = self.batch_module.parse_response(response.json())
+            except AsyncHttpError as e:
+                batch_result = {"success": False, "action": "batch", "error": f"Request error: {str(e)}"}
+            except json.JSONDecodeError as e:
+                batch_result = {"success": False, "action": "batch", "error": f"JSON decode error: {str(e)}"}
+        results = self.batch_module.merge(commands, self.router, indices, results, batch_result, stop_on_error)
+
+        for command, result in zip(commands, results):
+            self.logging_module.log_structured(command, result)
+        return results
+
+    async def _supports_batch(self) -> bool:
+        if self._batch_supported is None:
+            try:
+                response = await self.transport.request(**self.batch_module.build_capabilities_request())
+                response.raise_for_status()
+                self._batch_supported = self.batch_module.parse_capabilities(response.json())
+            except AsyncHttpError:
+                return False
+            except json.JSONDecodeError:
+                self._batch_supported = False
+        return self._batch_supported
+
+    # Удобные корутины для отдельных действий
+    async def get_hierarchy(self, params: Optional[Dict] = None) -> Dict:
+        return await self.execute_command({"action": "get_hierarchy", "params": params or {}})
+
+    async def get_components(self, object_path: ObjectTarget, component_types: Optional[List[str]] = None,
+                             properties: Optional[List[str]] = None) -> Dict:
+        params = {"object_path": object_path, "component_types": component_types, "properties": properties}
+        return await self.execute_command({"action": "get_components", "params": params})
+
+    async def create_objects(self, specs: List[Dict]) -> Dict:
+        return await self.execute_command({"action": "create_objects", "params": {"objects": specs}})
+
+    async def set_transforms(self, targets: Any, positions: Any = None, rotations: Any = None,
+                             scales: Any = None, space: str = "world") -> Dict:
+        params = {"targets": targets, "positions": positions, "rotations": rotations, "scales": scales, "space": space}
+        return await self.execute_command({"action": "set_transforms", "params": params})
+
+    async def get_stats(self) -> Dict:
+        return await self.execute_command({"action": "get_stats", "params": {}})
+
+    async def find_objects(self, name: Optional[str] = None, limit: Optional[int] = None, tag: Optional[str] = None,
+                           layer: Any = None, active: Any = None, components: Any = None, match: Optional[str] = None,
+                           cursor: Optional[str] = None, page_size: Optional[int] = None) -> Dict:
+        params = {"name": name, "limit": limit, "tag": tag, "layer": layer, "active": active,
+                  "components": components, "match": match, "cursor": cursor, "page_size": page_size}
+        return await self.execute_command({"action": "find_objects", "params": {
+            key: value for key, value in params.items() if value is not None
+        }})
+
+    async def create_object(self, name: str = "GameObject", parent_path: ObjectTarget = "") -> Dict:
+        return await self.execute_command({"action": "create_object", "params": {"name": name, "parent_path": parent_path}})
+
+    async def delete_object(self, object_path: ObjectTarget) -> Dict:
+        return await self.execute_command({"action": "delete_object", "params": {"object_path": object_path}})
+
+    async def modify_component(self, object_path: ObjectTarget, component_type: str, properties: Dict[str, Any]) -> Dict:
+        return await self.execute_command({"action": "modify_component", "params": {
+            "object_path": object_path, "component_type": component_type, "properties": properties
+        }})
+
+async def main():
+    async with AsyncUnitySceneAPI() as unity:
+        results = await asyncio.gather(
+            unity.get_hierarchy(),
+            unity.get_components("Main Camera"),
+            unity.find_objects("Camera"),
+            unity.execute_command({"action": "get_build_scenes"})
+        )
+        for result in results:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,108 +1,260 @@
 import json
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 
 from modules import (
     GetHierarchyModule,
     GetComponentsModule,
     CreateObjectModule,
+    CreateObjectsModule,
     DeleteObjectModule,
     ModifyComponentModule,
+    SetTransformsModule,
     AddComponentModule,
     RemoveComponentModule,
     FindObjectsModule,
     SceneManagementModule,
-    LoggingModule
+    StatsModule,
+    LoggingModule,
+    BatchModule,
+    CommandRouter,
+    HttpTransport,
+    HierarchyCache,
+    SceneMirror
 )
+from modules.fan_out import DEFAULT_FAN_OUT_WORKERS, fan_out, iter_fan_out
+from modules.hierarchy_cache import DEFAULT_HIERARCHY_TTL, invalidates_hierarchy
+from modules.object_handle import ObjectTarget
+from modules.scene_node import SceneTree
+from modules.scene_stream import DEFAULT_STREAM_CHUNK_SIZE, SceneNodeStream
+from modules.single_flight import READ_ACTIONS, SingleFlight, flight_key
+from modules.traffic_recorder import RecordingTransport, TrafficRecorder
 
 class UnitySceneAPI:
-    def __init__(self, host: str = "localhost", port: int = 8080):
+    """Синхронный клиент Unity Scene API
+
+    Потокобезопасен: один экземпляр можно вызывать из многих потоков. Соединения берутся из общего пула
+    транспорта, кэш иерархии, копия сцены, индексы и журнал защищены своими блокировками, одинаковые
+    одновременные чтения объединяются в один запрос. Для параллельного опроса многих объектов
+    есть execute_many и get_components_many.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 8080, transport: Optional[HttpTransport] = None,
+                 hierarchy_cache_ttl: float = DEFAULT_HIERARCHY_TTL, record_path: Optional[str] = None,
+                 use_mirror: bool = True):
         self.base_url = f"http://{host}:{port}"
         
+        # Один транспорт (keep-alive сессия с пулом соединений) на все модули
+        self.transport = transport or HttpTransport(self.base_url)
+        
+        # Режим записи: команды и HTTP-обмен дописываются в record_path для воспроизведения
+        self.recorder = TrafficRecorder(record_path) if record_path else None
+        if self.recorder is not None:
+            self.transport = RecordingTransport(self.transport, self.recorder)
+        
+        # Общий снимок иерархии для get_hierarchy и find_objects (ttl <= 0 отключает кэш)
+        self.hierarchy_cache = HierarchyCache(hierarchy_cache_ttl)
+        
+        # Локальная копия сцены по ленте GET /scene/changes; без поддержки сервером используется кэш
+        self.scene_mirror = SceneMirror(self.transport) if use_mirror else None
+        
+        # Одинаковые одновременные команды чтения из разных потоков выполняются одним запросом
+        self.single_flight = SingleFlight()
+        
         # Инициализация модулей
-        self.hierarchy_module = GetHierarchyModule(self.base_url)
-        self.components_module = GetComponentsModule(self.base_url)
-        self.create_object_module = CreateObjectModule(self.base_url)
-        self.delete_object_module = DeleteObjectModule(self.base_url)
-        self.modify_component_module = ModifyComponentModule(self.base_url)
-        self.add_component_module = AddComponentModule(self.base_url)
-        self.remove_component_module = RemoveComponentModule(self.base_url)
-        self.find_objects_module = FindObjectsModule(self.base_url)
-        self.scene_management_module = SceneManagementModule(self.base_url)
+        self.hierarchy_module = GetHierarchyModule(self.base_url, self.transport, self.hierarchy_cache, self.scene_mirror)
+        self.components_module = GetComponentsModule(self.base_url, self.transport)
+        self.create_object_module = CreateObjectModule(self.base_url, self.transport)
+        self.create_objects_module = CreateObjectsModule(self.base_url, self.transport)
+        self.delete_object_module = DeleteObjectModule(self.base_url, self.transport)
+        self.modify_component_module = ModifyComponentModule(self.base_url, self.transport)
+        self.set_transforms_module = SetTransformsModule(self.base_url, self.transport)
+        self.add_component_module = AddComponentModule(self.base_url, self.transport)
+        self.remove_component_module = RemoveComponentModule(self.base_url, self.transport)
+        self.find_objects_module = FindObjectsModule(self.base_url, self.transport, self.hierarchy_cache, self.scene_mirror)
+        self.scene_management_module = SceneManagementModule(self.base_url, self.transport)
+        self.stats_module = StatsModule(self.base_url, self.transport)
+        self.batch_module = BatchModule(self.base_url, self.transport)
         self.logging_module = LoggingModule()
+        self.router = CommandRouter(self)
+    
+    def invalidate_hierarchy_cache(self) -> None:
+        """Сбрасывает закэшированный снимок иерархии (например, после изменений сцены вручную в редакторе)"""
+        self.hierarchy_cache.invalidate()
+    
+    def close(self) -> None:
+        """Закрывает соединения общего транспорта, дописывает журнал и запись трафика"""
+        self.transport.close()
+        # Дописывает журнал и останавливает его фоновый поток (и снимает регистрацию в atexit)
+        self.logging_module.close()
+        if self.recorder is not None:
+            self.recorder.close()
+    
+    def _coalesced(self, action: str, params: Optional[Dict], func) -> Dict:
+        """Выполняет команду чтения или ждет результат такой же уже идущей команды"""
+        return self.single_flight.do(flight_key(action, params), func)
+    
+    def _scene_changed(self, hierarchy: bool = True) -> None:
+        """После изменяющей команды: сбрасывает снимок иерархии и отвязывает новые чтения от уже идущих"""
+        if hierarchy:
+            self.hierarchy_cache.invalidate()
+        self.single_flight.forget()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     # Методы для обратной совместимости
     def get_scene_hierarchy(self) -> Optional[Dict]:
         """Получает иерархию сцены"""
-        result = self.hierarchy_module.execute()
+        result = self._coalesced("get_hierarchy", None, self.hierarchy_module.execute)
         return result.get("data") if result.get("success") else {"error": result.get("error")}
     
-    def get_object_components(self, object_path: str) -> Optional[Dict]:
-        """Получает компоненты объекта"""
-        result = self.components_module.execute(object_path)
+    def get_object_components(self, object_path: ObjectTarget, component_types: Optional[List[str]] = None,
+                              properties: Optional[List[str]] = None) -> Optional[Dict]:
+        """Получает компоненты объекта (только указанные типы и свойства, если заданы)"""
+        params = {"object_path": object_path, "component_types": component_types, "properties": properties}
+        result = self._coalesced("get_components", params,
+                                 lambda: self.components_module.execute(object_path, component_types, properties))
         return result.get("data", {}).get("components") if result.get("success") else {"error": result.get("error")}
     
-    def create_object(self, name: str = "GameObject", parent_path: str = "") -> Dict:
+    def get_components_many(self, object_paths: Iterable[ObjectTarget], component_types: Optional[List[str]] = None,
+                            properties: Optional[List[str]] = None,
+                            max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> List[Dict]:
+        """Компоненты многих объектов параллельными запросами; ответы execute_command в порядке объектов"""
+        return self.execute_many(self._components_commands(object_paths, component_types, properties), max_workers)
+    
+    def iter_components_many(self, object_paths: Iterable[ObjectTarget], component_types: Optional[List[str]] = None,
+                             properties: Optional[List[str]] = None,
+                             max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> Iterator[Tuple[ObjectTarget, Dict]]:
+        """Как get_components_many, но отдает (объект, ответ) по мере готовности"""
+        object_paths = list(object_paths)
+        commands = self._components_commands(object_paths, component_types, properties)
+        for index, result in self.iter_execute_many(commands, max_workers):
+            yield object_paths[index], result
+    
+    @staticmethod
+    def _components_commands(object_paths: Iterable[ObjectTarget], component_types: Optional[List[str]],
+                             properties: Optional[List[str]]) -> List[Dict]:
+        return [{"action": "get_components", "params": {
+            "object_path": object_path, "component_types": component_types, "properties": properties
+        }} for object_path in object_paths]
+    
+    def create_object(self, name: str = "GameObject", parent_path: ObjectTarget = "") -> Dict:
         """Создает новый объект"""
         result = self.create_object_module.execute(name, parent_path)
+        self._scene_changed()
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
-    def delete_object(self, object_path: str) -> Dict:
+    def create_objects(self, specs: List[Dict]) -> Dict:
+        """Создает много объектов (в том числе экземпляры префабов) одним запросом"""
+        result = self.create_objects_module.execute(specs)
+        self._scene_changed()
+        return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
+    
+    def delete_object(self, object_path: ObjectTarget) -> Dict:
         """Удаляет объект"""
         result = self.delete_object_module.execute(object_path)
+        self._scene_changed()
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
-    def modify_component(self, object_path: str, component_type: str, properties: Dict[str, Any]) -> Dict:
+    def modify_component(self, object_path: ObjectTarget, component_type: str, properties: Dict[str, Any]) -> Dict:
         """Модифицирует компонент"""
         result = self.modify_component_module.execute(object_path, component_type, properties)
+        self._scene_changed(invalidates_hierarchy("modify_component", {"component_type": component_type}))
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
-    def add_component(self, object_path: str, component_type: str) -> Dict:
+    def add_component(self, object_path: ObjectTarget, component_type: str) -> Dict:
         """Добавляет компонент"""
         result = self.add_component_module.execute(object_path, component_type)
+        self._scene_changed()
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
-    def remove_component(self, object_path: str, component_type: str) -> Dict:
+    def remove_component(self, object_path: ObjectTarget, component_type: str) -> Dict:
         """Удаляет компонент"""
         result = self.remove_component_module.execute(object_path, component_type)
+        self._scene_changed()
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
     def find_objects_by_name(self, name: str) -> Dict:
         """Находит объекты по имени"""
-        result = self.find_objects_module.execute(name)
+        result = self._coalesced("find_objects", {"name": name}, lambda: self.find_objects_module.execute(name))
         return result.get("data") if result.get("success") else {"error": result.get("error")}
     
+    def iter_scene_nodes(self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> SceneNodeStream:
+        """Потоково обходит иерархию сцены: узлы с path и depth без загрузки всего ответа в память
+        
+        for node in api.iter_scene_nodes(): ...  (выход из цикла прекращает чтение ответа)
+        """
+        return self.hierarchy_module.iter_nodes(chunk_size)
+    
+    def scene_tree(self, prefetch: bool = True) -> SceneTree:
+        """
+        Ленивое дерево объектов сцены: дети загружаются при первом обращении, следующий уровень - в фоне
+        with api.scene_tree() as tree: tree.find("Enemies").children
+        """
+        return SceneTree(self.hierarchy_module, prefetch)
+    
     def open_scene(self, scene_path: str) -> Dict:
         """Открывает сцену"""
         result = self.scene_management_module.open_scene(scene_path)
+        self._scene_changed()
+        return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
+    
+    def get_stats(self) -> Optional[Dict]:
+        """Статистика очереди главного потока редактора: глубина, время ожидания и выполнения"""
+        result = self.stats_module.execute()
+        return result.get("data") if result.get("success") else {"error": result.get("error")}
+    
+    def wait_for_capacity(self, max_queue_depth: int = 0, timeout: float = 10.0) -> Dict:
+        """Ждет разгрузки очереди редактора перед отправкой новой порции тяжелых запросов"""
+        result = self.stats_module.wait_for_capacity(max_queue_depth, timeout)
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
     def get_build_scenes(self) -> Optional[Dict]:
         """Получает список сцен в билде"""
-        result = self.scene_management_module.get_build_scenes()
+        result = self._coalesced("get_build_scenes", None, self.scene_management_module.get_build_scenes)
         return result.get("data") if result.get("success") else {"error": result.get("error")}
     
     def add_scene_to_build(self, scene_path: str) -> Dict:
         """Добавляет сцену в билд"""
         result = self.scene_management_module.add_scene_to_build(scene_path)
+        self._scene_changed(hierarchy=False)
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
     def remove_scene_from_build(self, scene_path: str) -> Dict:
         """Удаляет сцену из билда"""
         result = self.scene_management_module.remove_scene_from_build(scene_path)
+        self._scene_changed(hierarchy=False)
         return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
     # Вспомогательные методы для трансформации
-    def move_object(self, object_path: str, x: float, y: float, z: float) -> Dict:
+    def move_object(self, object_path: ObjectTarget, x: float, y: float, z: float) -> Dict:
         """Перемещает объект"""
-        return self.modify_component_module.move_object(object_path, x, y, z)
+        result = self.modify_component_module.move_object(object_path, x, y, z)
+        self._scene_changed()
+        return result
     
-    def rotate_object(self, object_path: str, x: float, y: float, z: float, w: float) -> Dict:
+    def rotate_object(self, object_path: ObjectTarget, x: float, y: float, z: float, w: float) -> Dict:
         """Поворачивает объект"""
-        return self.modify_component_module.rotate_object(object_path, x, y, z, w)
+        result = self.modify_component_module.rotate_object(object_path, x, y, z, w)
+        self._scene_changed()
+        return result
     
-    def scale_object(self, object_path: str, x: float, y: float, z: float) -> Dict:
+    def scale_object(self, object_path: ObjectTarget, x: float, y: float, z: float) -> Dict:
         """Масштабирует объект"""
-        return self.modify_component_module.scale_object(object_path, x, y, z)
+        result = self.modify_component_module.scale_object(object_path, x, y, z)
+        self._scene_changed()
+        return result
+    
+    def set_transforms(self, targets: Any, positions: Any = None, rotations: Any = None,
+                       scales: Any = None, space: str = "world") -> Dict:
+        """Задает трансформации многих объектов одним запросом (массивы NumPy (n, 3) / (n, 4) или списки)"""
+        result = self.set_transforms_module.execute(targets, positions, rotations, scales, space)
+        self._scene_changed()
+        return result.get("data") if result.get("success") else {"success": False, "error": result.get("error")}
     
     # JSON-focused getters для совместимости с инструментами
     def get_hierarchy_json(self) -> Optional[Dict]:
@@ -111,7 +263,7 @@ class UnitySceneAPI:
     def get_build_scenes_json(self) -> Optional[Dict]:
         return self.get_build_scenes()
     
-    def get_object_info_json(self, object_path: str) -> Optional[Dict]:
+    def get_object_info_json(self, object_path: ObjectTarget) -> Optional[Dict]:
         return self.get_object_components(object_path)
     
     # Методы логирования
@@ -120,11 +272,36 @@ class UnitySceneAPI:
         return self.logging_module.get_log_file_path()
     
     # Структурированные JSON методы
-    def execute_command(self, command: Dict) -> Dict:
+    def execute_command(self, command: Union[Dict, List[Dict]], stop_on_error: bool = True) -> Union[Dict, List[Dict]]:
         """
         Выполняет структурированную команду и возвращает структурированный ответ
         Формат запроса: {"action": "get_hierarchy|get_components|create_object|...", "params": {...}}
+        Список команд выполняется пакетом (см. execute_batch) и возвращает список ответов
+        """
+        if isinstance(command, list):
+            return self.execute_batch(command, stop_on_error)
+        
+        started = time.perf_counter()
+        result = self._execute_single(command)
+        if self.recorder is not None:
+            self.recorder.record_command(command, result, started)
+        return result
+    
+    def execute_many(self, commands: Iterable[Dict], max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> List[Dict]:
+        """
+        Выполняет независимые команды параллельно в пуле потоков, ответы возвращаются в порядке команд.
+        В отличие от execute_batch, каждая команда - отдельный запрос, и порядок их выполнения не определен,
+        поэтому команды не должны зависеть друг от друга.
         """
+        return fan_out(self.execute_command, commands, max_workers)
+    
+    def iter_execute_many(self, commands: Iterable[Dict],
+                          max_workers: int = DEFAULT_FAN_OUT_WORKERS) -> Iterator[Tuple[int, Dict]]:
+        """Как execute_many, но отдает (индекс команды, ответ) по мере готовности; выход из цикла отменяет оставшиеся"""
+        return iter_fan_out(self.execute_command, commands, max_workers)
+    
+    def _execute_single(self, command: Dict) -> Dict:
+        """Выполняет одну команду execute_command"""
         try:
             action = command.get("action")
             params = command.get("params", {})
@@ -132,17 +309,21 @@ class UnitySceneAPI:
             result = None
             
             if action == "get_hierarchy":
-                result = self.hierarchy_module.execute(params)
+                result = self._coalesced(action, params, lambda: self.hierarchy_module.execute(params))
             elif action == "get_components":
                 object_path = params.get("object_path")
                 if not object_path:
                     result = {"success": False, "action": action, "error": "object_path is required"}
                 else:
-                    result = self.components_module.execute(object_path)
+                    result = self._coalesced(action, params, lambda: self.components_module.execute(
+                        object_path, params.get("component_types"), params.get("properties"),
+                        params.get("depth"), params.get("max_array")))
             elif action == "create_object":
                 name = params.get("name", "GameObject")
                 parent_path = params.get("parent_path", "")
                 result = self.create_object_module.execute(name, parent_path)
+            elif action == "create_objects":
+                result = self.create_objects_module.execute(params.get("objects"))
             elif action == "delete_object":
                 object_path = params.get("object_path")
                 if not object_path:
@@ -158,6 +339,10 @@ class UnitySceneAPI:
                     result = {"success": False, "action": action, "error": "object_path and component_type are required"}
                 else:
                     result = self.modify_component_module.execute(object_path, component_type, properties)
+            elif action == "set_transforms":
+                result = self.set_transforms_module.execute(
+                    params.get("targets"), params.get("positions"), params.get("rotations"),
+                    params.get("scales"), params.get("space", "world"))
             elif action == "add_component":
                 object_path = params.get("object_path")
                 component_type = params.get("component_type")
@@ -175,11 +360,13 @@ class UnitySceneAPI:
                 else:
                     result = self.remove_component_module.execute(object_path, component_type)
             elif action == "find_objects":
-                name = params.get("name")
-                if not name:
-                    result = {"success": False, "action": action, "error": "name is required"}
-                else:
-                    result = self.find_objects_module.execute(name)
+                result = self._coalesced(action, params, lambda: self.find_objects_module.execute(
+                    params.get("name"), params.get("stream", False), params.get("limit"),
+                    tag=params.get("tag"), layer=params.get("layer"), active=params.get("active"),
+                    components=params.get("components"), match=params.get("match"),
+                    cursor=params.get("cursor"), page_size=params.get("page_size")))
+            elif action == "get_stats":
+                result = self.stats_module.execute()
             elif action == "open_scene":
                 scene_path = params.get("scene_path")
                 if not scene_path:
@@ -187,7 +374,7 @@ class UnitySceneAPI:
                 else:
                     result = self.scene_management_module.open_scene(scene_path)
             elif action == "get_build_scenes":
-                result = self.scene_management_module.get_build_scenes()
+                result = self._coalesced(action, params, self.scene_management_module.get_build_scenes)
             elif action == "add_scene_to_build":
                 scene_path = params.get("scene_path")
                 if not scene_path:
@@ -203,15 +390,69 @@ class UnitySceneAPI:
             else:
                 result = {"success": False, "action": action, "error": f"Unknown action: {action}"}
             
+            # Изменяющие команды сбрасывают снимок иерархии, даже если завершились ошибкой
+            if action not in READ_ACTIONS:
+                self._scene_changed(invalidates_hierarchy(action, params))
+            
             # Логируем запрос и ответ
             self.logging_module.log_structured(command, result)
             return result
                 
         except Exception as e:
+            if command.get("action") not in READ_ACTIONS:
+                self._scene_changed(invalidates_hierarchy(command.get("action"), command.get("params")))
             result = {"success": False, "action": command.get("action", "unknown"), "error": str(e)}
             self.logging_module.log_structured(command, result)
             return result
 
+    def execute_batch(self, commands: List[Dict], stop_on_error: bool = True) -> List[Dict]:
+        """
+        Выполняет список команд за один запрос POST /batch, ответы возвращаются в порядке команд.
+        При stop_on_error=True команды после первой ошибки не выполняются.
+        Если сервер не поддерживает пакеты, команды выполняются последовательно.
+        """
+        if not commands:
+            return []
+        
+        started = time.perf_counter()
+        results = self._execute_batch(commands, stop_on_error)
+        if self.recorder is not None:
+            self.recorder.record_command(commands, results, started)
+        return results
+    
+    def _execute_batch(self, commands: List[Dict], stop_on_error: bool) -> List[Dict]:
+        """Выполняет непустой список команд пакетом"""
+        if not self.batch_module.supports_batch():
+            return self._execute_sequential(commands, stop_on_error)
+        
+        entries, indices, results = self.batch_module.prepare(commands, self.router, stop_on_error)
+        batch_result = {"success": True, "data": {"results": []}}
+        if entries:
+            batch_result = self.batch_module.execute(entries, stop_on_error)
+        results = self.batch_module.merge(commands, self.router, indices, results, batch_result, stop_on_error)
+        
+        if any(c.get("action") not in READ_ACTIONS for c in commands if isinstance(c, dict)):
+            self._scene_changed(any(invalidates_hierarchy(c.get("action"), c.get("params"))
+                                    for c in commands if isinstance(c, dict)))
+        
+        for command, result in zip(commands, results):
+            self.logging_module.log_structured(command, result)
+        return results
+    
+    def _execute_sequential(self, commands: List[Dict], stop_on_error: bool) -> List[Dict]:
+        """Поочередное выполнение команд для серверов без поддержки /batch"""
+        results: List[Dict] = []
+        failed = False
+        for command in commands:
+            if failed and stop_on_error:
+                result = self.batch_module.skipped_result(command)
+                self.logging_module.log_structured(command, result)
+            else:
+                result = self._execute_single(command)
+                failed = failed or self.batch_module.is_failure(result)
+            results.append(result)
+        return results
+
 def wait_for_enter(message: str = "Нажмите Enter для продолжения..."):
     """Ожидает нажатия Enter с настраиваемым сообщением"""
     input(message)